@@ -0,0 +1,103 @@
+"""
+Compara as alocações por partida criando um tabuleiro novo (Board.create)
+e reaproveitando o mesmo tabuleiro (Board.reset, REUSE_BOARDS=1).
+
+Para cada modo são medidos:
+
+- blocos: variação de sys.getallocatedblocks() no preparo da partida, com o
+  tabuleiro anterior ainda vivo (o que o preparo aloca e não libera; com
+  reset é negativo, os saldos da partida anterior são liberados);
+- pico: pico de memória (tracemalloc) durante a partida, preparo incluído;
+- gc: coletas da geração 0 do coletor de ciclos a cada 1000 partidas;
+- tempo do preparo e da partida completa, sem o tracemalloc.
+
+    PYTHONPATH=src python benchmarks/bench_allocations.py --matches 2000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from monopoly.domain.board import Board
+from monopoly.domain.random_source import RandomSource
+
+MODES = ("create", "reset")
+
+
+def setup(mode: str, board: Board, rng: RandomSource) -> Board:
+    if mode == "create" or board is None:
+        return Board.create(rng=rng)
+    return board.reset(rng=rng)
+
+
+def allocations(mode: str, matches: int) -> dict:
+    rng = RandomSource(seed=1)
+    board = setup(mode, None, rng)
+    board.match()
+    blocks, peak = 0, 0
+
+    gc.collect()
+    collections = gc.get_stats()[0]["collections"]
+    tracemalloc.start()
+    for _ in range(matches):
+        before = sys.getallocatedblocks()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        # the previous board is alive until the assignment, as in Game.play
+        new = setup(mode, board, rng)
+        blocks += sys.getallocatedblocks() - before
+        board = new
+        board.match()
+        peak += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    collections = gc.get_stats()[0]["collections"] - collections
+
+    return {
+        "blocks": blocks / matches,
+        "peak_kb": peak / matches / 1024,
+        "gc_per_1000": collections * 1000 / matches,
+    }
+
+
+def timing(mode: str, matches: int, repeat: int) -> dict:
+    best_setup, best_match = float("inf"), float("inf")
+    for _ in range(repeat):
+        rng, board = RandomSource(seed=1), None
+        setup_seconds = 0.0
+        start = time.perf_counter()
+        for _ in range(matches):
+            started = time.perf_counter()
+            board = setup(mode, board, rng)
+            setup_seconds += time.perf_counter() - started
+            board.match()
+        best_match = min(best_match, (time.perf_counter() - start) / matches)
+        best_setup = min(best_setup, setup_seconds / matches)
+    return {"setup_us": best_setup * 1e6, "match_us": best_match * 1e6}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--matches", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'mode':<8} {'blocks':>8} {'peak KB':>8} {'gc/1000':>8} "
+        f"{'setup us':>9} {'match us':>9}"
+    )
+    for mode in MODES:
+        result = {
+            **allocations(mode, args.matches),
+            **timing(mode, args.matches, args.repeat),
+        }
+        print(
+            f"{mode:<8} {result['blocks']:8.1f} {result['peak_kb']:8.2f} "
+            f"{result['gc_per_1000']:8.1f} {result['setup_us']:9.2f} "
+            f"{result['match_us']:9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Tempo por rodada de Board.match em função da quantidade de jogadores e do
+tamanho do tabuleiro.
+
+Duas varreduras em torno de um ponto base (--players e --estates):
+
+- jogadores: 4 .. milhares, com o tabuleiro do ponto base;
+- propriedades: 20 .. 10^5+, com os jogadores do ponto base.
+
+Nas partidas medidas, o saldo inicial é alto o bastante para ninguém falir:
+todos os jogadores jogam todas as rodadas e o tempo por jogada é o tempo da
+rodada dividido pelos jogadores. O custo de uma falência (take_estates,
+remove_player e a lista refeita no fim da rodada) é medido à parte, com
+metade dos jogadores falindo na mesma rodada.
+
+    PYTHONPATH=src python benchmarks/bench_scaling.py --rounds 20
+    PYTHONPATH=src python benchmarks/bench_scaling.py --plot scaling.png  # requer matplotlib
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, List
+
+from monopoly.domain.board import Board
+from monopoly.domain.random_source import RandomSource
+from monopoly.domain.rules import Rules
+
+PLAYERS = (4, 16, 64, 256, 1024, 4096)
+ESTATES = (20, 200, 2_000, 20_000, 200_000)
+RICH = 1e12
+
+
+def per_round(players: int, estates: int, rounds: int, repeat: int) -> Dict:
+    rules = Rules(
+        balance=RICH,
+        quantity_estates=estates,
+        quantity_players=players,
+        round_limit=rounds,
+    )
+    board = Board.create(rng=RandomSource(seed=1), rules=rules)
+    best_setup, best_match = float("inf"), float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        board.reset()
+        board.limits = board.purchase_limits()
+        setup = time.perf_counter() - start
+        start = time.perf_counter()
+        while board.next_round():
+            board.play_round()
+        best_match = min(best_match, (time.perf_counter() - start) / board.rounds)
+        best_setup = min(best_setup, setup)
+    return {
+        "players": players,
+        "estates": estates,
+        "round_us": best_match * 1e6,
+        "move_us": best_match / players * 1e6,
+        "setup_ms": best_setup * 1e3,
+    }
+
+
+def per_bankruptcy(players: int, estates: int, repeat: int) -> Dict:
+    rules = Rules(quantity_estates=estates, quantity_players=players)
+    best = float("inf")
+    for _ in range(repeat):
+        board = Board.create(rng=RandomSource(seed=1), rules=rules)
+        losers = board.players[::2]
+        for i, estate in enumerate(board.estates):
+            board.purchase(board.players[i % players], estate, valid=True)
+        start = time.perf_counter()
+        for player in losers:
+            board.take_estates(player=player)
+            board.remove_player(player=player)
+        board.drop_losers()
+        best = min(best, (time.perf_counter() - start) / len(losers))
+    return {"players": players, "estates": estates, "bankruptcy_us": best * 1e6}
+
+
+def table(title: str, rows: List[Dict], columns: List[str]) -> None:
+    print(f"\n{title}")
+    print("".join(f"{column:>14}" for column in columns))
+    for row in rows:
+        print(
+            "".join(
+                f"{row[c]:>14}" if isinstance(row[c], int) else f"{row[c]:>14.3f}"
+                for c in columns
+            )
+        )
+
+
+def plot(path: str, by_players: List[Dict], by_estates: List[Dict]) -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    figure, (left, right) = plt.subplots(1, 2, figsize=(10, 4))
+    for axes, rows, key, label in (
+        (left, by_players, "players", "jogadores"),
+        (right, by_estates, "estates", "propriedades"),
+    ):
+        x = [row[key] for row in rows]
+        axes.loglog(x, [row["round_us"] for row in rows], "o-", label="rodada")
+        axes.loglog(x, [row["move_us"] for row in rows], "s-", label="jogada")
+        axes.set_xlabel(label)
+        axes.set_ylabel("µs")
+        axes.grid(True, which="both", alpha=0.3)
+        axes.legend()
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, default=4, help="base point")
+    parser.add_argument("--estates", type=int, default=20, help="base point")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--plot", help="write the plot to this image (matplotlib)")
+    args = parser.parse_args()
+
+    by_players = [
+        per_round(players, args.estates, args.rounds, args.repeat)
+        for players in PLAYERS
+    ]
+    by_estates = [
+        per_round(args.players, estates, args.rounds, args.repeat)
+        for estates in ESTATES
+    ]
+    bankruptcies = [
+        per_bankruptcy(players, max(args.estates, players), args.repeat)
+        for players in PLAYERS
+    ]
+    columns = ["players", "estates", "round_us", "move_us", "setup_ms"]
+    table("Jogadores", by_players, columns)
+    table("Propriedades", by_estates, columns)
+    table("Falências", bankruptcies, ["players", "estates", "bankruptcy_us"])
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(
+                {
+                    "players": by_players,
+                    "estates": by_estates,
+                    "bankruptcies": bankruptcies,
+                },
+                file,
+                indent=2,
+            )
+    if args.plot:
+        plot(args.plot, by_players, by_estates)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Compara o custo do rastreamento desligado com um build sem as linhas de log.
+
+O build "stripped" é uma cópia de src/ onde todos os blocos `if tracing.ENABLED:`
+foram removidos da árvore sintática. Cada variante roda em um processo próprio.
+
+    PYTHONPATH=src python benchmarks/bench_tracing.py --runs 300 --repeat 5
+"""
+
+import argparse
+import ast
+import os
+import shutil
+import subprocess  # noqa S404
+import sys
+import tempfile
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+TIMER = """
+import time
+from monopoly import config, log
+from monopoly.domain.game import Game
+
+log.configure(config.LOG_LEVEL)
+timings = []
+for _ in range({repeat}):
+    start = time.perf_counter()
+    Game(seed=1).play({runs})
+    timings.append(time.perf_counter() - start)
+print(min(timings))
+"""
+
+
+class StripTracing(ast.NodeTransformer):
+    @staticmethod
+    def is_tracing(node: ast.AST) -> bool:
+        return (
+            isinstance(node, ast.If)
+            and isinstance(node.test, ast.Attribute)
+            and isinstance(node.test.value, ast.Name)
+            and node.test.value.id == "tracing"
+            and node.test.attr == "ENABLED"
+        )
+
+    def generic_visit(self, node):
+        super().generic_visit(node)
+        for name in ("body", "orelse"):
+            statements = getattr(node, name, None)
+            if isinstance(statements, list) and statements:
+                kept = [s for s in statements if not self.is_tracing(s)]
+                if not kept and name == "body":
+                    kept = [ast.Pass()]
+                setattr(node, name, kept)
+        return node
+
+
+def build_stripped(destination: Path) -> None:
+    shutil.copytree(SRC, destination, ignore=shutil.ignore_patterns("__pycache__"))
+    for path in destination.rglob("*.py"):
+        tree = StripTracing().visit(ast.parse(path.read_text()))
+        path.write_text(ast.unparse(ast.fix_missing_locations(tree)))
+
+
+def timing(pythonpath: Path, runs: int, repeat: int, log_level: int) -> float:
+    env = dict(os.environ, PYTHONPATH=str(pythonpath), LOG_LEVEL=str(log_level))
+    output = subprocess.run(  # noqa S603
+        [sys.executable, "-c", TIMER.format(runs=runs, repeat=repeat)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(output.stdout.strip())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--with-tracing", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stripped = Path(tmp) / "src"
+        build_stripped(stripped)
+
+        variants = {
+            "tracing off": timing(SRC, args.runs, args.repeat, 40),
+            "stripped": timing(stripped, args.runs, args.repeat, 40),
+        }
+        if args.with_tracing:
+            # The log lines go to a discarded pipe, only the cost of producing them counts
+            variants["tracing on"] = timing(SRC, args.runs, 1, 20)
+
+    baseline = variants["stripped"]
+    for name, seconds in variants.items():
+        print(
+            f"{name:<12} {seconds:8.3f}s {args.runs / seconds:10.1f} matches/s "
+            f"{(seconds / baseline - 1) * 100:+7.2f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
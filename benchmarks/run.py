@@ -0,0 +1,12 @@
+"""
+Atalho para `monopoly bench` (ver src/monopoly/bench.py).
+
+    PYTHONPATH=src python benchmarks/run.py --compare benchmarks/baseline.json
+"""
+
+import sys
+
+from monopoly import cli
+
+if __name__ == "__main__":
+    sys.exit(cli.main(["bench", *sys.argv[1:]]))
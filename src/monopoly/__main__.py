@@ -0,0 +1,22 @@
+"""
+python -m monopoly: o mesmo que o comando monopoly (ver cli.py). Sem
+subcomando, run:
+
+    python -m monopoly --runs 1000
+    python -m monopoly report matches.bin
+"""
+
+import sys
+from typing import List
+
+from monopoly import cli
+
+
+def arguments(argv: List[str]) -> List[str]:
+    if argv and (argv[0] in cli.commands() or argv[0] in ("-h", "--help")):
+        return argv
+    return ["run", *argv]
+
+
+if __name__ == "__main__":
+    sys.exit(cli.main(arguments(sys.argv[1:])))
@@ -0,0 +1,30 @@
+"""
+Gravação de arquivos que outros processos leem a qualquer momento
+(checkpoint, fatias da campanha e métricas do progresso).
+"""
+
+import os
+import tempfile
+
+
+def write_atomic(path: str, data: bytes, sync: bool = True) -> None:
+    """
+    Arquivo temporário no mesmo diretório e os.replace: quem lê nunca vê um
+    arquivo pela metade, e o anterior continua válido se o processo morrer no
+    meio. Com sync, os dados vão para o disco antes da troca de nome.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(
+        dir=directory, prefix=f".{name}-", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+            if sync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        raise
@@ -0,0 +1,182 @@
+"""
+Benchmarks do simulador, com baseline em JSON e comparação para detectar regressões.
+
+    monopoly bench --output benchmarks/baseline.json
+    monopoly bench --compare benchmarks/baseline.json --threshold 0.10
+"""
+
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+from monopoly.domain.accumulator import Accumulator
+from monopoly.domain.board import Board
+from monopoly.domain.estate import Estate
+from monopoly.domain.game import Game
+from monopoly.domain.random_source import RandomSource
+from monopoly.view import display_stdout
+
+GAME_RUNS = (30, 100, 300)
+
+Case = Callable[[], int]
+"""Executa o cenário uma vez e retorna a quantidade de operações realizadas."""
+
+
+def case_board_match(matches: int = 20) -> Case:
+    def run() -> int:
+        # same seed on every repeat: the same matches are timed each time
+        rng = RandomSource(seed=1)
+        for _ in range(matches):
+            Board.create(rng=rng).match()
+        return matches
+
+    return run
+
+
+def case_game_play(number_of_runs: int) -> Case:
+    def run() -> int:
+        Game(
+            seed=1, workers=1, checkpoint="", records="", trace="", progress=False
+        ).play(number_of_runs=number_of_runs)
+        return number_of_runs
+
+    return run
+
+
+def case_factory_estates() -> Case:
+    rng = RandomSource(seed=1)
+
+    def run() -> int:
+        for _ in range(1000):
+            Estate.factory_estates(rng=rng)
+        return 1000
+
+    return run
+
+
+def case_board_create() -> Case:
+    rng = RandomSource(seed=1)
+
+    def run() -> int:
+        for _ in range(1000):
+            Board.create(rng=rng)
+        return 1000
+
+    return run
+
+
+def case_board_reset() -> Case:
+    rng = RandomSource(seed=1)
+    board = Board.create(rng=rng)
+
+    def run() -> int:
+        for _ in range(1000):
+            board.reset(rng=rng)
+        return 1000
+
+    return run
+
+
+def case_display_stdout() -> Case:
+    statistic = Accumulator()
+    for rounds in range(1, 301):
+        statistic.add_match(rounds=rounds, timeout=rounds >= 1000, behavior="Wary")
+
+    def run() -> int:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(100):
+                display_stdout(statistic)
+        return 100
+
+    return run
+
+
+def cases() -> Dict[str, Case]:
+    return {
+        "board_match": case_board_match(),
+        **{f"game_play_{runs}": case_game_play(runs) for runs in GAME_RUNS},
+        "factory_estates": case_factory_estates(),
+        "board_create": case_board_create(),
+        "board_reset": case_board_reset(),
+        "display_stdout": case_display_stdout(),
+    }
+
+
+def measure(case: Case, repeat: int) -> dict:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operations = case()
+        timings.append((time.perf_counter() - start) / operations)
+    best = min(timings)
+    return {
+        "seconds": best,
+        "median": statistics.median(timings),
+        "ops_per_second": 1 / best,
+        "repeat": repeat,
+    }
+
+
+def run(repeat: int, only: List[str] = None) -> dict:
+    results = {}
+    for name, case in cases().items():
+        if only and name not in only:
+            continue
+        results[name] = measure(case, repeat)
+        print(
+            f"{name:<18} {results[name]['seconds'] * 1e3:12.4f} ms/op "
+            f"{results[name]['ops_per_second']:12.1f} op/s",
+            file=sys.stderr,
+        )
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """
+    Lista os cenários que ficaram mais lentos do que o baseline além do limite.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name]["seconds"]
+        change = result["seconds"] / before - 1
+        status = "REGRESSION" if change > threshold else "ok"
+        print(f"{name:<18} {change * 100:+8.2f}%  {status}", file=sys.stderr)
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(
+    repeat: int = 5,
+    only: List[str] = None,
+    output: str = None,
+    baseline: str = None,
+    threshold: float = 0.10,
+) -> int:
+    current = run(repeat=repeat, only=only)
+
+    if output:
+        with open(output, "w") as file:
+            json.dump(current, file, indent=2)
+
+    if baseline:
+        with open(baseline) as file:
+            if compare(json.load(file), current, threshold):
+                return 1
+    return 0
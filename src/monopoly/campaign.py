@@ -0,0 +1,306 @@
+"""
+Campanhas distribuídas em várias máquinas por um diretório compartilhado.
+
+    monopoly coordinator /shared/campaign --runs 1000000 --seed 7
+    monopoly worker /shared/campaign        # em cada máquina, quantos quiser
+
+Estrutura do diretório:
+
+    campaign.json        partidas, semente mestre, motor, tamanho das fatias e regras
+    pending/000012.json  fatia a jogar
+    claimed/000012.json  fatia em execução; o mtime é o último sinal de vida do worker
+    done/000012.json     acumulador parcial da fatia (done/000012.bin: os registros)
+
+Um worker pega uma fatia com os.rename de pending para claimed (atômico: só um
+worker consegue) e grava o parcial com os.replace. Uma fatia cujo worker parou
+de dar sinal de vida por mais de lease segundos volta para pending.
+
+Cada fatia tem a sua semente (Shard.derive_seed), então uma fatia jogada duas
+vezes grava o mesmo parcial, e o resultado combinado na ordem das fatias é o
+mesmo de Game(seed=...).play com o mesmo tamanho de fatia.
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import List, Optional
+
+from monopoly import config, log
+from monopoly.atomic import write_atomic
+from monopoly.domain.accumulator import Accumulator
+from monopoly.domain.game import Shard, play_shard
+from monopoly.domain.records import RecordWriter
+from monopoly.domain.rules import DEFAULT_RULES, Rules
+from monopoly.domain.variates import Variates
+
+logger = log.init_logger("campaign.py")
+
+VERSION = 1
+PENDING, CLAIMED, DONE = "pending", "claimed", "done"
+POLL_SECONDS = 1.0
+
+
+def _read(path: str) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+def worker_name() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+@dataclass
+class Campaign:
+    directory: str
+    seed: int
+    number_of_runs: int
+    shard_size: int
+    engine: str = "object"
+    rules: Rules = DEFAULT_RULES
+    variates: Variates = None
+    records: bool = False
+
+    @staticmethod
+    def create(
+        directory: str,
+        number_of_runs: int,
+        seed: int,
+        shard_size: int,
+        engine: str = "object",
+        rules: Rules = DEFAULT_RULES,
+        variates: Variates = None,
+        records: bool = False,
+    ) -> "Campaign":
+        """
+        Grava uma fatia por arquivo em pending e, por último, campaign.json:
+        os workers só começam quando todas as fatias existem.
+        """
+        if variates is not None and engine == "batch":
+            raise ValueError(
+                "Variance reduction is only available for the object engine"
+            )
+        if variates is not None and variates.antithetic:
+            # both matches of a pair in the same shard, as in Game
+            shard_size += shard_size % 2
+        campaign = Campaign(
+            directory=directory,
+            seed=seed,
+            number_of_runs=number_of_runs,
+            shard_size=shard_size,
+            engine=engine,
+            rules=rules,
+            variates=variates,
+            records=records,
+        )
+        for name in (PENDING, CLAIMED, DONE):
+            os.makedirs(os.path.join(directory, name), exist_ok=True)
+        for shard in campaign.shards:
+            write_atomic(
+                campaign._path(PENDING, shard.index),
+                json.dumps(asdict(shard)).encode(),
+            )
+        write_atomic(
+            os.path.join(directory, "campaign.json"),
+            json.dumps(campaign.to_dict()).encode(),
+        )
+        return campaign
+
+    @staticmethod
+    def load(directory: str) -> "Campaign":
+        data = _read(os.path.join(directory, "campaign.json"))
+        if data.get("version") != VERSION:
+            raise ValueError(f"Unsupported campaign version: {data.get('version')}")
+        variates = data["variates"]
+        return Campaign(
+            directory=directory,
+            seed=data["seed"],
+            number_of_runs=data["number_of_runs"],
+            shard_size=data["shard_size"],
+            engine=data["engine"],
+            rules=Rules(**data["rules"]),
+            variates=Variates.from_dict(variates) if variates else None,
+            records=data["records"],
+        )
+
+    @staticmethod
+    def exists(directory: str) -> bool:
+        return os.path.exists(os.path.join(directory, "campaign.json"))
+
+    def to_dict(self) -> dict:
+        return {
+            "version": VERSION,
+            "seed": self.seed,
+            "number_of_runs": self.number_of_runs,
+            "shard_size": self.shard_size,
+            "engine": self.engine,
+            "rules": self.rules.to_dict(),
+            "variates": self.variates.to_dict() if self.variates else None,
+            "records": self.records,
+        }
+
+    @property
+    def shards(self) -> List[Shard]:
+        return Shard.split(self.number_of_runs, self.shard_size, self.seed)
+
+    def _path(self, state: str, index: int, suffix: str = ".json") -> str:
+        return os.path.join(self.directory, state, f"{index:06d}{suffix}")
+
+    def _names(self, state: str) -> List[str]:
+        return sorted(
+            name
+            for name in os.listdir(os.path.join(self.directory, state))
+            if name.endswith(".json")
+        )
+
+    @property
+    def qtd_shards(self) -> int:
+        return -(-self.number_of_runs // self.shard_size)
+
+    @property
+    def finished(self) -> bool:
+        return len(self._names(DONE)) == self.qtd_shards
+
+    def claim(self) -> Optional[Shard]:
+        """
+        Pega a primeira fatia pendente que nenhum outro worker pegou antes.
+        """
+        for name in self._names(PENDING):
+            claimed = os.path.join(self.directory, CLAIMED, name)
+            try:
+                os.rename(os.path.join(self.directory, PENDING, name), claimed)
+            except FileNotFoundError:
+                continue  # another worker was faster
+            # the rename keeps the mtime of the pending file: start the lease now
+            os.utime(claimed)
+            return Shard(**_read(claimed))
+        return None
+
+    def complete(self, shard: Shard, statistic: Accumulator) -> None:
+        """
+        Grava o parcial da fatia (os registros antes, o acumulador por último)
+        e libera a fatia.
+        """
+        if statistic.records is not None:
+            write_atomic(self._path(DONE, shard.index, ".bin"), statistic.records)
+        write_atomic(
+            self._path(DONE, shard.index), json.dumps(statistic.to_dict()).encode()
+        )
+        try:
+            os.unlink(self._path(CLAIMED, shard.index))
+        except FileNotFoundError:
+            pass  # reclaimed meanwhile: the other run writes the same partial
+
+    def reclaim(self, lease: float) -> int:
+        """
+        Devolve para pending as fatias sem sinal de vida há mais de lease segundos.
+        """
+        reclaimed = 0
+        now = time.time()
+        for name in self._names(CLAIMED):
+            claimed = os.path.join(self.directory, CLAIMED, name)
+            try:
+                if now - os.stat(claimed).st_mtime <= lease:
+                    continue
+                if os.path.exists(os.path.join(self.directory, DONE, name)):
+                    os.unlink(claimed)
+                    continue
+                os.rename(claimed, os.path.join(self.directory, PENDING, name))
+            except FileNotFoundError:
+                continue  # completed or reclaimed by someone else
+            logger.warning("Reclaimed stale shard %s", name)
+            reclaimed += 1
+        return reclaimed
+
+    def play(self, shard: Shard) -> Accumulator:
+        return play_shard(
+            self.engine,
+            shard,
+            False,
+            self.rules,
+            self.records,
+            None,
+            self.variates,
+            config.REUSE_BOARDS,
+        )
+
+    def work(
+        self, lease: float = None, poll: float = POLL_SECONDS, worker: str = None
+    ) -> int:
+        """
+        Joga fatias até a campanha terminar; retorna quantas fatias este worker jogou.
+        Sem fatias pendentes, espera as dos outros workers (e devolve as abandonadas).
+        """
+        lease = lease if lease is not None else config.CLAIM_TIMEOUT
+        worker = worker or worker_name()
+        played = 0
+        while True:
+            shard = self.claim()
+            if shard is None:
+                if self.finished:
+                    break
+                self.reclaim(lease)
+                time.sleep(poll)
+                continue
+            logger.warning("Worker %s playing shard %d", worker, shard.index)
+            with self._heartbeat(self._path(CLAIMED, shard.index), lease / 3):
+                statistic = self.play(shard)
+            self.complete(shard, statistic)
+            played += 1
+        logger.warning("Worker %s finished: %d shards", worker, played)
+        return played
+
+    @contextmanager
+    def _heartbeat(self, path: str, interval: float):
+        """
+        Atualiza o mtime da fatia enquanto ela é jogada.
+        """
+        stop = threading.Event()
+
+        def beat() -> None:
+            while not stop.wait(interval):
+                try:
+                    os.utime(path)
+                except FileNotFoundError:
+                    return
+
+        thread = threading.Thread(target=beat, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def wait(self, lease: float = None, poll: float = POLL_SECONDS) -> None:
+        lease = lease if lease is not None else config.CLAIM_TIMEOUT
+        while not self.finished:
+            self.reclaim(lease)
+            time.sleep(poll)
+
+    def merge(self, records: str = None) -> Accumulator:
+        """
+        Combina os parciais na ordem das fatias; com records, também grava os
+        registros das partidas nesse arquivo, na mesma ordem.
+        """
+        statistic = Accumulator()
+        writer = (
+            RecordWriter(records, seats=self.rules.quantity_players)
+            if records
+            else None
+        )
+        try:
+            for shard in self.shards:
+                statistic.merge(
+                    Accumulator.from_dict(_read(self._path(DONE, shard.index)))
+                )
+                if writer is not None:
+                    with open(self._path(DONE, shard.index, ".bin"), "rb") as file:
+                        writer.write(file.read())
+        finally:
+            if writer is not None:
+                writer.close()
+        return statistic
@@ -0,0 +1,388 @@
+"""
+Linha de comando do simulador.
+
+    monopoly run [--checkpoint run.json [--resume]]
+    monopoly sweep --balance 200 300 400 --quantity-estates 20 40 --output sweep.json
+    monopoly bench --compare benchmarks/baseline.json
+    monopoly report matches.bin
+    monopoly replay trace.bin --match 42 --step 1500
+    monopoly daemon --socket /tmp/monopoly.sock
+    monopoly coordinator /shared/campaign --runs 1000000 --seed 7
+    monopoly worker /shared/campaign
+    monopoly tournament --runs 1000 --lineup Wary,Wary,Picky,Random --permute
+
+Os módulos de cada comando só são importados quando o comando é executado,
+e o ambiente (config) só é lido depois da análise dos argumentos.
+"""
+
+import argparse
+import sys
+from typing import List
+
+from monopoly import config, log
+
+logger = log.init_logger("cli.py")
+
+PARAMETER_TYPES = {
+    "balance": float,
+    "quantity_estates": int,
+    "quantity_players": int,
+    "lap_bonus": float,
+    "picky_min_rent": float,
+    "wary_reserve": float,
+    "round_limit": int,
+}
+ENGINES = ("object", "batch")
+MODES = ("antithetic",)
+
+
+def run(args) -> int:
+    from monopoly.domain.game import Game
+    from monopoly.domain.precision import Precision
+    from monopoly.domain.variates import Variates
+    from monopoly.view import display_stdout, dump_profile
+
+    checkpoint = args.checkpoint or config.CHECKPOINT
+    if args.resume and not checkpoint:
+        raise SystemExit("--resume requires --checkpoint (or CHECKPOINT)")
+
+    logger.warning("Application started\n")
+
+    if args.resume:
+        game = Game.resume(checkpoint)
+    else:
+        variates = None
+        if args.variance_reduction:
+            variates = Variates(antithetic=args.variance_reduction == "antithetic")
+        game = Game(checkpoint=checkpoint, variates=variates)
+        win, rounds = config.TARGET_WIN_PRECISION, config.TARGET_ROUNDS_PRECISION
+        if win is not None or rounds is not None:
+            game.play_adaptive(Precision(win=win, rounds=rounds))
+        else:
+            game.play(number_of_runs=args.runs)
+
+    display_stdout(game.statistic, game.precision)
+    if config.PROFILE_OUTPUT and game.statistic.profile is not None:
+        dump_profile(game.statistic.profile, config.PROFILE_OUTPUT)
+    return 0
+
+
+def sweep(args) -> int:
+    import secrets
+
+    from monopoly.domain.rules import Rules
+    from monopoly.domain.sweep import Sweep, grid
+    from monopoly.domain.variates import Variates
+
+    values = {
+        name: getattr(args, name)
+        for name in PARAMETER_TYPES
+        if getattr(args, name) is not None
+    }
+    seed = args.seed if args.seed is not None else config.SEED
+    seed = seed if seed is not None else secrets.randbits(64)
+    experiment = Sweep(
+        rules=grid(Rules.from_config(), **values),
+        seed=seed,
+        engine=args.engine or config.ENGINE,
+        workers=args.workers or config.WORKERS,
+        variates=(
+            Variates(antithetic=args.antithetic)
+            if args.common_random_numbers or args.antithetic
+            else None
+        ),
+    )
+    logger.warning("Sweep of %d points started (seed=%d)", len(experiment.points), seed)
+
+    for row in experiment.run(number_of_runs=args.runs or config.NUMBER_OF_RUNS):
+        print(
+            " ".join(f"{name}={row[name]}" for name in values),
+            f"rounds={row['rounds_mean']:.2f} timeouts={row['timeouts']}",
+            f"({row['seconds']:.2f}s)",
+            file=sys.stderr,
+        )
+    experiment.write(args.output)
+    return 0
+
+
+def bench(args) -> int:
+    from monopoly import bench
+
+    return bench.main(
+        repeat=args.repeat,
+        only=args.only,
+        output=args.output,
+        baseline=args.compare,
+        threshold=args.threshold,
+    )
+
+
+def report(args) -> int:
+    from monopoly.view import display_stdout
+
+    display_stdout(args.records)
+    return 0
+
+
+def replay(args) -> int:
+    from monopoly.view import display_replay
+
+    display_replay(args.trace, match=args.match, step=args.step)
+    return 0
+
+
+def daemon(args) -> int:
+    import asyncio
+    import os
+
+    from monopoly.daemon import Daemon, serve_forever
+
+    workers = args.workers or max(config.WORKERS, os.cpu_count() or 1)
+    server = Daemon(workers=workers, shard_size=args.shard_size, engine=args.engine)
+    try:
+        asyncio.run(
+            serve_forever(server, socket=args.socket, host=args.host, port=args.port)
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def coordinator(args) -> int:
+    import secrets
+
+    from monopoly.campaign import Campaign
+    from monopoly.domain.rules import Rules
+    from monopoly.domain.variates import Variates
+    from monopoly.view import display_stdout
+
+    records = args.records or config.RECORDS
+    if Campaign.exists(args.directory):
+        campaign = Campaign.load(args.directory)
+        logger.warning("Waiting for the campaign in %s", args.directory)
+    else:
+        seed = args.seed if args.seed is not None else config.SEED
+        variates = None
+        if args.variance_reduction:
+            variates = Variates(antithetic=args.variance_reduction == "antithetic")
+        engine = args.engine or config.ENGINE
+        campaign = Campaign.create(
+            args.directory,
+            number_of_runs=args.runs or config.NUMBER_OF_RUNS,
+            seed=seed if seed is not None else secrets.randbits(64),
+            shard_size=args.shard_size
+            or (config.BATCH_SIZE if engine == "batch" else config.SHARD_SIZE),
+            engine=engine,
+            rules=Rules.from_config(),
+            variates=variates,
+            records=bool(records),
+        )
+        logger.warning(
+            "Campaign of %d shards created in %s (seed=%d)",
+            campaign.qtd_shards,
+            args.directory,
+            campaign.seed,
+        )
+
+    campaign.wait(lease=args.lease, poll=args.poll)
+    statistic = campaign.merge(records=records if campaign.records else None)
+    display_stdout(statistic)
+    return 0
+
+
+def worker(args) -> int:
+    import time
+
+    from monopoly.campaign import Campaign
+
+    # workers may start before the coordinator has created the campaign
+    while not Campaign.exists(args.directory):
+        time.sleep(args.poll)
+    Campaign.load(args.directory).work(lease=args.lease, poll=args.poll)
+    return 0
+
+
+def tournament(args) -> int:
+    import json
+    import secrets
+
+    from monopoly.domain.rules import Rules
+    from monopoly.domain.tournament import Tournament, lineups_of
+    from monopoly.view import display_tournament
+
+    if args.lineup:
+        lineups = [
+            lineup
+            for names in args.lineup
+            for lineup in lineups_of(names.split(","), permute=args.permute)
+        ]
+    else:
+        lineups = lineups_of()
+    seed = args.seed if args.seed is not None else config.SEED
+    seed = seed if seed is not None else secrets.randbits(64)
+    experiment = Tournament(
+        lineups=list(dict.fromkeys(lineups)),
+        seed=seed,
+        rules=Rules.from_config(),
+        workers=args.workers or config.WORKERS,
+        shard_size=args.shard_size or config.SHARD_SIZE,
+    )
+    logger.warning(
+        "Tournament of %d lineups started (seed=%d)", len(experiment.lineups), seed
+    )
+
+    standings = experiment.play(number_of_runs=args.runs or config.NUMBER_OF_RUNS)
+    display_tournament(standings)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(
+                {"seed": seed, "lineups": experiment.lineups, **standings.to_dict()},
+                file,
+                indent=2,
+            )
+    return 0
+
+
+def parser() -> argparse.ArgumentParser:
+    root = argparse.ArgumentParser(
+        prog="monopoly",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = root.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("run", help="play the matches and display the report")
+    command.add_argument("--runs", type=int, help="number of matches (NUMBER_OF_RUNS)")
+    command.add_argument(
+        "--checkpoint", help="file where the progress is saved periodically"
+    )
+    command.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue the run saved in the checkpoint file",
+    )
+    command.add_argument(
+        "--variance-reduction",
+        choices=MODES,
+        help="antithetic dice pairs (VARIANCE_REDUCTION); "
+        "common random numbers are in sweep --common-random-numbers",
+    )
+    command.set_defaults(handler=run)
+
+    command = commands.add_parser("sweep", help="parameter sweep over the rules")
+    for name, kind in PARAMETER_TYPES.items():
+        command.add_argument(f"--{name.replace('_', '-')}", type=kind, nargs="+")
+    command.add_argument("--runs", type=int)
+    command.add_argument("--engine", choices=ENGINES)
+    command.add_argument("--workers", type=int)
+    command.add_argument("--seed", type=int)
+    command.add_argument("--output", default="sweep.json")
+    command.add_argument(
+        "--common-random-numbers",
+        action="store_true",
+        help="same random numbers in every point, compared with the first one",
+    )
+    command.add_argument(
+        "--antithetic",
+        action="store_true",
+        help="antithetic dice pairs (implies --common-random-numbers)",
+    )
+    command.set_defaults(handler=sweep)
+
+    command = commands.add_parser("bench", help="benchmarks with a JSON baseline")
+    command.add_argument("--repeat", type=int, default=5)
+    command.add_argument("--only", nargs="*", help="run only these cases")
+    command.add_argument("--output", help="write the results to this JSON file")
+    command.add_argument("--compare", help="baseline JSON file to compare against")
+    command.add_argument("--threshold", type=float, default=0.10)
+    command.set_defaults(handler=bench)
+
+    command = commands.add_parser("report", help="report of a match records file")
+    command.add_argument("records")
+    command.set_defaults(handler=report)
+
+    command = commands.add_parser("replay", help="board state of a traced match")
+    command.add_argument("trace")
+    command.add_argument("--match", type=int, help="match index")
+    command.add_argument("--step", type=int, help="move number")
+    command.set_defaults(handler=replay)
+
+    command = commands.add_parser("daemon", help="simulation daemon")
+    command.add_argument("--socket", help="Unix socket path")
+    command.add_argument("--host", default="127.0.0.1")
+    command.add_argument("--port", type=int, default=8765)
+    command.add_argument("--workers", type=int)
+    command.add_argument("--shard-size", type=int)
+    command.add_argument("--engine", choices=ENGINES)
+    command.set_defaults(handler=daemon)
+
+    command = commands.add_parser(
+        "coordinator", help="split a campaign into shards on a shared directory"
+    )
+    command.add_argument("directory")
+    command.add_argument("--runs", type=int, help="number of matches (NUMBER_OF_RUNS)")
+    command.add_argument("--seed", type=int)
+    command.add_argument("--shard-size", type=int)
+    command.add_argument("--engine", choices=ENGINES)
+    command.add_argument("--records", help="match records file (RECORDS)")
+    command.add_argument("--variance-reduction", choices=MODES)
+    command.add_argument(
+        "--lease", type=float, help="seconds before a stale shard is reclaimed"
+    )
+    command.add_argument("--poll", type=float, default=1.0)
+    command.set_defaults(handler=coordinator)
+
+    command = commands.add_parser(
+        "worker", help="play the shards of a campaign on a shared directory"
+    )
+    command.add_argument("directory")
+    command.add_argument(
+        "--lease", type=float, help="seconds before a stale shard is reclaimed"
+    )
+    command.add_argument("--poll", type=float, default=1.0)
+    command.set_defaults(handler=worker)
+
+    command = commands.add_parser(
+        "tournament", help="same matches with every seat permutation of the players"
+    )
+    command.add_argument("--runs", type=int, help="matches per lineup (NUMBER_OF_RUNS)")
+    command.add_argument(
+        "--lineup",
+        action="append",
+        help="comma separated strategy names, one per seat (repeatable); "
+        "default: every permutation of the four behaviors",
+    )
+    command.add_argument(
+        "--permute",
+        action="store_true",
+        help="play every distinct seat permutation of each --lineup",
+    )
+    command.add_argument("--workers", type=int)
+    command.add_argument("--seed", type=int)
+    command.add_argument("--shard-size", type=int)
+    command.add_argument("--output", help="write the standings to this JSON file")
+    command.set_defaults(handler=tournament)
+    return root
+
+
+def commands(root: argparse.ArgumentParser = None) -> List[str]:
+    """
+    Nomes dos subcomandos.
+    """
+    root = root or parser()
+    return [
+        name
+        for action in root._actions
+        if isinstance(action, argparse._SubParsersAction)
+        for name in action.choices
+    ]
+
+
+def main(argv: List[str] = None) -> int:
+    args = parser().parse_args(argv)
+    log.configure(config.LOG_LEVEL)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Configurações lidas das variáveis de ambiente.
+
+Nada é lido na importação: cada configuração é lida no primeiro acesso
+(config.ENGINE) e guardada no módulo.
+"""
+
+import logging
+import os
+from typing import Any, Callable, Dict
+
+
+def _optional(parse: Callable[[str], Any], name: str) -> Any:
+    value = os.getenv(name)
+    return parse(value) if value else None
+
+
+SETTINGS: Dict[str, Callable[[], Any]] = {
+    # SYSTEM
+    "LOG_LEVEL": lambda: int(os.getenv("LOG_LEVEL", logging.ERROR)),
+    # APP
+    "NUMBER_OF_RUNS": lambda: int(os.getenv("NUMBER_OF_RUNS", 300)),
+    "DEFAULT_BALANCE": lambda: float(os.getenv("DEFAULT_BALANCE", 300.0)),
+    "QUANTITY_ESTATES": lambda: int(os.getenv("QUANTITY_ESTATES", 20)),
+    # seats take the behaviors in turn: Impulsive, Picky, Wary, Random, Impulsive...
+    "QUANTITY_PLAYERS": lambda: int(os.getenv("QUANTITY_PLAYERS", 4)),
+    # ENGINE
+    "ENGINE": lambda: os.getenv("ENGINE", "object"),  # object | batch
+    "BATCH_SIZE": lambda: int(os.getenv("BATCH_SIZE", 10_000)),
+    "REUSE_BOARDS": lambda: bool(int(os.getenv("REUSE_BOARDS", 1))),
+    # PARALLEL
+    "WORKERS": lambda: int(os.getenv("WORKERS", 1)),
+    "SHARD_SIZE": lambda: int(os.getenv("SHARD_SIZE", 100)),
+    "SEED": lambda: _optional(int, "SEED"),
+    # seconds without a heartbeat before a campaign shard is given to another worker
+    "CLAIM_TIMEOUT": lambda: float(os.getenv("CLAIM_TIMEOUT", 120)),
+    # VARIANCE REDUCTION
+    "VARIANCE_REDUCTION": lambda: os.getenv("VARIANCE_REDUCTION"),  # antithetic
+    # CHECKPOINT
+    "CHECKPOINT": lambda: os.getenv("CHECKPOINT"),
+    "CHECKPOINT_INTERVAL": lambda: float(os.getenv("CHECKPOINT_INTERVAL", 60)),
+    # RECORDS
+    "RECORDS": lambda: os.getenv("RECORDS"),
+    # EVENT TRACE
+    "TRACE": lambda: os.getenv("TRACE"),
+    "TRACE_EVERY": lambda: int(os.getenv("TRACE_EVERY", 1)),
+    "TRACE_ONLY_TIMEOUTS": lambda: bool(int(os.getenv("TRACE_ONLY_TIMEOUTS", 0))),
+    # PROGRESS
+    "PROGRESS": lambda: bool(int(os.getenv("PROGRESS", 0))),
+    "PROGRESS_INTERVAL": lambda: float(os.getenv("PROGRESS_INTERVAL", 1)),
+    "PROGRESS_TEXTFILE": lambda: os.getenv("PROGRESS_TEXTFILE"),
+    # PROFILING
+    "PROFILE": lambda: bool(int(os.getenv("PROFILE", 0))),
+    "PROFILE_OUTPUT": lambda: os.getenv("PROFILE_OUTPUT"),
+    # ADAPTIVE RUNS
+    "TARGET_WIN_PRECISION": lambda: _optional(float, "TARGET_WIN_PRECISION"),
+    "TARGET_ROUNDS_PRECISION": lambda: _optional(float, "TARGET_ROUNDS_PRECISION"),
+    "MIN_RUNS": lambda: int(os.getenv("MIN_RUNS", 100)),
+    "MAX_RUNS": lambda: int(os.getenv("MAX_RUNS", 1_000_000)),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        parse = SETTINGS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = parse()
+    return value
+
+
+def reload() -> None:
+    """
+    Esquece os valores já lidos (para reler o ambiente).
+    """
+    for name in SETTINGS:
+        globals().pop(name, None)
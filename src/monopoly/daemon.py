@@ -0,0 +1,271 @@
+"""
+Daemon de simulação: mantém um pool de processos aquecido e atende pedidos
+em JSON, um por linha, por um socket Unix ou uma porta local.
+
+    monopoly daemon --socket /tmp/monopoly.sock --workers 4
+    monopoly daemon --port 8765
+
+Pedidos:
+    {"type": "run", "id": "a", "runs": 1000, "seed": 1, "balance": 300, "quantity_estates": 20}
+    {"type": "cancel", "id": "a"}
+    {"type": "ping"}
+
+Respostas (na mesma conexão): "progress" com o parcial acumulado a cada fatia,
+"result" no fim, "cancelled" ou "error" (com o id do pedido, quando há um: um
+pedido inválido ou uma partida que falhou no worker). Com a mesma semente, o
+resultado é o mesmo de Game(seed=...).play(runs).
+"""
+
+import asyncio
+import json
+import os
+import secrets
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from typing import Callable, Dict, List
+
+from monopoly import config, log
+from monopoly.domain.accumulator import Accumulator
+from monopoly.domain.game import IN_FLIGHT_PER_WORKER, Shard, play_shard
+from monopoly.domain.rules import Rules
+
+logger = log.init_logger("daemon.py")
+
+RULES = {parameter.name: parameter.type for parameter in fields(Rules)}
+"""
+Menor valor aceito de cada regra em um pedido.
+"""
+MINIMUMS = {
+    "balance": 0.0,
+    "quantity_estates": 1,
+    "quantity_players": 1,
+    "lap_bonus": 0.0,
+    "picky_min_rent": 0.0,
+    "wary_reserve": 0.0,
+    "round_limit": 1,
+}
+Send = Callable[[dict], "asyncio.Future"]
+
+
+def number(request: dict, name: str, kind: type, minimum: float = None):
+    """
+    Valor numérico do pedido: JSON não distingue 1 de True nem traz tipos,
+    então int e float são verificados aqui, antes de chegar aos workers.
+    """
+    value = request[name]
+    valid = (int,) if kind is int else (int, float)
+    if isinstance(value, bool) or not isinstance(value, valid):
+        raise ValueError(
+            f"{name} must be {'an integer' if kind is int else 'a number'}"
+        )
+    if minimum is not None and value < minimum:
+        raise ValueError(f"{name} must be at least {minimum}")
+    return kind(value)
+
+
+def rules_of(request: dict) -> Rules:
+    return Rules(
+        **{
+            name: number(request, name, kind, MINIMUMS.get(name))
+            for name, kind in RULES.items()
+            if name in request
+        }
+    )
+
+
+def summary(statistic: Accumulator) -> dict:
+    return {
+        **statistic.to_dict(),
+        "rounds_stdev": statistic.rounds_stdev,
+        "win_percentages": statistic.win_percentages,
+    }
+
+
+class Daemon:
+    def __init__(
+        self,
+        workers: int = None,
+        shard_size: int = None,
+        engine: str = None,
+    ):
+        self.workers = workers or config.WORKERS
+        self.shard_size = shard_size or config.SHARD_SIZE
+        self.engine = engine or config.ENGINE
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.jobs: Dict[str, asyncio.Task] = {}
+
+    async def warm_up(self) -> None:
+        """
+        Inicia os processos do pool e faz os imports antes do primeiro pedido.
+        """
+        loop = asyncio.get_running_loop()
+        shard = Shard(index=0, start=0, size=1, seed=0)
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self.executor, play_shard, self.engine, shard)
+                for _ in range(self.workers)
+            )
+        )
+
+    def close(self) -> None:
+        for job in self.jobs.values():
+            job.cancel()
+        self.executor.shutdown(cancel_futures=True)
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        lock = asyncio.Lock()
+        connection_jobs: List[str] = []
+
+        async def send(message: dict) -> None:
+            async with lock:
+                if writer.is_closing():
+                    return
+                writer.write(json.dumps(message).encode() + b"\n")
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    pass
+
+        try:
+            while line := await reader.readline():
+                request = None
+                try:
+                    request = json.loads(line)
+                    await self.dispatch(request, send, connection_jobs)
+                except (ValueError, TypeError, KeyError) as error:
+                    message = {"type": "error", "message": str(error)}
+                    if isinstance(request, dict) and "id" in request:
+                        message["id"] = request["id"]
+                    await send(message)
+        except ConnectionError:
+            pass
+        finally:
+            # jobs of a closed connection have nobody to answer to
+            for job_id in connection_jobs:
+                if job_id in self.jobs:
+                    self.jobs[job_id].cancel()
+            writer.close()
+
+    async def dispatch(self, request: dict, send: Send, connection_jobs: list) -> None:
+        if not isinstance(request, dict):
+            raise ValueError("a request must be a JSON object")
+        kind = request.get("type", "run")
+        if kind == "ping":
+            await send({"type": "pong"})
+        elif kind == "cancel":
+            job = self.jobs.get(request["id"])
+            if job is None:
+                await send(
+                    {"type": "error", "id": request["id"], "message": "unknown job"}
+                )
+            else:
+                job.cancel()
+        elif kind == "run":
+            job_id = str(request.get("id") or secrets.token_hex(4))
+            if job_id in self.jobs:
+                raise ValueError(f"job {job_id} is already running")
+            runs = number(request, "runs", int, minimum=1)
+            seed = request.get("seed")
+            seed = (
+                number(request, "seed", int, minimum=0)
+                if seed is not None
+                else secrets.randbits(64)
+            )
+            rules = rules_of(request)
+            connection_jobs.append(job_id)
+            job = asyncio.create_task(self.run(job_id, runs, seed, rules, send))
+            job.add_done_callback(lambda task: self._finished(job_id, task, send))
+            self.jobs[job_id] = job
+        else:
+            raise ValueError(f"unknown request type: {kind}")
+
+    def _finished(self, job_id: str, task: asyncio.Task, send: Send) -> None:
+        self.jobs.pop(job_id, None)
+        if task.cancelled():
+            asyncio.ensure_future(send({"type": "cancelled", "id": job_id}))
+
+    async def run(
+        self, job_id: str, runs: int, seed: int, rules: Rules, send: Send
+    ) -> None:
+        """
+        Envia as fatias para o pool e acumula os resultados na ordem das fatias.
+
+        Só algumas fatias por worker ficam na fila do pool, então pedidos
+        pequenos não esperam atrás de um pedido grande e o cancelamento é imediato.
+        """
+        loop = asyncio.get_running_loop()
+        shards = Shard.stream(runs, self.shard_size, seed)
+        futures = deque()
+
+        def submit() -> None:
+            shard = next(shards, None)
+            if shard is not None:
+                futures.append(
+                    loop.run_in_executor(
+                        self.executor, play_shard, self.engine, shard, False, rules
+                    )
+                )
+
+        for _ in range(self.workers * IN_FLIGHT_PER_WORKER):
+            submit()
+        statistic = Accumulator()
+        try:
+            while futures:
+                statistic.merge(await futures[0])
+                futures.popleft()
+                submit()
+                await send(
+                    {
+                        "type": "progress",
+                        "id": job_id,
+                        "matches": statistic.matches,
+                        "runs": runs,
+                        "statistic": summary(statistic),
+                    }
+                )
+            await send(
+                {
+                    "type": "result",
+                    "id": job_id,
+                    "seed": seed,
+                    "statistic": summary(statistic),
+                }
+            )
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as error:
+            # a shard that failed in a worker: the client still gets an answer
+            for future in futures:
+                future.cancel()
+            logger.error("Job %s failed: %r", job_id, error)
+            await send({"type": "error", "id": job_id, "message": str(error)})
+
+    async def serve(
+        self, socket: str = None, host: str = "127.0.0.1", port: int = None
+    ):
+        await self.warm_up()
+        if socket:
+            server = await asyncio.start_unix_server(self.handle, path=socket)
+        else:
+            server = await asyncio.start_server(self.handle, host=host, port=port)
+        address = socket or "%s:%d" % server.sockets[0].getsockname()[:2]
+        logger.warning("Daemon listening on %s with %d workers", address, self.workers)
+        return server
+
+
+async def serve_forever(
+    daemon: Daemon, socket: str = None, host: str = "127.0.0.1", port: int = None
+) -> None:
+    try:
+        server = await daemon.serve(socket=socket, host=host, port=port)
+        async with server:
+            await server.serve_forever()
+    finally:
+        daemon.close()
+        if socket and os.path.exists(socket):
+            os.unlink(socket)
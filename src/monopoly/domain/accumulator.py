@@ -0,0 +1,215 @@
+import math
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict
+
+from monopoly.domain.player import STRATEGIES
+
+PAIRED = ("pairs", "baseline", "differences")
+
+
+@dataclass
+class Moments:
+    """
+    Média e variância (Welford) de uma medida das partidas.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: "Moments") -> "Moments":
+        if not other.count:
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        return self
+
+    @property
+    def variance(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    def interval(self, z: float = 1.96) -> float:
+        if self.count < 2:
+            return math.inf
+        return z * math.sqrt(self.variance / self.count)
+
+
+@dataclass
+class Accumulator:
+    """
+    Estatística das partidas calculada de forma incremental.
+
+    Cada resultado de Board.match é somado assim que chega e descartado,
+    então a memória não cresce com a quantidade de partidas.
+    Acumuladores de fatias diferentes podem ser combinados com merge.
+    """
+
+    matches: int = 0
+    timeouts: int = 0
+    rounds_mean: float = 0.0
+    rounds_m2: float = 0.0
+    wins: Dict[str, int] = field(
+        default_factory=lambda: {name: 0 for name in STRATEGIES}
+    )
+    """
+    profiling.Profile das partidas, quando a instrumentação está ligada.
+    """
+    profile: Any = field(default=None, repr=False, compare=False)
+    """
+    Registros empacotados (domain.records) das partidas, quando gravados.
+    Não são combinados por merge: Game.play grava no arquivo na ordem das fatias.
+    """
+    records: bytes = field(default=None, repr=False, compare=False)
+    """
+    Rastros (domain.event_trace) das partidas amostradas, quando gravados.
+    """
+    trace: bytes = field(default=None, repr=False, compare=False)
+    """
+    Com variáveis antitéticas (domain.variates), a média de rodadas de cada par;
+    com um baseline, as rodadas no baseline e a diferença (regras - baseline).
+    """
+    pairs: Moments = None
+    baseline: Moments = None
+    differences: Moments = None
+
+    def add(self, result: dict) -> None:
+        self.add_match(
+            rounds=result["rounds"],
+            timeout=bool(result["timeout"]),
+            behavior=result["winner"].behavior.name,
+        )
+
+    def add_match(self, rounds: int, timeout: bool, behavior: str) -> None:
+        # Welford's online mean/variance
+        self.matches += 1
+        self.timeouts += timeout
+        delta = rounds - self.rounds_mean
+        self.rounds_mean += delta / self.matches
+        self.rounds_m2 += delta * (rounds - self.rounds_mean)
+        self.wins[behavior] = self.wins.get(behavior, 0) + 1
+
+    def merge(self, other: "Accumulator") -> "Accumulator":
+        if not other.matches:
+            return self
+        matches = self.matches + other.matches
+        delta = other.rounds_mean - self.rounds_mean
+        self.rounds_mean += delta * other.matches / matches
+        self.rounds_m2 += (
+            other.rounds_m2 + delta * delta * self.matches * other.matches / matches
+        )
+        self.matches = matches
+        self.timeouts += other.timeouts
+        for behavior, wins in other.wins.items():
+            self.wins[behavior] = self.wins.get(behavior, 0) + wins
+        for name in PAIRED:
+            moments = getattr(other, name)
+            if moments is not None:
+                if getattr(self, name) is None:
+                    setattr(self, name, Moments())
+                getattr(self, name).merge(moments)
+        if other.profile is not None:
+            self.profile = (
+                other.profile
+                if self.profile is None
+                else self.profile.merge(other.profile)
+            )
+        return self
+
+    def to_dict(self) -> dict:
+        """
+        Estado para checkpoint (sem o profile).
+        """
+        return {
+            "matches": self.matches,
+            "timeouts": self.timeouts,
+            "rounds_mean": self.rounds_mean,
+            "rounds_m2": self.rounds_m2,
+            "wins": dict(self.wins),
+            **{
+                name: asdict(getattr(self, name))
+                for name in PAIRED
+                if getattr(self, name) is not None
+            },
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "Accumulator":
+        return Accumulator(
+            matches=data["matches"],
+            timeouts=data["timeouts"],
+            rounds_mean=data["rounds_mean"],
+            rounds_m2=data["rounds_m2"],
+            wins=dict(data["wins"]),
+            **{name: Moments(**data[name]) for name in PAIRED if name in data},
+        )
+
+    @property
+    def rounds_variance(self) -> float:
+        if self.matches < 2:
+            return 0.0
+        return self.rounds_m2 / (self.matches - 1)
+
+    @property
+    def rounds_stdev(self) -> float:
+        return math.sqrt(self.rounds_variance)
+
+    def rounds_interval(self, z: float = 1.96) -> float:
+        """
+        Meia largura do intervalo de confiança da média de rodadas.
+        Com pares antitéticos, calculada com a variância das médias dos pares.
+        """
+        if self.pairs is not None and self.pairs.count >= 2:
+            return self.pairs.interval(z)
+        if self.matches < 2:
+            return math.inf
+        return z * self.rounds_stdev / math.sqrt(self.matches)
+
+    @property
+    def antithetic_efficiency(self) -> float:
+        """
+        Quantas partidas independentes cada partida antitética vale na estimativa
+        da média de rodadas: Var(X) / (2 Var(média do par)).
+        """
+        if self.pairs is None or not self.pairs.variance:
+            return None
+        return self.rounds_variance / (2 * self.pairs.variance)
+
+    @property
+    def crn_efficiency(self) -> float:
+        """
+        Redução da variância da diferença para o baseline com números comuns:
+        (Var(X) + Var(Y)) / Var(X - Y), a razão em relação a partidas independentes.
+        """
+        if self.differences is None or not self.differences.variance:
+            return None
+        return (
+            self.rounds_variance + self.baseline.variance
+        ) / self.differences.variance
+
+    def win_interval(self, behavior: str, z: float = 1.96) -> float:
+        """
+        Meia largura (em pontos percentuais) do intervalo de confiança
+        de Agresti-Coull da porcentagem de vitórias do comportamento.
+        """
+        n = self.matches + z * z
+        p = (self.wins.get(behavior, 0) + z * z / 2) / n
+        return z * math.sqrt(p * (1 - p) / n) * 100
+
+    @property
+    def win_percentages(self) -> Dict[str, float]:
+        if not self.matches:
+            return {behavior: 0.0 for behavior in self.wins}
+        return {
+            behavior: wins / self.matches * 100 for behavior, wins in self.wins.items()
+        }
@@ -0,0 +1,228 @@
+from typing import List, Sequence, Union
+
+import numpy as np
+
+from monopoly import log
+from monopoly.domain.board import seated
+from monopoly.domain.player import STRATEGIES, PlayerFactory, Strategy
+from monopoly.domain.player.strategy import get
+from monopoly.domain.rules import DEFAULT_RULES, Rules
+
+logger = log.init_logger(__name__)
+
+NO_OWNER = -1
+
+
+def purchase_limits(
+    strategy: Strategy, sale_price: np.ndarray, rent_value: np.ndarray, rules: Rules
+) -> np.ndarray:
+    """
+    Strategy.limits para todos os tabuleiros do lote de uma vez.
+    """
+    min_rent, reserve, _ = strategy.resolve(rules)
+    limits = sale_price + max(reserve or 0.0, 0.0)
+    if min_rent is not None:
+        limits[rent_value <= min_rent] = np.inf
+    return limits
+
+
+def accepts(
+    strategy: Strategy,
+    balance: np.ndarray,
+    price: np.ndarray,
+    rent: np.ndarray,
+    rng: np.random.Generator,
+    rules: Rules,
+) -> np.ndarray:
+    """
+    Strategy.accepts para as compras que passaram dos limites.
+    """
+    valid = np.ones(balance.shape, dtype=bool)
+    _, _, probability = strategy.resolve(rules)
+    if probability is not None:
+        valid &= rng.random(size=balance.shape) < probability
+    if strategy.decide is not None:
+        valid &= np.broadcast_to(strategy.decide(balance, price, rent), balance.shape)
+    return valid
+
+
+class BatchBoard:
+    """
+    Joga N partidas ao mesmo tempo, com o estado de todos os tabuleiros em arrays.
+
+    Cada linha dos arrays é um tabuleiro e cada coluna um jogador (ou propriedade).
+    Os tabuleiros saem do lote assim que a partida termina.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        behaviors: Sequence[Union[Strategy, str]] = None,
+        rules: Rules = DEFAULT_RULES,
+        rng: np.random.Generator = None,
+    ):
+        """
+        behaviors, como em Board.create: estratégias registradas ou os seus nomes.
+        """
+        self.size = size
+        if behaviors is None:
+            behaviors = seated(rules.quantity_players)
+        self.behaviors = tuple(
+            get(behavior) if isinstance(behavior, str) else behavior
+            for behavior in behaviors
+        )
+        self.rules = rules
+        self.quantity_estates = rules.quantity_estates
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def match(self) -> List[dict]:
+        rng, rules = self.rng, self.rules
+        qtd_players = len(self.behaviors)
+        shape_players = (self.size, qtd_players)
+        shape_estates = (self.size, self.quantity_estates)
+
+        board_ids = np.arange(self.size)
+        position = np.zeros(shape_players, dtype=np.int64)
+        balance = np.full(shape_players, rules.balance, dtype=np.float64)
+        turns = np.zeros(shape_players, dtype=np.int64)
+        alive = np.ones(shape_players, dtype=bool)
+        # seat indexes: up to MAX_PLAYERS - 1, more than an int16 holds
+        owner = np.full(shape_estates, NO_OWNER, dtype=np.int32)
+        sale_price = rng.uniform(100, 150, size=shape_estates)
+        rent_value = rng.uniform(10, 60, size=shape_estates)
+        limits = [
+            purchase_limits(behavior, sale_price, rent_value, rules)
+            for behavior in self.behaviors
+        ]
+        rounds = np.zeros(self.size, dtype=np.int64)
+        # seats in order of bankruptcy, NO_OWNER (-1) for the remaining ones
+        bankruptcies = np.full(shape_players, NO_OWNER, dtype=np.int32)
+        qtd_losers = np.zeros(self.size, dtype=np.int64)
+
+        results = [None] * self.size
+        logger.warning("*** Batch of %d matches started ***", self.size)
+
+        while True:
+            # Same checks (and round counting) as Board.next_round
+            finished = (alive.sum(axis=1) <= 1) | (rounds >= rules.round_limit)
+
+            if finished.any():
+                for row in np.flatnonzero(finished):
+                    results[board_ids[row]] = self._result(
+                        rounds=int(rounds[row]),
+                        balance=balance[row],
+                        turns=turns[row],
+                        position=position[row],
+                        alive=alive[row],
+                        bankruptcies=bankruptcies[row, : qtd_losers[row]],
+                    )
+
+                keep = ~finished
+                board_ids = board_ids[keep]
+                position, balance, turns, alive = (
+                    position[keep],
+                    balance[keep],
+                    turns[keep],
+                    alive[keep],
+                )
+                owner, sale_price, rent_value = (
+                    owner[keep],
+                    sale_price[keep],
+                    rent_value[keep],
+                )
+                limits = [limit[keep] for limit in limits]
+                rounds = rounds[keep]
+                bankruptcies, qtd_losers = bankruptcies[keep], qtd_losers[keep]
+
+            if not board_ids.size:
+                break
+            rounds += 1
+            # a match ends as soon as one player is left, in the middle of the round
+            playing = np.ones(board_ids.size, dtype=bool)
+
+            # Flat views: row * qtd_players + seat, row * quantity_estates + estate
+            flat_position, flat_balance = position.ravel(), balance.ravel()
+            flat_turns, flat_owner = turns.ravel(), owner.ravel()
+            flat_sale_price, flat_rent_value = sale_price.ravel(), rent_value.ravel()
+
+            for seat, behavior in enumerate(self.behaviors):
+                rows = np.flatnonzero(alive[:, seat] & playing)
+                if not rows.size:
+                    continue
+                players = rows * qtd_players + seat
+
+                _new_position = flat_position[players] + rng.integers(
+                    1, 7, size=rows.size
+                )
+                full_turn = _new_position >= self.quantity_estates
+                spaces = _new_position % self.quantity_estates
+                flat_position[players] = spaces
+                flat_turns[players] += full_turn
+                funds = flat_balance[players] + full_turn * rules.lap_bonus
+
+                estates = rows * self.quantity_estates + spaces
+                current_owner = flat_owner[estates]
+
+                free = np.flatnonzero(current_owner == NO_OWNER)
+                valid = free[funds[free] >= limits[seat].ravel()[estates[free]]]
+                if not behavior.deterministic:
+                    valid = valid[
+                        accepts(
+                            behavior,
+                            funds[valid],
+                            flat_sale_price[estates[valid]],
+                            flat_rent_value[estates[valid]],
+                            rng,
+                            rules,
+                        )
+                    ]
+                flat_owner[estates[valid]] = seat
+                funds[valid] -= flat_sale_price[estates[valid]]
+
+                tenant = np.flatnonzero(
+                    (current_owner != NO_OWNER) & (current_owner != seat)
+                )
+                rent = flat_rent_value[estates[tenant]]
+                funds[tenant] -= rent
+                flat_balance[rows[tenant] * qtd_players + current_owner[tenant]] += rent
+                flat_balance[players] = funds
+
+                losers = rows[tenant[funds[tenant] < 0]]
+                if losers.size:
+                    alive[losers, seat] = False
+                    bankruptcies[losers, qtd_losers[losers]] = seat
+                    qtd_losers[losers] += 1
+                    released = owner[losers]
+                    released[released == seat] = NO_OWNER
+                    owner[losers] = released
+                    playing[losers] = alive[losers].sum(axis=1) > 1
+
+        logger.warning("*** End of batch of %d matches ***", self.size)
+        return results
+
+    def _result(self, rounds, balance, turns, position, alive, bankruptcies) -> dict:
+        """
+        ...o jogo termina ... com a vitória do jogador com mais saldo.
+        O critério de desempate é o mesmo de Board.get_winner.
+        """
+        seat = max(np.flatnonzero(alive), key=lambda s: (balance[s], turns[s], s))
+        winner = PlayerFactory.create(
+            behavior=self.behaviors[seat],
+            balance=float(balance[seat]),
+            _id=int(seat) + 1,
+            rules=self.rules,
+        )
+        winner.position = int(position[seat])
+        winner.turns = int(turns[seat])
+
+        return {
+            "timeout": int(alive.sum() > 1),
+            "rounds": rounds,
+            "winner": winner,
+            "balances": balance.tolist(),
+            "bankruptcies": bankruptcies.tolist(),
+            "behavior": {
+                name: int(winner.behavior is strategy)
+                for name, strategy in STRATEGIES.items()
+            },
+        }
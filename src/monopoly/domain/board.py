@@ -0,0 +1,369 @@
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Dict, List, Sequence, Union
+
+from monopoly import log, tracing
+from monopoly.domain.estate import Estate
+from monopoly.domain.player import STRATEGIES, PlayerFactory, Strategy
+from monopoly.domain.player.__player_abstract import PlayerAbstract
+from monopoly.domain.player.strategy import IMPULSIVE, PICKY, RANDOM, WARY
+from monopoly.domain.random_source import RandomSource, default_source
+from monopoly.domain.rules import DEFAULT_RULES, Rules
+
+logger = log.init_logger(__name__)
+
+BEHAVIORS = (IMPULSIVE, PICKY, WARY, RANDOM)
+ROUND_LIMIT = DEFAULT_RULES.round_limit
+
+
+seat = attrgetter("id")
+standing = attrgetter("balance", "turns", "id")
+"""
+Ordem de classificação: saldo, voltas completadas e, no empate, o último no turno.
+"""
+
+
+def seated(quantity: int, behaviors: Sequence[Strategy] = BEHAVIORS) -> List[Strategy]:
+    """
+    Comportamentos de quantity jogadores: os de behaviors, em rodízio de assentos.
+    """
+    return [behaviors[i % len(behaviors)] for i in range(quantity)]
+
+
+@dataclass()
+class Board:
+    players: List[PlayerAbstract]  # = field(default_factory=players_factory)
+    losers: List[PlayerAbstract] = field(default_factory=lambda: list())
+    """
+    Nesse jogo, o tabuleiro é composto por 20 propriedades em sequência.
+    """
+    estates: List[Estate] = field(default_factory=Estate.factory_estates)
+    rounds: int = 0
+    winner: PlayerAbstract = None
+    rng: RandomSource = field(default_factory=default_source, repr=False, compare=False)
+    rules: Rules = field(default=DEFAULT_RULES, repr=False, compare=False)
+    """
+    Índice de propriedades por jogador (id), mantido por purchase e take_estates.
+    """
+    owned: Dict[int, List[Estate]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    qtd_owned: int = field(default=0, init=False, repr=False, compare=False)
+    """
+    Perdedores que ainda estão em players: saem no fim da rodada (drop_losers).
+    """
+    pending: int = field(default=0, init=False, repr=False, compare=False)
+    """
+    Saldo mínimo de cada jogador (id) para comprar cada propriedade (purchase_limits).
+    """
+    limits: Dict[int, List[float]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @property
+    def qtd_players(self):
+        return len(self.players)
+
+    def qtd_estates_owned(self, player: PlayerAbstract) -> int:
+        return len(self.owned.get(player.id, ()))
+
+    @property
+    def all_estates_owned(self) -> bool:
+        return self.qtd_owned == len(self.estates)
+
+    def __post_init__(self):
+        self.limits = self.purchase_limits()
+        if tracing.ENABLED:
+            logger.debug("Created Board with (%d) estates", len(self.estates))
+
+    @classmethod
+    def create(
+        cls,
+        rng: RandomSource = None,
+        rules: Rules = DEFAULT_RULES,
+        behaviors: Sequence[Union[Strategy, str]] = None,
+    ):
+        """
+        Os jogadores sempre começam uma partida com saldo de 300 para cada um
+        (rules.balance).
+
+        Cada um dos jogadores tem uma implementação de comportamento diferente,
+        que dita as ações que eles vão tomar ao longo do jogo. Sem behaviors,
+        são rules.quantity_players jogadores com os comportamentos de BEHAVIORS
+        em rodízio (seated).
+        """
+        rng = rng or default_source()
+        if behaviors is None:
+            behaviors = seated(rules.quantity_players)
+        players = [
+            PlayerFactory.create(
+                _id=i, behavior=behavior, balance=rules.balance, rng=rng, rules=rules
+            )
+            for i, behavior in enumerate(behaviors, start=1)
+        ]
+        board = cls(
+            players=players,
+            estates=Estate.factory_estates(quantity=rules.quantity_estates, rng=rng),
+            rng=rng,
+            rules=rules,
+        )
+        if tracing.ENABLED:
+            [logger.info(p) for p in players]
+            logger.info("Created Board")
+        return board
+
+    def reset(self, rng: RandomSource = None) -> "Board":
+        """
+        Prepara o tabuleiro para uma nova partida com os mesmos objetos: os
+        jogadores voltam aos seus assentos com o saldo inicial e os preços e
+        aluguéis são sorteados de novo nas mesmas propriedades.
+
+        Com a mesma fonte, a partida é a mesma de Board.create.
+        """
+        rng = self.rng = rng or self.rng
+        self.drop_losers()
+        players, balance = self.players, self.rules.balance
+        players += self.losers
+        players.sort(key=seat)
+        self.losers.clear()
+        for player in players:
+            player.balance, player.position, player.turns = balance, 0, 0
+            player.rng = rng
+        Estate.redraw_estates(self.estates, rng=rng)
+        for estates in self.owned.values():
+            estates.clear()
+        self.qtd_owned = 0
+        self.rounds = 0
+        self.winner = None
+        # the purchase limits are computed by match
+        return self
+
+    def match(self):
+        logger.warning("*** Match started ***")
+
+        # players may have been changed after the board was created
+        self.limits = self.purchase_limits()
+        while self.next_round():
+            self.play_round()
+        self.get_winner()
+
+        logger.warning("*** End of match ***")
+
+        seats = sorted(self.players + self.losers, key=lambda p: p.id)
+        return {
+            "timeout": int(self.having_more_than_one_player()),
+            "rounds": self.rounds,
+            "winner": self.winner,
+            "balances": [p.balance for p in seats],
+            "bankruptcies": [p.id - 1 for p in self.losers],
+            "behavior": {
+                name: int(self.winner.behavior is strategy)
+                for name, strategy in STRATEGIES.items()
+            },
+        }
+
+    def play_round(self) -> None:
+        """
+        Uma jogada de cada jogador, na ordem de turno. A rodada (e a partida)
+        termina no momento em que sobra somente um jogador com saldo positivo.
+
+        O custo de uma jogada não depende do tamanho do tabuleiro nem da
+        quantidade de jogadores: os perdedores continuam em players até o fim
+        da rodada, e a lista é refeita uma vez só (drop_losers).
+        """
+        estates, rng, limits = self.estates, self.rng, self.limits
+        for player in self.players:
+            player.move_spaces(spaces=self.roll_dice(rng))
+
+            current_estate = estates[player.position]
+            if current_estate.owner is None:
+                valid = player.balance >= limits[player.id][player.position]
+                if valid and not player.behavior.deterministic:
+                    valid = player.behavior.accepts(player, current_estate)
+                self.purchase(player=player, estate=current_estate, valid=valid)
+            else:
+                self.pay_rent(player=player, estate=current_estate)
+
+            if player.balance_negative:
+                self.take_estates(player=player)
+                self.remove_player(player=player)
+                if not self.having_more_than_one_player():
+                    break
+        self.drop_losers()
+
+    def take_estates(self, player: PlayerAbstract) -> None:
+        """
+        Perde suas propriedades (e portanto podem ser compradas por qualquer outro jogador)
+        """
+        estates = self.owned.pop(player.id, ())
+        self.qtd_owned -= len(estates)
+        for __estate in estates:
+            __estate.owner = None
+            if tracing.ENABLED:
+                logger.info(
+                    "\tEstate %s has owner Player(id=%s) removed",
+                    __estate,
+                    player.id,
+                )
+
+    def remove_player(self, player: PlayerAbstract) -> None:
+        """
+        jogador que perde ... não joga mais
+
+        Sem procurar o jogador em players: ele sai da lista em drop_losers,
+        no fim da rodada.
+        """
+        self.losers.append(player)
+        self.pending += 1
+        if tracing.ENABLED:
+            logger.info("\tPlayer(id=%s) has removed from board", player.id)
+
+    def drop_losers(self) -> None:
+        """
+        Tira de players os perdedores pendentes, mantendo a ordem de turno:
+        uma passada pela lista por rodada com falências, qualquer que seja a
+        quantidade de falências.
+        """
+        if not self.pending:
+            return
+        # by identity: the players are dataclasses compared field by field
+        start = len(self.losers) - self.pending
+        out = {id(p) for p in self.losers[start:]}
+        self.players[:] = [p for p in self.players if id(p) not in out]
+        self.pending = 0
+
+    @staticmethod
+    def roll_dice(rng: RandomSource = None) -> int:
+        """
+        o jogador joga um dado equiprovável de 6 faces que determina quantas espaços no tabuleiro o jogador vai andar.
+        """
+        sided_number = (rng or default_source()).dice()
+        if tracing.ENABLED:
+            logger.debug("Roll dice sided number: %d", sided_number)
+        return sided_number
+
+    @staticmethod
+    def validate_purchase_general_rules(player: PlayerAbstract, estate: Estate) -> bool:
+        """
+        Jogadores só podem comprar propriedades caso ela não tenha dono e o jogador tenha o dinheiro da venda
+        """
+        return estate.owner is None and player.balance >= estate.sale_price
+
+    def _is_valid_purchase(self, player: PlayerAbstract, estate: Estate) -> bool:
+        return self.validate_purchase_general_rules(
+            player=player, estate=estate
+        ) and player.validate_purchase_behavioral_rules(estate=estate)
+
+    def purchase_limits(self) -> Dict[int, List[float]]:
+        """
+        Limites de compra de cada estratégia (Strategy.limits) para as
+        propriedades deste tabuleiro: calculados uma vez por partida e por
+        estratégia (os jogadores de mesma estratégia dividem a lista), a jogada
+        só compara o saldo com o limite da casa.
+        """
+        by_strategy, limits = {}, {}
+        for player in self.players:
+            key = (player.behavior, player.rules)
+            if key not in by_strategy:
+                by_strategy[key] = player.behavior.limits(self.estates, player.rules)
+            limits[player.id] = by_strategy[key]
+        return limits
+
+    def purchase(
+        self, player: PlayerAbstract, estate: Estate, valid: bool = None
+    ) -> bool:
+        """
+        valid é a decisão já tomada com os limites pré-calculados (play_round);
+        sem ela, as regras são verificadas para a propriedade.
+        """
+        if valid is None:
+            valid = self._is_valid_purchase(player, estate)
+        if valid:
+            estate.owner = player
+            player.balance -= estate.sale_price
+            self.owned.setdefault(player.id, []).append(estate)
+            self.qtd_owned += 1
+            if tracing.ENABLED:
+                logger.info(
+                    "\tPlayer(id=%s) purchase Estate(%.2f, %.2f). New Balance = %+.2f",
+                    player.id,
+                    estate.sale_price,
+                    estate.rent_value,
+                    player.balance,
+                )
+        elif tracing.ENABLED:
+            logger.info(
+                "\tPlayer(id=%s) did not buy. Balance = %+.2f",
+                player.id,
+                player.balance,
+            )
+        return valid
+
+    def pay_rent(self, player: PlayerAbstract, estate: Estate) -> bool:
+        if player.id is estate.owner.id:
+            if tracing.ENABLED:
+                logger.info(
+                    "\tPlayer(id=%s) already owner this estate. Balance = %+.2f",
+                    player.id,
+                    player.balance,
+                )
+            return False
+
+        player.balance -= estate.rent_value
+        estate.owner.balance += estate.rent_value
+        if tracing.ENABLED:
+            logger.info(
+                "\tTenant(id=%s) paid %.2f rent to Owner(id=%s). New Balance = %+.2f",
+                player.id,
+                estate.rent_value,
+                estate.owner.id,
+                player.balance,
+            )
+
+        return True
+
+    def has_winner(self) -> bool:
+        """
+        ...quando restar somente um jogador com saldo positivo
+        ...ou o jogo termina na milésima rodada
+        """
+        return not self.having_more_than_one_player() or not self.no_round_limit()
+
+    def having_more_than_one_player(self) -> bool:
+        """
+        Termina quando restar somente um jogador com saldo positivo, a qualquer momento da partida.
+        Esse jogador é declarado o vencedor.
+        """
+        return len(self.players) - self.pending > 1
+
+    def no_round_limit(self, limit_rounds: int = None) -> bool:
+        """
+        Caso o jogo demore muito...o jogo termina na milésima rodada (rules.round_limit)
+        """
+        return self.rounds < (limit_rounds or self.rules.round_limit)
+
+    def next_round(self) -> bool:
+        """
+        Começa a próxima rodada (rounds conta as rodadas começadas),
+        a menos que a partida já tenha terminado.
+        """
+        # same checks as has_winner, inlined: this runs once per round
+        if len(self.players) < 2:
+            return False
+        if self.rounds >= self.rules.round_limit:
+            logger.warning("The game has reached the limit of rounds (%d)", self.rounds)
+            return False
+        self.rounds += 1
+        if tracing.ENABLED:
+            logger.info("Round: %d", self.rounds)
+        return True
+
+    def get_winner(self) -> PlayerAbstract:
+        """
+        ...o jogo termina ... com a vitória do jogador com mais saldo.
+        O critério de desempate é a ordem de turno dos jogadores nesta partida.
+        Uma passada pelos jogadores no fim da partida, sem ordenar.
+        """
+        self.winner = max(self.players, key=standing)
+        logger.warning("*** THE WINNER IS: %s ***", self.winner)
+        return self.winner
@@ -0,0 +1,73 @@
+import json
+from dataclasses import asdict, dataclass
+
+from monopoly.atomic import write_atomic
+from monopoly.domain.accumulator import Accumulator
+from monopoly.domain.precision import Precision
+from monopoly.domain.rules import Rules
+from monopoly.domain.variates import Variates
+
+VERSION = 1
+
+
+@dataclass
+class Checkpoint:
+    """
+    Estado de um Game.play para continuar depois de uma interrupção.
+
+    Cada fatia tem a sua semente derivada da semente mestre, então o estado
+    dos geradores é apenas (seed, next_shard): as fatias que faltam são
+    jogadas exatamente como seriam sem a interrupção.
+    """
+
+    seed: int
+    engine: str
+    shard_size: int
+    number_of_runs: int
+    next_shard: int
+    statistic: Accumulator
+    rules: Rules
+    precision: Precision = None
+    records: str = None
+    variates: Variates = None
+
+    def to_dict(self) -> dict:
+        return {
+            "version": VERSION,
+            "seed": self.seed,
+            "engine": self.engine,
+            "shard_size": self.shard_size,
+            "number_of_runs": self.number_of_runs,
+            "next_shard": self.next_shard,
+            "statistic": self.statistic.to_dict(),
+            "rules": self.rules.to_dict(),
+            "precision": asdict(self.precision) if self.precision else None,
+            "records": self.records,
+            "variates": self.variates.to_dict() if self.variates else None,
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "Checkpoint":
+        if data.get("version") != VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {data.get('version')}")
+        precision, variates = data["precision"], data.get("variates")
+        return Checkpoint(
+            seed=data["seed"],
+            engine=data["engine"],
+            shard_size=data["shard_size"],
+            number_of_runs=data["number_of_runs"],
+            next_shard=data["next_shard"],
+            statistic=Accumulator.from_dict(data["statistic"]),
+            rules=Rules(**data["rules"]),
+            precision=Precision(**precision) if precision else None,
+            records=data.get("records"),
+            variates=Variates.from_dict(variates) if variates else None,
+        )
+
+    def save(self, path: str) -> None:
+        write_atomic(path, json.dumps(self.to_dict()).encode())
+
+    @staticmethod
+    def load(path: str) -> "Checkpoint":
+        with open(path) as file:
+            return Checkpoint.from_dict(json.load(file))
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+
+from monopoly import log
+from monopoly.domain.player.__player_abstract import PlayerAbstract
+from monopoly.domain.random_source import RandomSource, default_source
+from monopoly.domain.rules import DEFAULT_RULES
+
+logger = log.init_logger(__name__)
+
+
+@dataclass(slots=True)
+class Estate:
+    sale_price: float
+    rent_value: float
+    owner: PlayerAbstract = None
+
+    @property
+    def has_no_owner(self) -> bool:
+        return self.owner is None
+
+    @staticmethod
+    def factory_estates(
+        quantity: int = DEFAULT_RULES.quantity_estates, rng: RandomSource = None
+    ) -> list:
+        rng = rng or default_source()
+        return [
+            Estate(
+                sale_price=rng.uniform(100, 150),
+                rent_value=rng.uniform(10, 60),
+            )
+            for i in range(0, quantity)
+        ]
+
+    @staticmethod
+    def redraw_estates(estates: list, rng: RandomSource = None) -> list:
+        """
+        Mesmo sorteio de factory_estates, nos objetos já existentes (sem dono).
+        """
+        rng = rng or default_source()
+        uniform = rng.uniform
+        for estate in estates:
+            estate.sale_price = uniform(100, 150)
+            estate.rent_value = uniform(10, 60)
+            estate.owner = None
+        return estates
+
+    def add_owner(self, buyer: PlayerAbstract) -> bool:
+        if self.owner is not None:
+            self.owner = buyer
+            return True
+        return False
@@ -0,0 +1,467 @@
+"""
+Rastro binário dos eventos de uma partida e a sua reprodução.
+
+TracedBoard grava, durante Board.match, cada jogada (assento e valor do dado),
+compra, aluguel, falência e rodada em eventos de 7 bytes, junto com as
+propriedades sorteadas e, a cada SNAPSHOT_EVERY jogadas, uma foto do estado.
+
+MatchTrace reconstrói o estado do tabuleiro em qualquer jogada só com os
+eventos, sem usar o gerador de números aleatórios: parte da última foto
+anterior à jogada pedida e aplica os eventos seguintes.
+
+O arquivo começa com FILE_HEADER e os nomes das estratégias (como nos registros,
+domain.records): os comportamentos dos assentos são gravados pelo código.
+"""
+
+import mmap
+import os
+import struct
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from monopoly.domain.board import Board
+from monopoly.domain.estate import Estate
+from monopoly.domain.player import PlayerAbstract, PlayerFactory
+from monopoly.domain.records import BEHAVIOR_CODES, behavior_names, behaviors_of
+from monopoly.domain.rules import Rules
+
+MAGIC = b"MNPLTRC\x00"
+VERSION = 1
+# magic, version and the size of the strategy names that follow
+FILE_HEADER = struct.Struct("<8sHI")
+# block size, match index, shard seed, shard start, seats, estates,
+# snapshot every, balance, lap bonus, round limit
+MATCH = struct.Struct("<IQQQHIIddI")
+# the start of MATCH: block size and match index
+BLOCK = struct.Struct("<IQ")
+COUNTS = struct.Struct("<II")
+# kind, seat, argument (dice, estate or rounds)
+EVENT = struct.Struct("<BHI")
+MOVE, PURCHASE, RENT, BANKRUPTCY, ROUND, END = range(6)
+NO_OWNER = -1
+SNAPSHOT_EVERY = 256
+
+
+def snapshot_struct(seats: int, quantity_estates: int) -> struct.Struct:
+    """
+    step, índice do evento, rodadas, posições, voltas, saldos, ativos e donos.
+    """
+    return struct.Struct(f"<III{seats}I{seats}I{seats}d{seats}B{quantity_estates}i")
+
+
+@dataclass
+class Sampling:
+    """
+    Quais partidas são gravadas: uma a cada `every` (pelo índice da partida)
+    e, com only_timeouts, só as que terminam por time out.
+    """
+
+    every: int = 1
+    only_timeouts: bool = False
+
+    def selects(self, match: int) -> bool:
+        return match % self.every == 0
+
+    def keeps(self, result: dict) -> bool:
+        return not self.only_timeouts or bool(result["timeout"])
+
+
+@dataclass
+class TracedBoard(Board):
+    """
+    Board que grava os eventos da partida (ver Board.create).
+    """
+
+    match_index: int = 0
+    shard_seed: int = 0
+    shard_start: int = 0
+    snapshot_every: int = SNAPSHOT_EVERY
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.seats = sorted(self.players, key=lambda p: p.id)
+        self.events = bytearray()
+        self.snapshots = bytearray()
+        self.snapshot_layout = snapshot_struct(len(self.seats), len(self.estates))
+        self.moves = 0
+        self._dice = 0
+
+    def _emit(self, kind: int, seat: int, argument: int = 0) -> None:
+        self.events += EVENT.pack(kind, seat, argument)
+
+    def _snapshot(self) -> None:
+        losers = {p.id for p in self.losers}
+        self.snapshots += self.snapshot_layout.pack(
+            self.moves,
+            len(self.events) // EVENT.size,
+            self.rounds,
+            *(p.position for p in self.seats),
+            *(p.turns for p in self.seats),
+            *(p.balance for p in self.seats),
+            *(p.id not in losers for p in self.seats),
+            *(NO_OWNER if e.owner is None else e.owner.id - 1 for e in self.estates),
+        )
+
+    def roll_dice(self, rng=None) -> int:
+        # the state before a move is complete: previous bankruptcies and rounds included
+        if self.moves % self.snapshot_every == 0:
+            self._snapshot()
+        self.moves += 1
+        self._dice = Board.roll_dice(rng)
+        return self._dice
+
+    def purchase(
+        self, player: PlayerAbstract, estate: Estate, valid: bool = None
+    ) -> bool:
+        self._emit(MOVE, player.id - 1, self._dice)
+        bought = super().purchase(player=player, estate=estate, valid=valid)
+        if bought:
+            self._emit(PURCHASE, player.id - 1, player.position)
+        return bought
+
+    def pay_rent(self, player: PlayerAbstract, estate: Estate) -> bool:
+        self._emit(MOVE, player.id - 1, self._dice)
+        paid = super().pay_rent(player=player, estate=estate)
+        if paid:
+            self._emit(RENT, player.id - 1, player.position)
+        return paid
+
+    def take_estates(self, player: PlayerAbstract) -> None:
+        self._emit(BANKRUPTCY, player.id - 1)
+        super().take_estates(player=player)
+
+    def next_round(self) -> bool:
+        started = super().next_round()
+        if started:
+            self._emit(ROUND, 0, self.rounds)
+        return started
+
+    def match(self):
+        result = super().match()
+        self._emit(END, self.winner.id - 1, self.rounds)
+        return result
+
+    def trace(self) -> bytes:
+        """
+        Bloco binário da partida, para ser gravado por TraceWriter.
+        """
+        body = b"".join(
+            (
+                bytes(BEHAVIOR_CODES.index(p.behavior) for p in self.seats),
+                struct.pack(
+                    f"<{len(self.estates)}d{len(self.estates)}d",
+                    *(e.sale_price for e in self.estates),
+                    *(e.rent_value for e in self.estates),
+                ),
+                COUNTS.pack(
+                    len(self.events) // EVENT.size,
+                    len(self.snapshots) // self.snapshot_layout.size,
+                ),
+                self.events,
+                self.snapshots,
+            )
+        )
+        return (
+            MATCH.pack(
+                MATCH.size + len(body),
+                self.match_index,
+                self.shard_seed,
+                self.shard_start,
+                len(self.seats),
+                len(self.estates),
+                self.snapshot_every,
+                self.rules.balance,
+                self.rules.lap_bonus,
+                self.rules.round_limit,
+            )
+            + body
+        )
+
+
+@dataclass
+class BoardState:
+    """
+    Estado do tabuleiro antes da jogada `step` + 1 (depois de `step` jogadas).
+    """
+
+    step: int
+    rounds: int
+    positions: List[int]
+    turns: List[int]
+    balances: List[float]
+    alive: List[bool]
+    owners: List[int]
+    winner: Optional[int] = None
+    event: int = field(default=0, repr=False)
+
+
+@dataclass
+class MatchTrace:
+    """
+    shard_seed é a semente da fatia (Shard.seed), não da partida: as partidas de
+    uma fatia usam a mesma fonte em sequência, e a partida só é reproduzida
+    jogando a fatia desde a partida shard_start (sem Variates, que tem uma
+    fonte por partida).
+    """
+
+    match: int
+    shard_seed: int
+    shard_start: int
+    rules: Rules
+    behaviors: list
+    prices: Tuple[float, ...]
+    rents: Tuple[float, ...]
+    snapshot_every: int
+    events: memoryview = field(repr=False)
+    snapshots: memoryview = field(repr=False)
+
+    @staticmethod
+    def parse(block: memoryview, behaviors: Sequence = BEHAVIOR_CODES) -> "MatchTrace":
+        """
+        behaviors: as estratégias dos códigos, as do arquivo (TraceFile).
+        """
+        (
+            _,
+            match,
+            shard_seed,
+            shard_start,
+            seats,
+            quantity_estates,
+            snapshot_every,
+            balance,
+            lap_bonus,
+            round_limit,
+        ) = MATCH.unpack_from(block)
+        offset, end_behaviors = MATCH.size, MATCH.size + seats
+        seated = [behaviors[code] for code in block[offset:end_behaviors]]
+        offset = end_behaviors
+        estates = struct.unpack_from(f"<{quantity_estates * 2}d", block, offset)
+        offset += quantity_estates * 16
+        qtd_events, _ = COUNTS.unpack_from(block, offset)
+        offset += COUNTS.size
+        end_events = offset + qtd_events * EVENT.size
+        return MatchTrace(
+            match=match,
+            shard_seed=shard_seed,
+            shard_start=shard_start,
+            rules=Rules(
+                balance=balance,
+                quantity_estates=quantity_estates,
+                quantity_players=seats,
+                lap_bonus=lap_bonus,
+                round_limit=round_limit,
+            ),
+            behaviors=seated,
+            prices=estates[:quantity_estates],
+            rents=estates[quantity_estates:],
+            snapshot_every=snapshot_every,
+            events=block[offset:end_events],
+            snapshots=block[end_events:],
+        )
+
+    @property
+    def seats(self) -> int:
+        return len(self.behaviors)
+
+    def iter_events(self, start: int = 0) -> Iterator[Tuple[int, int, int]]:
+        offset = start * EVENT.size
+        return EVENT.iter_unpack(self.events[offset:])
+
+    @property
+    def steps(self) -> int:
+        return sum(1 for kind, _, _ in self.iter_events() if kind == MOVE)
+
+    def initial_state(self) -> BoardState:
+        seats = self.seats
+        return BoardState(
+            step=0,
+            rounds=0,
+            positions=[0] * seats,
+            turns=[0] * seats,
+            balances=[self.rules.balance] * seats,
+            alive=[True] * seats,
+            owners=[NO_OWNER] * len(self.prices),
+        )
+
+    def snapshot(self, step: int) -> BoardState:
+        """
+        Foto gravada mais próxima antes da jogada `step`.
+        """
+        layout = snapshot_struct(self.seats, len(self.prices))
+        index = min(step // self.snapshot_every, len(self.snapshots) // layout.size - 1)
+        if index < 0:
+            return self.initial_state()
+        values = iter(layout.unpack_from(self.snapshots, index * layout.size))
+        seats = self.seats
+        return BoardState(
+            step=next(values),
+            event=next(values),
+            rounds=next(values),
+            positions=list(islice(values, seats)),
+            turns=list(islice(values, seats)),
+            balances=list(islice(values, seats)),
+            alive=[bool(v) for v in islice(values, seats)],
+            owners=list(values),
+        )
+
+    def state(self, step: int = None, use_snapshots: bool = True) -> BoardState:
+        """
+        Estado depois de `step` jogadas (None: final da partida).
+        """
+        if step is None:
+            state = self.initial_state()
+        elif use_snapshots:
+            state = self.snapshot(step)
+        else:
+            state = self.initial_state()
+
+        for kind, seat, argument in self.iter_events(state.event):
+            if kind == MOVE and state.step == step:
+                break
+            self._apply(state, kind, seat, argument)
+            state.event += 1
+        return state
+
+    def _apply(self, state: BoardState, kind: int, seat: int, argument: int) -> None:
+        if kind == MOVE:
+            quantity_estates = self.rules.quantity_estates
+            position = state.positions[seat] + argument
+            state.positions[seat] = position % quantity_estates
+            if position >= quantity_estates:
+                state.turns[seat] += 1
+                state.balances[seat] += self.rules.lap_bonus
+            state.step += 1
+        elif kind == PURCHASE:
+            state.owners[argument] = seat
+            state.balances[seat] -= self.prices[argument]
+        elif kind == RENT:
+            state.balances[seat] -= self.rents[argument]
+            state.balances[state.owners[argument]] += self.rents[argument]
+        elif kind == BANKRUPTCY:
+            state.alive[seat] = False
+            state.owners = [
+                NO_OWNER if owner == seat else owner for owner in state.owners
+            ]
+        elif kind == ROUND:
+            state.rounds = argument
+        elif kind == END:
+            state.winner = seat
+
+    def board(self, step: int = None) -> Board:
+        """
+        Board montado com o estado depois de `step` jogadas.
+        """
+        state = self.state(step)
+        players = []
+        for seat, behavior in enumerate(self.behaviors):
+            player = PlayerFactory.create(
+                behavior=behavior,
+                balance=state.balances[seat],
+                _id=seat + 1,
+                rules=self.rules,
+            )
+            player.position = state.positions[seat]
+            player.turns = state.turns[seat]
+            players.append(player)
+
+        estates = [
+            Estate(sale_price=price, rent_value=rent)
+            for price, rent in zip(self.prices, self.rents)
+        ]
+        board = Board(
+            players=[p for p, alive in zip(players, state.alive) if alive],
+            losers=[p for p, alive in zip(players, state.alive) if not alive],
+            estates=estates,
+            rounds=state.rounds,
+            rules=self.rules,
+        )
+        for estate, owner in zip(estates, state.owners):
+            if owner != NO_OWNER:
+                estate.owner = players[owner]
+                board.owned.setdefault(owner + 1, []).append(estate)
+                board.qtd_owned += 1
+        if state.winner is not None:
+            board.winner = players[state.winner]
+        return board
+
+
+class TraceWriter:
+    """
+    Acrescenta os blocos das partidas ao arquivo.
+
+    Com matches, o arquivo existente é cortado antes da primeira partida de
+    índice matches ou mais (retomada de um checkpoint); sem, ou sem o arquivo,
+    é criado.
+    """
+
+    def __init__(self, path: str, matches: int = None):
+        if matches is None or not os.path.exists(path):
+            self.file = open(path, "wb")
+            names = behavior_names()
+            self.file.write(FILE_HEADER.pack(MAGIC, VERSION, len(names)) + names)
+        else:
+            self.file = open(path, "r+b")
+            self.file.truncate(self._end(path, matches))
+            self.file.seek(0, os.SEEK_END)
+
+    def _end(self, path: str, matches: int) -> int:
+        """
+        Fim do último bloco completo de uma partida anterior a matches.
+        """
+        data = self.file.read(FILE_HEADER.size)
+        if len(data) < FILE_HEADER.size:
+            raise ValueError(f"{path} is not a match trace file")
+        magic, version, size = FILE_HEADER.unpack(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a match trace file (version {VERSION})")
+        end = FILE_HEADER.size + size
+        length = os.fstat(self.file.fileno()).st_size
+        while end + BLOCK.size <= length:
+            self.file.seek(end)
+            size, match = BLOCK.unpack(self.file.read(BLOCK.size))
+            if match >= matches or end + size > length:
+                break
+            end += size
+        return end
+
+    def write(self, data: bytes) -> None:
+        self.file.write(data)
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class TraceFile:
+    """
+    Leitura das partidas de um arquivo de rastro (mapeado em memória).
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self.data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        if len(self.data) < FILE_HEADER.size:
+            raise ValueError(f"{path} is not a match trace file")
+        magic, version, size = FILE_HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a match trace file (version {VERSION})")
+        (names,) = struct.unpack_from(f"{size}s", self.data, FILE_HEADER.size)
+        self.behaviors = behaviors_of(names)
+        self.offset = FILE_HEADER.size + size
+
+    def __iter__(self) -> Iterator[MatchTrace]:
+        offset = self.offset
+        while offset < len(self.data):
+            (size,) = struct.unpack_from("<I", self.data, offset)
+            end = offset + size
+            yield MatchTrace.parse(self.data[offset:end], self.behaviors)
+            offset = end
+
+    def find(self, match: int) -> MatchTrace:
+        for trace in self:
+            if trace.match == match:
+                return trace
+        raise KeyError(match)
@@ -0,0 +1,559 @@
+import hashlib
+import logging
+import secrets
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Sequence, Tuple
+
+from monopoly import config, log
+from monopoly.domain.accumulator import Accumulator, Moments
+from monopoly.domain.board import Board
+from monopoly.domain.checkpoint import Checkpoint
+from monopoly.domain.event_trace import Sampling, TracedBoard, TraceWriter
+from monopoly.domain.precision import Precision
+from monopoly.domain.progress import Progress
+from monopoly.domain.random_source import RandomSource
+from monopoly.domain.records import RecordBuffer, RecordWriter
+from monopoly.domain.rules import DEFAULT_RULES, Rules
+from monopoly.domain.variates import Variates
+
+logger = log.init_logger("main.py")
+
+IN_FLIGHT_PER_WORKER = 2
+"""
+Fatias enviadas ao pool por worker antes de a primeira voltar.
+"""
+
+
+@dataclass(frozen=True)
+class Shard:
+    """
+    Fatia das partidas de um Game, com a sua própria semente.
+
+    O tamanho das fatias não depende da quantidade de workers,
+    então o resultado é o mesmo com 1 ou N processos.
+    """
+
+    index: int
+    start: int
+    size: int
+    seed: int
+    master_seed: int = None
+
+    @staticmethod
+    def derive_seed(master_seed: int, index: int) -> int:
+        digest = hashlib.sha256(f"{master_seed}:{index}".encode()).digest()
+        return int.from_bytes(digest[:8], "big")
+
+    @staticmethod
+    def split(number_of_runs: int, size: int, master_seed: int) -> List["Shard"]:
+        return list(Shard.stream(number_of_runs, size, master_seed))
+
+    @staticmethod
+    def stream(
+        number_of_runs: int, size: int, master_seed: int, first: int = 0
+    ) -> Iterator["Shard"]:
+        """
+        As mesmas fatias de split, a partir da fatia first, criadas sob demanda.
+        """
+        for start in range(first * size, number_of_runs, size):
+            index = start // size
+            yield Shard(
+                index=index,
+                start=start,
+                size=min(size, number_of_runs - start),
+                seed=Shard.derive_seed(master_seed, index),
+                master_seed=master_seed,
+            )
+
+
+def play_shard(
+    engine: str,
+    shard: Shard,
+    profile: bool = False,
+    rules: Rules = DEFAULT_RULES,
+    record: bool = False,
+    trace: Sampling = None,
+    variates: Variates = None,
+    reuse_boards: bool = True,
+) -> Accumulator:
+    """
+    Com record, os registros das partidas (domain.records) voltam em statistic.records;
+    com trace, os rastros das partidas amostradas (domain.event_trace) em statistic.trace;
+    com variates, cada partida usa a sua própria fonte (domain.variates);
+    com reuse_boards, as partidas da fatia reaproveitam o mesmo tabuleiro (Board.reset).
+    """
+    records = RecordBuffer(seats=rules.quantity_players) if record else None
+    if engine == "batch":
+        statistic = _play_shard_batch(shard, rules, records)
+    elif profile:
+        from monopoly import profiling
+
+        profiling.start()
+        statistic = _play_shard_object(
+            shard, rules, records, trace, variates, reuse_boards
+        )
+        statistic.profile = profiling.stop()
+    else:
+        statistic = _play_shard_object(
+            shard, rules, records, trace, variates, reuse_boards
+        )
+    if records is not None:
+        statistic.records = bytes(records.data)
+    return statistic
+
+
+def _play_shard_object(
+    shard: Shard,
+    rules: Rules,
+    records: RecordBuffer = None,
+    trace: Sampling = None,
+    variates: Variates = None,
+    reuse_boards: bool = True,
+) -> Accumulator:
+
+    rng = RandomSource(seed=shard.seed)
+    # the baseline match must not reset the board of the result still in use
+    pool, baseline_pool = ({}, {}) if reuse_boards else (None, None)
+    statistic = Accumulator()
+    if variates is not None and variates.antithetic:
+        statistic.pairs = Moments()
+    if variates is not None and variates.baseline is not None:
+        statistic.baseline, statistic.differences = Moments(), Moments()
+    previous = None
+    traces = bytearray()
+    for i in range(shard.start, shard.start + shard.size):
+        logger.warning("*** Started the Game (%d) ***", i)
+
+        if variates is not None:
+            rng = variates.source(shard.master_seed, i)
+        traced = trace is not None and trace.selects(i)
+        if traced:
+            board = TracedBoard.create(rng=rng, rules=rules)
+            board.match_index = i
+            board.shard_seed, board.shard_start = shard.seed, shard.start
+        else:
+            board = _board(pool, rng, rules)
+        result = board.match()
+        statistic.add(result)
+        if variates is not None:
+            _add_variates(
+                statistic, variates, shard, i, result["rounds"], previous, baseline_pool
+            )
+            previous = result["rounds"]
+        if records is not None:
+            records.add(result)
+        if traced and trace.keeps(result):
+            traces += board.trace()
+
+        _log_resume(board, i)
+    if trace is not None:
+        statistic.trace = bytes(traces)
+    return statistic
+
+
+def _add_variates(
+    statistic: Accumulator,
+    variates: Variates,
+    shard: Shard,
+    i: int,
+    rounds: int,
+    previous: int = None,
+    pool: dict = None,
+) -> None:
+    """
+    previous: rodadas da partida anterior, o primeiro do par antitético de i;
+    pool: tabuleiros reaproveitados pelas partidas do baseline (_board).
+    """
+    if variates.antithetic and i % 2 and previous is not None:
+        statistic.pairs.add((previous + rounds) / 2)
+    if variates.baseline is not None:
+        baseline = _board(
+            pool, variates.source(shard.master_seed, i), variates.baseline
+        ).match()["rounds"]
+        statistic.baseline.add(baseline)
+        statistic.differences.add(rounds - baseline)
+
+
+def _board(pool: dict, rng: RandomSource, rules: Rules) -> Board:
+    """
+    Tabuleiro da próxima partida. Com pool, o tabuleiro de cada regra é criado
+    uma vez e reaproveitado (Board.reset); o resultado da partida anterior
+    (o vencedor) não pode mais ser usado depois disso.
+    """
+    if pool is None:
+        return Board.create(rng=rng, rules=rules)
+    board = pool.get(rules)
+    if board is None:
+        board = pool[rules] = Board.create(rng=rng, rules=rules)
+        return board
+    return board.reset(rng=rng)
+
+
+def play_shard_points(
+    shard: Shard, rules: Sequence[Rules], variates: Variates, reuse_boards: bool = True
+) -> List[Tuple[Accumulator, float]]:
+    """
+    Partidas da fatia com cada uma das regras e as mesmas fontes (números
+    aleatórios comuns): a partida i das primeiras regras, o baseline, é jogada
+    uma vez e comparada com a partida i das demais. Para cada regra, o
+    acumulador e os segundos gastos.
+    """
+    pool = {} if reuse_boards else None
+    statistics = [Accumulator() for _ in rules]
+    seconds = [0.0] * len(rules)
+    for index, statistic in enumerate(statistics):
+        if variates.antithetic:
+            statistic.pairs = Moments()
+        if index:
+            statistic.baseline, statistic.differences = Moments(), Moments()
+    previous = [None] * len(rules)
+    for i in range(shard.start, shard.start + shard.size):
+        baseline = None
+        for index, statistic in enumerate(statistics):
+            start = time.perf_counter()
+            result = _board(
+                pool, variates.source(shard.master_seed, i), rules[index]
+            ).match()
+            statistic.add(result)
+            rounds = result["rounds"]
+            if variates.antithetic and i % 2 and previous[index] is not None:
+                statistic.pairs.add((previous[index] + rounds) / 2)
+            previous[index] = rounds
+            if baseline is None:
+                baseline = rounds
+            else:
+                statistic.baseline.add(baseline)
+                statistic.differences.add(rounds - baseline)
+            seconds[index] += time.perf_counter() - start
+    return list(zip(statistics, seconds))
+
+
+def in_order(function: Callable, calls: Iterator[tuple], workers: int = 1) -> Iterator:
+    """
+    function(*arguments) de cada item de calls, na ordem. Com workers, em um
+    pool com só IN_FLIGHT_PER_WORKER chamadas por worker em andamento: a
+    memória não cresce com a quantidade de chamadas.
+    """
+    if workers <= 1:
+        for arguments in calls:
+            yield function(*arguments)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    futures = deque()
+
+    def submit() -> None:
+        arguments = next(calls, None)
+        if arguments is not None:
+            futures.append(executor.submit(function, *arguments))
+
+    try:
+        for _ in range(workers * IN_FLIGHT_PER_WORKER):
+            submit()
+        while futures:
+            result = futures.popleft().result()
+            # keep the workers busy while the result is used
+            submit()
+            yield result
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _play_shard_batch(
+    shard: Shard, rules: Rules, records: RecordBuffer = None
+) -> Accumulator:
+    """
+    Executa as partidas da fatia no motor vetorizado (requer numpy).
+    """
+    import numpy as np
+
+    from monopoly.domain.batch import BatchBoard
+
+    statistic = Accumulator()
+    board = BatchBoard(
+        size=shard.size, rules=rules, rng=np.random.default_rng(shard.seed)
+    )
+    for result in board.match():
+        statistic.add(result)
+        if records is not None:
+            records.add(result)
+    return statistic
+
+
+def _log_resume(board, i):
+    if not logger.isEnabledFor(logging.WARNING):
+        return
+    logger.warning("==== Result of Game (%d) with %d rounds ====", i, board.rounds)
+    players = sorted(board.players + board.losers, key=lambda player: player.id)
+    for p in players:
+        logger.warning(
+            "Player(id=%s, rounds=%4d, balance=%+10.2f, behavior=%s)",
+            p.id,
+            p.turns,
+            p.balance,
+            p.behavior,
+        )
+    logger.warning("*** End the Game (%d) ***\n", i)
+
+
+class Game:
+    statistic: Accumulator
+    engine: str
+    workers: int
+    seed: int
+    shard_size: int
+    profile: bool
+    rules: Rules
+    precision: Precision
+    checkpoint: str
+    checkpoint_interval: float
+    records: str
+    trace: str
+    trace_sampling: Sampling
+    variates: Variates
+    reuse_boards: bool
+    progress: Progress
+    next_shard: int
+
+    def __init__(
+        self,
+        engine: str = None,
+        workers: int = None,
+        seed: int = None,
+        shard_size: int = None,
+        profile: bool = None,
+        rules: Rules = None,
+        checkpoint: str = None,
+        checkpoint_interval: float = None,
+        records: str = None,
+        trace: str = None,
+        trace_sampling: Sampling = None,
+        variates: Variates = None,
+        reuse_boards: bool = None,
+        progress: Progress = None,
+    ):
+        """
+        Os parâmetros não informados são lidos de config no momento da criação;
+        "" (checkpoint, records, trace) e progress=False desligam o que o
+        ambiente ligaria.
+        """
+        engine = engine or config.ENGINE
+        seed = seed if seed is not None else config.SEED
+        trace = trace if trace is not None else config.TRACE
+        self.statistic = Accumulator()
+        self.engine = engine
+        self.workers = workers or config.WORKERS
+        self.profile = profile if profile is not None else config.PROFILE
+        self.rules = rules or Rules.from_config()
+        self.precision = None
+        self.seed = seed if seed is not None else secrets.randbits(64)
+        self.shard_size = shard_size or (
+            config.BATCH_SIZE if engine == "batch" else config.SHARD_SIZE
+        )
+        self.checkpoint = checkpoint if checkpoint is not None else config.CHECKPOINT
+        self.checkpoint_interval = (
+            checkpoint_interval
+            if checkpoint_interval is not None
+            else config.CHECKPOINT_INTERVAL
+        )
+        self.records = records if records is not None else config.RECORDS
+        self._records_writer = None
+        if trace and engine == "batch":
+            raise ValueError("The match trace is only available for the object engine")
+        self.trace = trace
+        self.trace_sampling = trace_sampling or Sampling(
+            every=config.TRACE_EVERY, only_timeouts=config.TRACE_ONLY_TIMEOUTS
+        )
+        self._trace_writer = None
+        self.variates = variates if variates is not None else Variates.from_config()
+        if self.variates is not None and engine == "batch":
+            raise ValueError(
+                "Variance reduction is only available for the object engine"
+            )
+        if self.variates is not None and self.variates.antithetic:
+            # both matches of a pair in the same shard
+            self.shard_size += self.shard_size % 2
+        self.reuse_boards = (
+            reuse_boards if reuse_boards is not None else config.REUSE_BOARDS
+        )
+        self.progress = progress if progress is not None else Progress.from_config()
+        self.next_shard = 0
+        self._checkpoint_at = time.monotonic()
+
+    @staticmethod
+    def resume(path: str, workers: int = None) -> "Game":
+        """
+        Continua um Game.play (ou play_adaptive) a partir do checkpoint gravado em path.
+        Com a mesma semente, o resultado final é o mesmo de uma execução sem interrupção.
+        """
+        checkpoint = Checkpoint.load(path)
+        game = Game(
+            engine=checkpoint.engine,
+            workers=workers,
+            seed=checkpoint.seed,
+            shard_size=checkpoint.shard_size,
+            profile=False,
+            rules=checkpoint.rules,
+            checkpoint=path,
+            # "" keeps RECORDS from the environment out of a game recorded without it
+            records=checkpoint.records or "",
+            variates=checkpoint.variates,
+        )
+        game.statistic = checkpoint.statistic
+        game.next_shard = checkpoint.next_shard
+        logger.warning(
+            "Resuming from %s: %d matches, next shard %d",
+            path,
+            game.statistic.matches,
+            game.next_shard,
+        )
+
+        if checkpoint.precision is not None:
+            game.play_adaptive(checkpoint.precision)
+        else:
+            game.play(number_of_runs=checkpoint.number_of_runs)
+        return game
+
+    def play(self, number_of_runs: int = None):
+        start = time.perf_counter_ns()
+        number_of_runs = number_of_runs or config.NUMBER_OF_RUNS
+
+        with self._recording(), self._progress(number_of_runs):
+            for statistic in self._play_shards(number_of_runs):
+                self._merge(statistic, number_of_runs)
+            self._save_checkpoint(number_of_runs, force=True)
+
+        self.__profile_game(start)
+
+    def play_adaptive(self, precision: Precision):
+        """
+        Joga fatia por fatia até que os intervalos de confiança fiquem
+        abaixo da precisão desejada, ou até precision.max_runs partidas.
+
+        A verificação é feita na ordem das fatias, então o ponto de parada
+        é o mesmo com qualquer quantidade de workers.
+        """
+        start = time.perf_counter_ns()
+        self.precision = precision
+
+        # a resumed game may have converged before it was interrupted
+        with self._recording(), self._progress(precision.max_runs):
+            if not (self.next_shard and precision.reached(self.statistic)):
+                statistics = self._play_shards(precision.max_runs)
+                for statistic in statistics:
+                    self._merge(statistic, precision.max_runs)
+                    if precision.reached(self.statistic):
+                        break
+                statistics.close()
+            self._save_checkpoint(precision.max_runs, force=True)
+
+        self.__profile_game(start)
+
+    @contextmanager
+    def _recording(self):
+        """
+        Abre os arquivos de registros e de rastro durante o play; na retomada
+        de um checkpoint, os dois são cortados na quantidade de partidas já
+        acumuladas.
+        """
+        if self.records:
+            self._records_writer = RecordWriter(
+                self.records,
+                seats=self.rules.quantity_players,
+                matches=self.statistic.matches if self.next_shard else None,
+            )
+        if self.trace:
+            self._trace_writer = TraceWriter(
+                self.trace, matches=self.statistic.matches if self.next_shard else None
+            )
+        try:
+            yield
+        finally:
+            if self._records_writer is not None:
+                self._records_writer.close()
+                self._records_writer = None
+            if self._trace_writer is not None:
+                self._trace_writer.close()
+                self._trace_writer = None
+
+    @contextmanager
+    def _progress(self, number_of_runs: int):
+        """
+        Relatório de progresso durante o play (atualizado em _merge, uma vez
+        por fatia); o total do play_adaptive é precision.max_runs.
+        """
+        if self.progress:
+            self.progress.start(self.statistic, total=number_of_runs)
+        try:
+            yield
+        finally:
+            if self.progress:
+                self.progress.finish(self.statistic)
+
+    def _merge(self, statistic: Accumulator, number_of_runs: int) -> None:
+        if self._records_writer is not None:
+            self._records_writer.write(statistic.records)
+            statistic.records = None
+        if self._trace_writer is not None:
+            self._trace_writer.write(statistic.trace)
+            statistic.trace = None
+        self.statistic.merge(statistic)
+        self.next_shard += 1
+        if self.progress:
+            self.progress.update(self.statistic)
+        self._save_checkpoint(number_of_runs)
+
+    def _save_checkpoint(self, number_of_runs: int, force: bool = False) -> None:
+        if not self.checkpoint:
+            return
+        now = time.monotonic()
+        if not force and now - self._checkpoint_at < self.checkpoint_interval:
+            return
+        self._checkpoint_at = now
+        if self._records_writer is not None:
+            self._records_writer.flush()
+        if self._trace_writer is not None:
+            self._trace_writer.flush()
+        Checkpoint(
+            seed=self.seed,
+            engine=self.engine,
+            shard_size=self.shard_size,
+            number_of_runs=number_of_runs,
+            next_shard=self.next_shard,
+            statistic=self.statistic,
+            rules=self.rules,
+            precision=self.precision,
+            records=self.records,
+            variates=self.variates,
+        ).save(self.checkpoint)
+
+    def _play_shards(self, number_of_runs: int) -> Iterator[Accumulator]:
+        """
+        Resultados das fatias na ordem, a partir de next_shard. Com workers,
+        só IN_FLIGHT_PER_WORKER fatias por worker ficam no pool: a memória
+        não cresce com a quantidade de partidas.
+        """
+        shards = Shard.stream(
+            number_of_runs, self.shard_size, self.seed, first=self.next_shard
+        )
+        arguments = (
+            self.profile,
+            self.rules,
+            bool(self.records),
+            self.trace_sampling if self.trace else None,
+            self.variates,
+            self.reuse_boards,
+        )
+        yield from in_order(
+            play_shard,
+            ((self.engine, shard, *arguments) for shard in shards),
+            self.workers,
+        )
+
+    def __profile_game(self, start: int) -> None:
+        if self.statistic.profile is not None:
+            self.statistic.profile.game_ns += time.perf_counter_ns() - start
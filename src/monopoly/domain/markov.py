@@ -0,0 +1,124 @@
+"""
+Modelo analítico (cadeia de Markov) da posição dos jogadores no tabuleiro.
+
+A posição segue um passeio aleatório com um dado de 6 faces, módulo a quantidade
+de propriedades (PlayerAbstract.move_spaces). As frequências de parada e de voltas
+podem ser calculadas de forma exata, sem simular partidas.
+"""
+
+from typing import List, Optional, Sequence
+
+from monopoly.domain.rules import DEFAULT_RULES
+
+FACES = range(1, 7)
+FACE_PROBABILITY = 1 / len(FACES)
+QUANTITY_ESTATES = DEFAULT_RULES.quantity_estates
+
+
+def transition_matrix(quantity_estates: int = QUANTITY_ESTATES) -> List[List[float]]:
+    """
+    P[i][j] = probabilidade de sair da casa i e parar na casa j em uma jogada.
+    """
+    matrix = [[0.0] * quantity_estates for _ in range(quantity_estates)]
+    for position in range(quantity_estates):
+        for face in FACES:
+            matrix[position][(position + face) % quantity_estates] += FACE_PROBABILITY
+    return matrix
+
+
+def step(distribution: Sequence[float]) -> List[float]:
+    """
+    Distribuição das posições depois de mais uma jogada (sem montar a matriz).
+    """
+    quantity_estates = len(distribution)
+    following = [0.0] * quantity_estates
+    for position, probability in enumerate(distribution):
+        if not probability:
+            continue
+        share = probability * FACE_PROBABILITY
+        for face in FACES:
+            following[(position + face) % quantity_estates] += share
+    return following
+
+
+def stationary_distribution(quantity_estates: int = QUANTITY_ESTATES) -> List[float]:
+    """
+    Frequência de parada em cada casa no longo prazo.
+
+    A matriz de transição é circulante (todas as colunas somam 1), então a
+    distribuição estacionária é uniforme. Como o dado tem faces 1 e 2 (mdc 1),
+    a cadeia é aperiódica e converge para ela a partir de qualquer casa.
+    """
+    return [1 / quantity_estates] * quantity_estates
+
+
+def landing_distribution(
+    moves: int, quantity_estates: int = QUANTITY_ESTATES, start: int = 0
+) -> List[float]:
+    """
+    Probabilidade de estar em cada casa depois de `moves` jogadas.
+    """
+    distribution = [0.0] * quantity_estates
+    distribution[start] = 1.0
+    for _ in range(moves):
+        distribution = step(distribution)
+    return distribution
+
+
+def expected_landings(
+    moves: int, quantity_estates: int = QUANTITY_ESTATES, start: int = 0
+) -> List[float]:
+    """
+    Quantidade esperada de paradas em cada casa nas primeiras `moves` jogadas.
+    """
+    distribution = [0.0] * quantity_estates
+    distribution[start] = 1.0
+    landings = [0.0] * quantity_estates
+    for _ in range(moves):
+        distribution = step(distribution)
+        landings = [total + p for total, p in zip(landings, distribution)]
+    return landings
+
+
+def full_turn_probability(distribution: Sequence[float]) -> float:
+    """
+    Probabilidade de completar uma volta na próxima jogada,
+    com a mesma regra de PlayerAbstract.move_spaces (no máximo uma volta por jogada).
+    """
+    quantity_estates = len(distribution)
+    return sum(
+        probability * FACE_PROBABILITY
+        for position, probability in enumerate(distribution)
+        for face in FACES
+        if position + face >= quantity_estates
+    )
+
+
+def expected_laps_per_round(quantity_estates: int = QUANTITY_ESTATES) -> float:
+    """
+    Voltas esperadas por jogador a cada rodada, no longo prazo.
+    """
+    return full_turn_probability(stationary_distribution(quantity_estates))
+
+
+def expected_rent_income(
+    rent_values: Sequence[float],
+    owners: Sequence[Optional[int]],
+    players: Sequence[int],
+    distribution: Sequence[float] = None,
+) -> List[float]:
+    """
+    Aluguel esperado por rodada em cada propriedade, dado o mapa de proprietários.
+
+    Em cada rodada cada jogador ativo que não é o dono para na propriedade com a
+    probabilidade da distribuição (estacionária, por padrão) e paga o aluguel.
+    """
+    distribution = distribution or stationary_distribution(len(rent_values))
+    return [
+        (
+            0.0
+            if owner is None
+            else rent * probability * sum(1 for player in players if player != owner)
+        )
+        for rent, owner, probability in zip(rent_values, owners, distribution)
+    ]
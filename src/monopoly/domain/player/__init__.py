@@ -0,0 +1,7 @@
+from monopoly import log
+
+logger = log.init_logger(__name__)
+
+from .__player_abstract import PlayerAbstract  # noqa: F401, E402
+from .__player_factory import PlayerFactory  # noqa: F401, E402
+from .strategy import STRATEGIES, Strategy, register  # noqa: F401, E402
@@ -0,0 +1,67 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from monopoly import tracing
+from monopoly.domain.random_source import RandomSource, default_source
+from monopoly.domain.rules import DEFAULT_RULES, Rules
+
+from . import logger
+from .strategy import RANDOM, Strategy
+
+
+@dataclass(slots=True)
+class PlayerAbstract:
+    """
+    Cada um dos jogadores tem um comportamento diferente (behavior, ver
+    domain.player.strategy), que dita as ações que eles vão tomar ao longo do jogo.
+    """
+
+    balance: float = 300.0  # TODO: change field name to: amount
+    position: int = 0
+    turns: int = 0
+    id: int = 1
+    rng: RandomSource = field(default_factory=default_source, repr=False, compare=False)
+    rules: Rules = field(default=DEFAULT_RULES, repr=False, compare=False)
+    behavior: Strategy = RANDOM
+
+    @property
+    def balance_negative(self) -> bool:
+        return self.balance < 0
+
+    def move_spaces(self, spaces: int) -> None:
+        _new_position = self.position + spaces
+        quantity_estates = self.rules.quantity_estates
+
+        self.position = _new_position % quantity_estates
+        if tracing.ENABLED:
+            logger.info(
+                "\tPlayer(id=%s) moved (%d) spaces and new position is [%d]",
+                self.id,
+                spaces,
+                self.position,
+            )
+
+        full_turn = _new_position >= quantity_estates
+        if full_turn:
+            self.full_turn()
+
+    def full_turn(self, bonus: float = None) -> None:
+        """
+        Ao completar uma volta no tabuleiro, o jogador ganha 100 de saldo
+        (rules.lap_bonus).
+        """
+        if bonus is None:
+            bonus = self.rules.lap_bonus
+        self.turns += 1
+        self.balance += bonus
+        if tracing.ENABLED:
+            logger.info(
+                "\tPlayer(id=%s) completed (%d) lap and +$%.2f. New balance: %+.2f",
+                self.id,
+                self.turns,
+                bonus,
+                self.balance,
+            )
+
+    def validate_purchase_behavioral_rules(self, estate: Any) -> bool:
+        return self.behavior.allows(self, estate)
@@ -0,0 +1,36 @@
+from typing import Union
+
+from monopoly import log, tracing
+from monopoly.domain.player import PlayerAbstract
+from monopoly.domain.player.strategy import RANDOM, Strategy, get
+from monopoly.domain.random_source import RandomSource, default_source
+from monopoly.domain.rules import DEFAULT_RULES, Rules
+
+logger = log.init_logger(__name__)
+
+
+class PlayerFactory:
+    @staticmethod
+    def create(
+        behavior: Union[Strategy, str] = RANDOM,
+        balance: float = 300.0,
+        _id: int = 1,
+        rng: RandomSource = None,
+        rules: Rules = DEFAULT_RULES,
+    ):
+        """
+        behavior é uma estratégia registrada (domain.player.strategy) ou o seu nome.
+        """
+        if isinstance(behavior, str):
+            behavior = get(behavior)
+        player = PlayerAbstract(
+            balance=balance,
+            id=_id,
+            rng=rng or default_source(),
+            rules=rules,
+            behavior=behavior,
+        )
+
+        if tracing.ENABLED:
+            logger.debug("Created player: %s", player)
+        return player
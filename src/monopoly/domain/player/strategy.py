@@ -0,0 +1,153 @@
+"""
+Registro das estratégias de compra dos jogadores.
+
+Cada comportamento é declarado como dados (aluguel mínimo, reserva e
+probabilidade de compra) e, se preciso, uma função. As mesmas declarações
+servem ao Board, que calcula os limites de compra uma vez por partida, e ao
+BatchBoard, que os calcula como arrays.
+
+    CAUTIOUS = register(Strategy("Cautious", reserve=150.0, min_rent=30.0))
+
+Um comportamento registrado pode ser usado pelo nome em PlayerFactory.create
+e aparece nos relatórios sem nenhuma outra alteração.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from monopoly.domain.rules import Rules
+
+Threshold = Union[float, str, None]
+"""
+Valor fixo ou o nome de um campo de Rules (ex.: "wary_reserve"); None não limita.
+"""
+
+NEVER = math.inf
+
+
+@dataclass(frozen=True, eq=False)
+class Strategy:
+    """
+    Compra uma propriedade sem dono quando:
+
+    - o aluguel é maior do que min_rent;
+    - sobra pelo menos reserve de saldo depois da compra;
+    - o sorteio com probabilidade probability é verdadeiro;
+    - decide(balance, sale_price, rent_value) é verdadeiro. A função recebe
+      números no Board e arrays numpy no BatchBoard, então deve usar somente
+      operações que funcionem com os dois (comparações, aritmética, &, |).
+
+    Duas estratégias só são iguais se forem o mesmo objeto (o do registro).
+    """
+
+    name: str
+    min_rent: Threshold = field(default=None, repr=False)
+    reserve: Threshold = field(default=None, repr=False)
+    probability: Threshold = field(default=None, repr=False)
+    decide: Callable[[Any, Any, Any], Any] = field(default=None, repr=False)
+    """
+    Sem sorteio nem função, os limites de compra bastam (ver limits).
+    """
+    deterministic: bool = field(default=True, init=False, repr=False)
+
+    def __post_init__(self):
+        deterministic = self.probability is None and self.decide is None
+        object.__setattr__(self, "deterministic", deterministic)
+
+    def __str__(self) -> str:
+        return self.name
+
+    def resolve(
+        self, rules: Rules
+    ) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """
+        min_rent, reserve e probability com os valores de rules.
+        """
+        return tuple(
+            getattr(rules, value) if isinstance(value, str) else value
+            for value in (self.min_rent, self.reserve, self.probability)
+        )
+
+    def limits(self, estates: Sequence[Any], rules: Rules) -> List[float]:
+        """
+        Saldo mínimo para comprar cada propriedade: o preço de venda mais a
+        reserva, ou NEVER quando o aluguel não passa de min_rent.
+
+        Inclui a regra geral (saldo maior ou igual ao preço), então a compra
+        é uma única comparação com o saldo.
+        """
+        min_rent, reserve, _ = self.resolve(rules)
+        reserve = max(reserve or 0.0, 0.0)
+        return [
+            (
+                NEVER
+                if min_rent is not None and estate.rent_value <= min_rent
+                else estate.sale_price + reserve
+            )
+            for estate in estates
+        ]
+
+    def accepts(self, player: Any, estate: Any) -> bool:
+        """
+        Sorteio e função da estratégia, depois dos limites.
+        """
+        if self.probability is not None:
+            _, _, probability = self.resolve(player.rules)
+            if not player.rng.chance(probability):
+                return False
+        return self.decide is None or bool(
+            self.decide(player.balance, estate.sale_price, estate.rent_value)
+        )
+
+    def allows(self, player: Any, estate: Any) -> bool:
+        """
+        Decisão de compra de uma propriedade qualquer, sem limites pré-calculados.
+        """
+        (limit,) = self.limits((estate,), player.rules)
+        return player.balance >= limit and (
+            self.deterministic or self.accepts(player, estate)
+        )
+
+
+STRATEGIES: Dict[str, Strategy] = {}
+"""
+Estratégias registradas, pelo nome. A ordem de registro é o código do
+comportamento nos arquivos de registros e rastros (CODES).
+"""
+CODES: List[Strategy] = []
+
+
+def register(strategy: Strategy) -> Strategy:
+    if strategy.name in STRATEGIES:
+        raise ValueError(f"strategy {strategy.name!r} is already registered")
+    STRATEGIES[strategy.name] = strategy
+    CODES.append(strategy)
+    return strategy
+
+
+def get(name: str) -> Strategy:
+    try:
+        return STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f"unknown strategy {name!r}") from None
+
+
+IMPULSIVE = register(Strategy("Impulsive"))
+"""
+O jogador impulsivo compra qualquer propriedade sobre a qual ele parar.
+"""
+PICKY = register(Strategy("Picky", min_rent="picky_min_rent"))
+"""
+O jogador exigente compra qualquer propriedade, desde que o valor do aluguel
+dela seja maior do que 50 (rules.picky_min_rent).
+"""
+WARY = register(Strategy("Wary", reserve="wary_reserve"))
+"""
+O jogador cauteloso compra qualquer propriedade desde que ele tenha uma reserva
+de 80 saldo sobrando depois de realizada a compra (rules.wary_reserve).
+"""
+RANDOM = register(Strategy("Random", probability=0.5))
+"""
+O jogador aleatório compra a propriedade que ele parar em cima com probabilidade de 50%.
+"""
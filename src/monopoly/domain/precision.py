@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Dict
+
+from monopoly import config
+from monopoly.domain.accumulator import Accumulator
+
+
+@dataclass
+class Precision:
+    """
+    Precisão desejada para as estatísticas de um Game.play_adaptive.
+
+    win: meia largura máxima do intervalo de confiança das porcentagens de vitória
+    (em pontos percentuais); rounds: meia largura máxima do intervalo da média de
+    rodadas. Um alvo None não é verificado.
+    """
+
+    win: float = None
+    rounds: float = None
+    confidence: float = 0.95
+    max_runs: int = field(default_factory=lambda: config.MAX_RUNS)
+    min_runs: int = field(default_factory=lambda: config.MIN_RUNS)
+    converged: bool = False
+
+    @property
+    def z(self) -> float:
+        return NormalDist().inv_cdf((1 + self.confidence) / 2)
+
+    def win_intervals(self, statistic: Accumulator) -> Dict[str, float]:
+        return {
+            behavior: statistic.win_interval(behavior, self.z)
+            for behavior in statistic.wins
+        }
+
+    def rounds_interval(self, statistic: Accumulator) -> float:
+        return statistic.rounds_interval(self.z)
+
+    def reached(self, statistic: Accumulator) -> bool:
+        if statistic.matches < self.min_runs:
+            return False
+        if self.win is not None and any(
+            interval > self.win for interval in self.win_intervals(statistic).values()
+        ):
+            return False
+        if self.rounds is not None and self.rounds_interval(statistic) > self.rounds:
+            return False
+        self.converged = True
+        return True
@@ -0,0 +1,212 @@
+"""
+Progresso de um Game.play: partidas jogadas, partidas por segundo, tempo
+restante estimado, taxa de time out e o comportamento que mais vence.
+
+A atualização acontece quando uma fatia é combinada (Game._merge), não a cada
+partida: o custo é uma leitura do relógio por fatia, com qualquer motor e
+quantidade de workers. O relatório sai no máximo uma vez a cada interval
+segundos, em stderr e, opcionalmente, em um arquivo no formato texto do
+Prometheus (para o textfile collector do node_exporter, por exemplo):
+
+    PROGRESS=1 PROGRESS_TEXTFILE=/var/lib/node_exporter/monopoly.prom monopoly run
+"""
+
+import math
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Optional, TextIO
+
+from monopoly import config
+from monopoly.atomic import write_atomic
+from monopoly.domain.accumulator import Accumulator
+
+PREFIX = "monopoly"
+
+
+@dataclass
+class Snapshot:
+    matches: int
+    total: int
+    elapsed: float
+    rate: float
+    """
+    Segundos até total partidas no ritmo atual (inf antes da primeira fatia).
+    """
+    eta: float
+    timeout_rate: float
+    leader: Optional[str]
+    leader_rate: float
+
+    @staticmethod
+    def of(
+        statistic: Accumulator, total: int, elapsed: float, played: int
+    ) -> "Snapshot":
+        """
+        played: partidas jogadas desde o início da medição (sem as de um
+        checkpoint retomado), que dão o ritmo.
+        """
+        matches = statistic.matches
+        rate = played / elapsed if elapsed > 0 else 0.0
+        remaining = max(total - matches, 0)
+        leader = max(statistic.wins, key=statistic.wins.get, default=None)
+        return Snapshot(
+            matches=matches,
+            total=total,
+            elapsed=elapsed,
+            rate=rate,
+            eta=remaining / rate if rate else (0.0 if not remaining else math.inf),
+            timeout_rate=statistic.timeouts / matches if matches else 0.0,
+            leader=leader if matches else None,
+            leader_rate=statistic.wins[leader] / matches if matches else 0.0,
+        )
+
+
+def duration(seconds: float) -> str:
+    if math.isinf(seconds):
+        return "--:--"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return (
+        f"{hours}:{minutes:02d}:{seconds:02d}"
+        if hours
+        else f"{minutes:02d}:{seconds:02d}"
+    )
+
+
+def line(snapshot: Snapshot) -> str:
+    percent = snapshot.matches / snapshot.total * 100 if snapshot.total else 100.0
+    leader = (
+        f"{snapshot.leader} ({snapshot.leader_rate:.1%})" if snapshot.leader else "-"
+    )
+    return (
+        f"{snapshot.matches}/{snapshot.total} partidas ({percent:.1f}%) | "
+        f"{snapshot.rate:,.0f} partidas/s | "
+        f"ETA {duration(snapshot.eta)} | "
+        f"time out {snapshot.timeout_rate:.1%} | "
+        f"líder {leader}"
+    )
+
+
+def prometheus(snapshot: Snapshot, statistic: Accumulator) -> str:
+    """
+    Métricas no formato texto do Prometheus.
+    """
+    metrics = [
+        ("matches_total", "counter", "Matches played.", snapshot.matches),
+        ("matches_planned", "gauge", "Matches to play.", snapshot.total),
+        ("matches_per_second", "gauge", "Matches per second.", snapshot.rate),
+        ("eta_seconds", "gauge", "Estimated seconds to finish.", snapshot.eta),
+        ("timeouts_total", "counter", "Matches ended by timeout.", statistic.timeouts),
+        ("elapsed_seconds", "gauge", "Seconds since the start.", snapshot.elapsed),
+    ]
+    lines = []
+    for name, kind, description, value in metrics:
+        lines += [
+            f"# HELP {PREFIX}_{name} {description}",
+            f"# TYPE {PREFIX}_{name} {kind}",
+            f"{PREFIX}_{name} {_number(value)}",
+        ]
+    lines += [
+        f"# HELP {PREFIX}_wins_total Matches won by behavior.",
+        f"# TYPE {PREFIX}_wins_total counter",
+        *(
+            f'{PREFIX}_wins_total{{behavior="{name}"}} {wins}'
+            for name, wins in statistic.wins.items()
+        ),
+        f"# HELP {PREFIX}_leader Behavior with the most wins so far.",
+        f"# TYPE {PREFIX}_leader gauge",
+        *(
+            f'{PREFIX}_leader{{behavior="{name}"}} {int(name == snapshot.leader)}'
+            for name in statistic.wins
+        ),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+@dataclass
+class Progress:
+    """
+    Relatório de progresso com taxa limitada: update pode ser chamado a cada
+    fatia, mas só escreve quando interval segundos passaram desde o anterior.
+    """
+
+    total: int = 0
+    interval: float = 1.0
+    stream: Optional[TextIO] = field(default_factory=lambda: sys.stderr)
+    textfile: str = None
+    started_at: float = field(default=None, init=False)
+    reported_at: float = field(default=None, init=False)
+    reports: int = field(default=0, init=False)
+    reported_matches: int = field(default=None, init=False)
+    _initial: int = field(default=0, init=False, repr=False)
+
+    @staticmethod
+    def from_config() -> Optional["Progress"]:
+        """
+        PROGRESS=1 escreve em stderr; PROGRESS_TEXTFILE, no arquivo do Prometheus.
+        Sem nenhum dos dois, None.
+        """
+        if not config.PROGRESS and not config.PROGRESS_TEXTFILE:
+            return None
+        return Progress(
+            interval=config.PROGRESS_INTERVAL,
+            stream=sys.stderr if config.PROGRESS else None,
+            textfile=config.PROGRESS_TEXTFILE,
+        )
+
+    def start(self, statistic: Accumulator, total: int) -> None:
+        self.total = total
+        self.started_at = self.reported_at = time.monotonic()
+        self._initial = statistic.matches
+
+    def update(self, statistic: Accumulator, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self.reported_at < self.interval:
+            return
+        self.reported_at = now
+        self.report(statistic, now)
+
+    def finish(self, statistic: Accumulator) -> None:
+        if statistic.matches != self.reported_matches:
+            self.update(statistic, force=True)
+        if self.stream is not None and self._tty:
+            self.stream.write("\n")
+            self.stream.flush()
+
+    def snapshot(self, statistic: Accumulator, now: float = None) -> Snapshot:
+        now = now if now is not None else time.monotonic()
+        return Snapshot.of(
+            statistic,
+            total=self.total,
+            elapsed=now - self.started_at,
+            played=statistic.matches - self._initial,
+        )
+
+    def report(self, statistic: Accumulator, now: float = None) -> None:
+        snapshot = self.snapshot(statistic, now)
+        self.reports += 1
+        self.reported_matches = statistic.matches
+        if self.stream is not None:
+            # a terminal keeps one line, rewritten; a file or pipe gets one per report
+            if self._tty:
+                self.stream.write(f"\r{line(snapshot)}\x1b[K")
+            else:
+                self.stream.write(f"{line(snapshot)}\n")
+            self.stream.flush()
+        if self.textfile:
+            # the collector reads the file at any moment; it needs no fsync
+            write_atomic(
+                self.textfile, prometheus(snapshot, statistic).encode(), sync=False
+            )
+
+    @property
+    def _tty(self) -> bool:
+        isatty = getattr(self.stream, "isatty", None)
+        return bool(isatty and isatty())
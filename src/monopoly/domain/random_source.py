@@ -0,0 +1,103 @@
+import random
+from typing import Iterator, List
+
+BUFFER_SIZE = 4096
+
+
+class RandomSource:
+    """
+    Fonte de números aleatórios para o jogo (dados, moedas e valores das propriedades).
+
+    Os valores são gerados em blocos e entregues um a um, o que é bem mais barato
+    do que chamar random.randint a cada jogada. Cada finalidade tem o seu próprio
+    gerador, derivado da mesma semente, para que uma não altere a sequência da outra.
+
+    Com antithetic, cada face d do dado vira 7 - d (variáveis antitéticas):
+    as duas fontes com a mesma semente jogam dados opostos e o resto igual.
+    """
+
+    def __init__(
+        self, seed: int = None, buffer_size: int = BUFFER_SIZE, antithetic: bool = False
+    ):
+        self.seed = seed
+        self.buffer_size = buffer_size
+        self.antithetic = antithetic
+        self._dice_random = self._random("dice")
+        self._coin_random = self._random("coin")
+        self._uniform_random = self._random("uniform")
+        self._dice: Iterator[int] = iter(())
+        self._coins: Iterator[int] = iter(())
+        self._uniforms: Iterator[float] = iter(())
+
+    def _random(self, stream: str) -> random.Random:
+        if self.seed is None:
+            return random.Random()  # noqa S311
+        return random.Random(f"{self.seed}:{stream}")  # noqa S311
+
+    def _fill_dice(self) -> List[int]:
+        # 252 is the largest multiple of 6 below 256: rejecting the rest keeps the faces equiprobable
+        if self.antithetic:
+            return [
+                6 - byte % 6
+                for byte in self._dice_random.randbytes(self.buffer_size)
+                if byte < 252
+            ]
+        return [
+            byte % 6 + 1
+            for byte in self._dice_random.randbytes(self.buffer_size)
+            if byte < 252
+        ]
+
+    def _fill_coins(self) -> bytes:
+        return self._coin_random.randbytes(self.buffer_size)
+
+    def _fill_uniforms(self) -> List[float]:
+        _random = self._uniform_random.random
+        return [_random() for _ in range(self.buffer_size)]
+
+    def dice(self) -> int:
+        """
+        Dado equiprovável de 6 faces.
+        """
+        try:
+            return next(self._dice)
+        except StopIteration:
+            self._dice = iter(self._fill_dice())
+            return next(self._dice)
+
+    def coin(self) -> bool:
+        """
+        Moeda com probabilidade de 50%.
+        """
+        return self.chance(0.5)
+
+    def chance(self, probability: float) -> bool:
+        """
+        Verdadeiro com a probabilidade informada, em passos de 1/256
+        (um byte por sorteio, o mesmo da moeda).
+        """
+        try:
+            return next(self._coins) < probability * 256
+        except StopIteration:
+            self._coins = iter(self._fill_coins())
+            return next(self._coins) < probability * 256
+
+    def uniform(self, a: float, b: float) -> float:
+        """
+        Mesmo resultado de random.uniform, mas a partir do bloco pré-gerado.
+        """
+        try:
+            return a + (b - a) * next(self._uniforms)
+        except StopIteration:
+            self._uniforms = iter(self._fill_uniforms())
+            return a + (b - a) * next(self._uniforms)
+
+
+_default_source = RandomSource()
+
+
+def default_source() -> RandomSource:
+    """
+    Fonte compartilhada, usada quando nenhuma outra é injetada.
+    """
+    return _default_source
@@ -0,0 +1,289 @@
+"""
+Registro binário de cada partida, em registros de tamanho fixo.
+
+O arquivo tem um cabeçalho (HEADER seguido dos nomes das estratégias, com o
+tamanho indicado no próprio HEADER) e depois um registro por partida, na ordem
+em que as partidas foram jogadas. Como todos os registros têm o mesmo tamanho,
+o arquivo pode ser lido como um array mapeado em memória (numpy.memmap) sem
+nenhum parse, e a partida i fica no byte offset + i * record_size.
+"""
+
+import mmap
+import os
+import struct
+from typing import BinaryIO, Iterator, List, NamedTuple, Sequence, Tuple
+
+from monopoly.domain.accumulator import Accumulator
+from monopoly.domain.player.strategy import CODES, STRATEGIES, Strategy
+
+MAGIC = b"MNPLREC\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sHHII")
+"""
+magic, versão, assentos, tamanho do registro e tamanho dos nomes que vêm logo
+depois, separados por vírgula.
+"""
+# the registry list itself: strategies registered later get the next codes
+BEHAVIOR_CODES: List[Strategy] = CODES
+NO_SEAT = -1
+SMALL_SEATS = 127
+"""
+Até SMALL_SEATS assentos, os assentos são gravados em um byte; com mais
+jogadores, em dois, e os das falências (com -1) em quatro (o cabeçalho tem a
+quantidade de assentos).
+"""
+
+
+def _wide(seats: int) -> bool:
+    return seats > SMALL_SEATS
+
+
+def behavior_names() -> bytes:
+    """
+    Nomes das estratégias registradas na ordem dos códigos, separados por vírgula:
+    os arquivos de registros e de rastro só guardam os códigos.
+    """
+    return ",".join(behavior.name for behavior in BEHAVIOR_CODES).encode()
+
+
+def behaviors_of(names: bytes) -> List[Strategy]:
+    """
+    Estratégias dos códigos de um arquivo, pelos nomes gravados (behavior_names).
+    """
+    # strategies that are not registered in this process are only names
+    return [
+        STRATEGIES.get(name) or Strategy(name) for name in names.decode().split(",")
+    ]
+
+
+def read_header(file: BinaryIO) -> Tuple[int, int, List[Strategy], int]:
+    """
+    Assentos, tamanho do registro, estratégias dos códigos e o byte onde
+    começam os registros.
+    """
+    data = file.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise ValueError(f"{file.name} is not a match records file")
+    magic, version, seats, record_size, size = HEADER.unpack(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{file.name} is not a match records file (version {VERSION})")
+    names = file.read(size)
+    if len(names) < size:
+        raise ValueError(f"{file.name} has a truncated header")
+    return seats, record_size, behaviors_of(names), HEADER.size + size
+
+
+def record_struct(seats: int) -> struct.Struct:
+    """
+    rounds, timeout, winner (código do comportamento), winner_seat, winner_balance,
+    saldo final de cada assento e os assentos na ordem de falência (-1 sobrando).
+    """
+    seat, loser = ("H", "i") if _wide(seats) else ("B", "b")
+    return struct.Struct(f"<IBB{seat}d{seats}d{seats}{loser}")
+
+
+def record_dtype(seats: int):
+    import numpy as np
+
+    seat, loser = ("<u2", "<i4") if _wide(seats) else ("u1", "i1")
+    return np.dtype(
+        [
+            ("rounds", "<u4"),
+            ("timeout", "u1"),
+            ("winner", "u1"),
+            ("winner_seat", seat),
+            ("winner_balance", "<f8"),
+            ("balances", "<f8", (seats,)),
+            ("bankruptcies", loser, (seats,)),
+        ]
+    )
+
+
+class Record(NamedTuple):
+    rounds: int
+    timeout: int
+    winner: Strategy
+    winner_seat: int
+    winner_balance: float
+    balances: Sequence[float]
+    bankruptcies: Sequence[int]
+
+
+def pack(result: dict, layout: struct.Struct, seats: int) -> bytes:
+    """
+    Converte o resultado de Board.match (ou BatchBoard.match) em um registro.
+    """
+    winner = result["winner"]
+    bankruptcies = list(result["bankruptcies"])
+    return layout.pack(
+        result["rounds"],
+        result["timeout"],
+        BEHAVIOR_CODES.index(winner.behavior),
+        winner.id - 1,
+        winner.balance,
+        *result["balances"],
+        *bankruptcies,
+        *[NO_SEAT] * (seats - len(bankruptcies)),
+    )
+
+
+class RecordBuffer:
+    """
+    Registros empacotados de uma fatia, para serem gravados de uma vez só.
+    """
+
+    def __init__(self, seats: int):
+        self.seats = seats
+        self.layout = record_struct(seats)
+        self.data = bytearray()
+
+    def add(self, result: dict) -> None:
+        self.data += pack(result, self.layout, self.seats)
+
+    def __len__(self) -> int:
+        return len(self.data) // self.layout.size
+
+
+class RecordWriter:
+    """
+    Acrescenta blocos de registros ao arquivo.
+
+    Com matches, o arquivo existente é cortado nessa quantidade de partidas
+    (retomada de um checkpoint); sem, o arquivo é recriado.
+    """
+
+    def __init__(self, path: str, seats: int, matches: int = None):
+        self.path = path
+        self.seats = seats
+        self.record_size = record_struct(seats).size
+        if matches is None:
+            self.file = open(path, "wb")
+            header = self.header()
+            self.file.write(header)
+            self.offset = len(header)
+        else:
+            self.file = open(path, "r+b")
+            *_, self.offset = read_header(self.file)
+            self.file.truncate(self.offset + matches * self.record_size)
+            self.file.seek(0, os.SEEK_END)
+
+    def header(self) -> bytes:
+        behaviors = behavior_names()
+        return (
+            HEADER.pack(MAGIC, VERSION, self.seats, self.record_size, len(behaviors))
+            + behaviors
+        )
+
+    def write(self, data: bytes) -> None:
+        self.file.write(data)
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class RecordFile:
+    """
+    Leitura de um arquivo de registros.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            seats, record_size, self.behaviors, self.offset = read_header(file)
+        self.seats = seats
+        self.record_size = record_size
+        self.layout = record_struct(seats)
+
+    def __len__(self) -> int:
+        return (os.path.getsize(self.path) - self.offset) // self.record_size
+
+    def array(self):
+        """
+        Registros como um array estruturado do numpy mapeado em memória.
+        """
+        import numpy as np
+
+        return np.memmap(
+            self.path,
+            dtype=record_dtype(self.seats),
+            mode="r",
+            offset=self.offset,
+            shape=(len(self),),
+        )
+
+    def __iter__(self) -> Iterator[Record]:
+        if not len(self):
+            return
+        offset, end = self.offset, self.offset + len(self) * self.record_size
+        balances = slice(5, 5 + self.seats)
+        bankruptcies = slice(5 + self.seats, None)
+        # a memoryview slice: data[offset:end] would copy the whole file into memory
+        with (
+            open(self.path, "rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data,
+            memoryview(data)[offset:end] as view,
+        ):
+            records = self.layout.iter_unpack(view)
+            try:
+                for values in records:
+                    yield Record(
+                        rounds=values[0],
+                        timeout=values[1],
+                        winner=self.behaviors[values[2]],
+                        winner_seat=values[3],
+                        winner_balance=values[4],
+                        balances=values[balances],
+                        bankruptcies=[s for s in values[bankruptcies] if s != NO_SEAT],
+                    )
+            finally:
+                # the iterator holds the view: release it before the mmap is closed
+                del records
+
+    def statistic(self, chunk: int = 1 << 20) -> Accumulator:
+        """
+        Accumulator das partidas do arquivo, lido em blocos (com numpy)
+        ou registro por registro (sem numpy).
+        """
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover
+            np = None
+
+        statistic = Accumulator()
+        if np is None:  # pragma: no cover
+            for record in self:
+                statistic.add_match(
+                    rounds=record.rounds,
+                    timeout=bool(record.timeout),
+                    behavior=record.winner.name,
+                )
+            return statistic
+
+        records = self.array() if len(self) else ()
+        for start in range(0, len(records), chunk):
+            stop = start + chunk
+            block = records[start:stop]
+            rounds = block["rounds"].astype(np.float64)
+            wins = np.bincount(block["winner"], minlength=len(self.behaviors))
+            statistic.merge(
+                Accumulator(
+                    matches=len(block),
+                    timeouts=int(block["timeout"].sum()),
+                    rounds_mean=float(rounds.mean()),
+                    rounds_m2=float(((rounds - rounds.mean()) ** 2).sum()),
+                    wins={
+                        behavior.name: int(count)
+                        for behavior, count in zip(self.behaviors, wins)
+                    },
+                )
+            )
+        return statistic
@@ -0,0 +1,49 @@
+from dataclasses import asdict, dataclass
+
+from monopoly import config
+
+MAX_PLAYERS = 65_535
+"""
+Os assentos ocupam até dois bytes nos registros e rastros.
+"""
+
+
+@dataclass(frozen=True)
+class Rules:
+    """
+    Parâmetros das regras de uma partida.
+
+    São passados explicitamente para Board, jogadores e BatchBoard,
+    então partidas com regras diferentes podem rodar no mesmo processo.
+    Os valores padrão são as regras do jogo; from_config aplica
+    DEFAULT_BALANCE, QUANTITY_ESTATES e QUANTITY_PLAYERS do ambiente.
+    """
+
+    balance: float = 300.0
+    quantity_estates: int = 20
+    quantity_players: int = 4
+    lap_bonus: float = 100.0
+    picky_min_rent: float = 50.0
+    wary_reserve: float = 80.0
+    round_limit: int = 1000
+
+    def __post_init__(self):
+        for name in ("quantity_estates", "quantity_players", "round_limit"):
+            if getattr(self, name) < 1:
+                raise ValueError(f"{name} must be at least 1")
+        if self.quantity_players > MAX_PLAYERS:
+            raise ValueError(f"quantity_players must be at most {MAX_PLAYERS}")
+
+    @staticmethod
+    def from_config() -> "Rules":
+        return Rules(
+            balance=config.DEFAULT_BALANCE,
+            quantity_estates=config.QUANTITY_ESTATES,
+            quantity_players=config.QUANTITY_PLAYERS,
+        )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+DEFAULT_RULES = Rules()
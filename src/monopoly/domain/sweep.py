@@ -0,0 +1,198 @@
+"""
+Varredura de parâmetros das regras (Rules).
+
+Cada ponto da grade é um Game completo, com as regras passadas explicitamente,
+então todos os pontos rodam no mesmo processo ou distribuídos em um pool.
+Com números aleatórios comuns, as fatias é que são distribuídas: cada uma
+joga as suas partidas em todos os pontos (play_shard_points).
+O resultado é uma linha por ponto, gravada em colunas.
+"""
+
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
+from itertools import product, repeat
+from typing import Dict, Iterator, List, Sequence
+
+from monopoly import config
+from monopoly.domain.accumulator import Accumulator
+from monopoly.domain.game import Game, Shard, in_order, play_shard_points
+from monopoly.domain.rules import DEFAULT_RULES, Rules
+from monopoly.domain.variates import Variates
+
+PARAMETERS = tuple(parameter.name for parameter in fields(Rules))
+
+
+def grid(base: Rules = DEFAULT_RULES, **values: Sequence) -> List[Rules]:
+    """
+    Produto cartesiano dos valores de cada parâmetro; os demais vêm de base.
+    """
+    unknown = sorted(set(values) - set(PARAMETERS))
+    if unknown:
+        raise ValueError(f"Unknown rules parameters: {', '.join(unknown)}")
+    names = list(values)
+    return [
+        replace(base, **dict(zip(names, combination)))
+        for combination in product(*(values[name] for name in names))
+    ]
+
+
+@dataclass(frozen=True)
+class Point:
+    index: int
+    rules: Rules
+    seed: int
+    variates: Variates = None
+
+
+def row(point: Point, statistic: Accumulator, seconds: float) -> dict:
+    return {
+        "point": point.index,
+        **point.rules.to_dict(),
+        "seed": point.seed,
+        "matches": statistic.matches,
+        "timeouts": statistic.timeouts,
+        "rounds_mean": statistic.rounds_mean,
+        "rounds_stdev": statistic.rounds_stdev,
+        **{
+            f"win_{behavior.lower()}": percentage
+            for behavior, percentage in statistic.win_percentages.items()
+        },
+        **(variance_columns(statistic) if point.variates is not None else {}),
+        "seconds": seconds,
+    }
+
+
+def variance_columns(statistic: Accumulator) -> dict:
+    """
+    Diferença de rodadas para o primeiro ponto (o baseline) e a redução de variância.
+    """
+    differences = statistic.differences
+    return {
+        "rounds_diff_mean": differences.mean if differences else 0.0,
+        "rounds_diff_interval": differences.interval() if differences else 0.0,
+        "crn_efficiency": statistic.crn_efficiency,
+        "antithetic_efficiency": statistic.antithetic_efficiency,
+    }
+
+
+def play_point(engine: str, point: Point, number_of_runs: int) -> dict:
+    start = time.perf_counter()
+    game = Game(
+        engine=engine,
+        workers=1,
+        seed=point.seed,
+        profile=False,
+        rules=point.rules,
+        variates=point.variates,
+        # the files of the environment belong to a single game, not to every point
+        checkpoint="",
+        records="",
+        trace="",
+        progress=False,
+    )
+    game.play(number_of_runs=number_of_runs)
+    return row(point, game.statistic, time.perf_counter() - start)
+
+
+class Sweep:
+    """
+    Joga number_of_runs partidas em cada ponto da grade.
+
+    Cada ponto tem a sua semente derivada da semente mestre e do índice,
+    então o resultado de um ponto não depende de quantos workers são usados.
+
+    Com variates (números aleatórios comuns), todos os pontos usam a semente
+    mestre, então a partida i sorteia as mesmas propriedades e os mesmos dados
+    em todos os pontos, e cada ponto é comparado partida a partida com o primeiro,
+    jogado uma vez só.
+    """
+
+    points: List[Point]
+    engine: str
+    workers: int
+    rows: List[dict]
+
+    def __init__(
+        self,
+        rules: Sequence[Rules],
+        seed: int,
+        engine: str = "object",
+        workers: int = 1,
+        variates: Variates = None,
+        shard_size: int = None,
+    ):
+        if variates is not None and engine == "batch":
+            raise ValueError(
+                "Variance reduction is only available for the object engine"
+            )
+        if variates is None:
+            self.points = [
+                Point(index=index, rules=point, seed=Shard.derive_seed(seed, index))
+                for index, point in enumerate(rules)
+            ]
+        else:
+            self.points = [
+                Point(
+                    index=index,
+                    rules=point,
+                    seed=seed,
+                    variates=replace(variates, baseline=rules[0] if index else None),
+                )
+                for index, point in enumerate(rules)
+            ]
+        self.seed = seed
+        self.variates = variates
+        self.engine = engine
+        self.workers = workers
+        self.shard_size = shard_size or config.SHARD_SIZE
+        if variates is not None and variates.antithetic:
+            # both matches of a pair in the same shard
+            self.shard_size += self.shard_size % 2
+        self.rows = []
+
+    def run(self, number_of_runs: int) -> List[dict]:
+        self.rows = list(self._play_points(number_of_runs))
+        return self.rows
+
+    def _play_points(self, number_of_runs: int) -> Iterator[dict]:
+        if self.variates is not None:
+            yield from self._play_common(number_of_runs)
+            return
+        engine, runs = repeat(self.engine), repeat(number_of_runs)
+        if self.workers > 1 and len(self.points) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                yield from executor.map(play_point, engine, self.points, runs)
+        else:
+            for point in self.points:
+                yield play_point(self.engine, point, number_of_runs)
+
+    def _play_common(self, number_of_runs: int) -> Iterator[dict]:
+        """
+        Pontos com números aleatórios comuns, fatia a fatia.
+        """
+        rules = [point.rules for point in self.points]
+        variates = replace(self.variates, baseline=None)
+        shards = Shard.stream(number_of_runs, self.shard_size, self.seed)
+        statistics = [Accumulator() for _ in self.points]
+        seconds = [0.0] * len(self.points)
+        calls = ((shard, rules, variates) for shard in shards)
+        for results in in_order(play_shard_points, calls, self.workers):
+            for index, (statistic, elapsed) in enumerate(results):
+                statistics[index].merge(statistic)
+                seconds[index] += elapsed
+        for point, statistic, elapsed in zip(self.points, statistics, seconds):
+            yield row(point, statistic, elapsed)
+
+    def columns(self) -> Dict[str, list]:
+        if not self.rows:
+            return {}
+        return {name: [row[name] for row in self.rows] for name in self.rows[0]}
+
+    def write(self, path: str) -> None:
+        """
+        Grava os resultados em JSON no formato {coluna: [valor por ponto]}.
+        """
+        with open(path, "w") as file:
+            json.dump(self.columns(), file)
@@ -0,0 +1,201 @@
+"""
+Torneio com rodízio de assentos.
+
+Board.create sempre senta os comportamentos na mesma ordem, e o desempate é a
+ordem de turno: a porcentagem de vitórias de um comportamento mistura o
+comportamento com o assento. O torneio joga as mesmas partidas (mesmas
+propriedades e mesmos dados, domain.variates) com cada formação (lineup) de
+jogadores: por padrão todas as permutações dos quatro comportamentos, ou
+formações quaisquer, com comportamentos repetidos.
+
+O trabalho é dividido em (formação, fatia de partidas), jogado em paralelo, e
+o resultado tem as vitórias por comportamento, por assento e por
+comportamento em cada assento.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import permutations, repeat
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from monopoly.domain.accumulator import Accumulator
+from monopoly.domain.board import BEHAVIORS, Board
+from monopoly.domain.game import Shard
+from monopoly.domain.player import Strategy
+from monopoly.domain.player.strategy import get
+from monopoly.domain.rules import DEFAULT_RULES, Rules
+from monopoly.domain.variates import Variates
+
+Lineup = Tuple[str, ...]
+
+
+def lineups_of(behaviors: Sequence = BEHAVIORS, permute: bool = True) -> List[Lineup]:
+    """
+    Formações com os nomes das estratégias; com permute, todas as permutações
+    distintas (comportamentos repetidos não geram formações iguais).
+    """
+    names = tuple(
+        behavior.name if isinstance(behavior, Strategy) else behavior
+        for behavior in behaviors
+    )
+    for name in names:
+        get(name)  # unknown names fail here, not in the workers
+    if not permute:
+        return [names]
+    return list(dict.fromkeys(permutations(names)))
+
+
+@dataclass
+class Standings:
+    """
+    Vitórias por assento e por comportamento em cada assento; appearances conta
+    as partidas jogadas por comportamento em cada assento (uma por jogador, então
+    um comportamento repetido na formação conta duas vezes na mesma partida).
+    """
+
+    seats: int
+    statistic: Accumulator = field(default_factory=Accumulator)
+    wins: Dict[str, List[int]] = field(default_factory=dict)
+    appearances: Dict[str, List[int]] = field(default_factory=dict)
+
+    def add(self, lineup: Lineup, result: dict) -> None:
+        self.statistic.add(result)
+        winner = result["winner"]
+        self._row(self.wins, winner.behavior.name)[winner.id - 1] += 1
+        for seat, name in enumerate(lineup):
+            self._row(self.appearances, name)[seat] += 1
+
+    def _row(self, table: Dict[str, List[int]], name: str) -> List[int]:
+        if name not in table:
+            table[name] = [0] * self.seats
+        return table[name]
+
+    def merge(self, other: "Standings") -> "Standings":
+        self.statistic.merge(other.statistic)
+        for table, others in (
+            (self.wins, other.wins),
+            (self.appearances, other.appearances),
+        ):
+            for name, counts in others.items():
+                row = self._row(table, name)
+                for seat, count in enumerate(counts):
+                    row[seat] += count
+        return self
+
+    @property
+    def matches(self) -> int:
+        return self.statistic.matches
+
+    @property
+    def seat_win_rates(self) -> List[float]:
+        """
+        Porcentagem de vitórias de cada assento, qualquer que seja o comportamento.
+        """
+        if not self.matches:
+            return [0.0] * self.seats
+        return [
+            sum(row[seat] for row in self.wins.values()) / self.matches * 100
+            for seat in range(self.seats)
+        ]
+
+    @property
+    def win_rates(self) -> Dict[str, float]:
+        """
+        Porcentagem de vitórias por jogador de cada comportamento (vitórias /
+        participações): com todos os assentos equivalentes, 100 / seats.
+        """
+        return {
+            name: _rate(sum(self.wins.get(name, ())), sum(appearances))
+            for name, appearances in self.appearances.items()
+        }
+
+    @property
+    def table(self) -> Dict[str, List[float]]:
+        """
+        Porcentagem de vitórias de cada comportamento em cada assento.
+        """
+        return {
+            name: [
+                _rate(wins, played)
+                for wins, played in zip(self.wins.get(name, [0] * self.seats), row)
+            ]
+            for name, row in self.appearances.items()
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "matches": self.matches,
+            "timeouts": self.statistic.timeouts,
+            "rounds_mean": self.statistic.rounds_mean,
+            "win_rates": self.win_rates,
+            "seat_win_rates": self.seat_win_rates,
+            "table": self.table,
+            "wins": self.wins,
+            "appearances": self.appearances,
+        }
+
+
+def _rate(wins: int, played: int) -> float:
+    return wins / played * 100 if played else 0.0
+
+
+def play_lineup(
+    lineup: Lineup, shard: Shard, rules: Rules = DEFAULT_RULES
+) -> Standings:
+    """
+    Partidas shard.start .. shard.start + shard.size com a formação; a partida i
+    usa a fonte Variates().source(semente mestre, i), a mesma em todas as formações.
+    """
+    variates = Variates()
+    behaviors = [get(name) for name in lineup]
+    standings = Standings(seats=len(lineup))
+    board = None
+    for i in range(shard.start, shard.start + shard.size):
+        rng = variates.source(shard.master_seed, i)
+        if board is None:
+            board = Board.create(rng=rng, rules=rules, behaviors=behaviors)
+        else:
+            board.reset(rng=rng)
+        standings.add(lineup, board.match())
+    return standings
+
+
+class Tournament:
+    """
+    Joga number_of_runs partidas com cada formação; as partidas de mesmo índice
+    têm as mesmas propriedades e dados em todas as formações.
+    """
+
+    def __init__(
+        self,
+        lineups: Sequence[Lineup] = None,
+        seed: int = 0,
+        rules: Rules = DEFAULT_RULES,
+        workers: int = 1,
+        shard_size: int = 100,
+    ):
+        self.lineups = [tuple(lineup) for lineup in (lineups or lineups_of())]
+        seats = {len(lineup) for lineup in self.lineups}
+        if len(seats) != 1:
+            raise ValueError("All the lineups must have the same number of seats")
+        self.seed = seed
+        self.rules = rules
+        self.workers = workers
+        self.shard_size = shard_size
+        self.standings = Standings(seats=seats.pop())
+
+    def play(self, number_of_runs: int) -> Standings:
+        for standings in self._play_units(number_of_runs):
+            self.standings.merge(standings)
+        return self.standings
+
+    def _play_units(self, number_of_runs: int) -> Iterator[Standings]:
+        shards = Shard.split(number_of_runs, self.shard_size, self.seed)
+        units = [(lineup, shard) for lineup in self.lineups for shard in shards]
+        lineup, shard = zip(*units) if units else ((), ())
+
+        if self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                yield from executor.map(play_lineup, lineup, shard, repeat(self.rules))
+        else:
+            yield from map(play_lineup, lineup, shard, repeat(self.rules))
@@ -0,0 +1,80 @@
+"""
+Redução de variância com números aleatórios comuns e variáveis antitéticas.
+
+Sem redução, as partidas de uma fatia usam uma única RandomSource em sequência,
+então a partida i depende de quantos dados as anteriores jogaram. Com Variates,
+cada partida tem a sua própria fonte, derivada só da semente do Game e do índice
+da partida: dois Games com a mesma semente e regras diferentes sorteiam as mesmas
+propriedades, os mesmos dados e as mesmas moedas na partida i (CRN).
+"""
+
+import hashlib
+from dataclasses import dataclass
+
+from monopoly import config
+from monopoly.domain.random_source import RandomSource
+from monopoly.domain.rules import Rules
+
+MODES = ("antithetic",)
+MATCH_BUFFER_SIZE = 512
+
+
+@dataclass(frozen=True)
+class Variates:
+    """
+    antithetic: as partidas 2k e 2k + 1 usam a mesma fonte, a segunda com os
+    dados opostos (7 - d), e a média de rodadas de cada par é acumulada.
+    baseline: cada partida também é jogada com essas regras e a mesma fonte,
+    e a diferença de rodadas (regras - baseline) é acumulada.
+    """
+
+    antithetic: bool = False
+    baseline: Rules = None
+
+    @staticmethod
+    def from_config() -> "Variates":
+        """
+        VARIANCE_REDUCTION=antithetic; None quando não configurado. Números
+        aleatórios comuns precisam de duas regras para comparar (Sweep).
+        """
+        mode = config.VARIANCE_REDUCTION
+        if mode is None:
+            return None
+        if mode == "crn":
+            raise ValueError(
+                "crn compares rules with a baseline: use monopoly sweep "
+                "--common-random-numbers"
+            )
+        if mode not in MODES:
+            raise ValueError(f"Unknown variance reduction: {mode}")
+        return Variates(antithetic=mode == "antithetic")
+
+    @staticmethod
+    def match_seed(master_seed: int, match: int) -> int:
+        digest = hashlib.sha256(f"{master_seed}:match:{match}".encode()).digest()
+        return int.from_bytes(digest[:8], "big")
+
+    def source(self, master_seed: int, match: int) -> RandomSource:
+        """
+        Fonte de números aleatórios da partida `match`.
+        """
+        pair = match // 2 if self.antithetic else match
+        return RandomSource(
+            seed=self.match_seed(master_seed, pair),
+            buffer_size=MATCH_BUFFER_SIZE,
+            antithetic=self.antithetic and match % 2 == 1,
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "antithetic": self.antithetic,
+            "baseline": self.baseline.to_dict() if self.baseline else None,
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "Variates":
+        baseline = data["baseline"]
+        return Variates(
+            antithetic=data["antithetic"],
+            baseline=Rules(**baseline) if baseline else None,
+        )
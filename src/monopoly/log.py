@@ -0,0 +1,38 @@
+"""
+Loggers da aplicação.
+
+init_logger só cria o logger, sem configurar handlers: a configuração
+(formato, nível e rastreamento) é feita uma vez pelo ponto de entrada com configure.
+Até lá, os loggers ficam no nível ERROR, o padrão de LOG_LEVEL.
+"""
+
+import logging
+from typing import List
+
+FORMAT = "%(asctime)s [%(levelname)7s] %(name)-16s %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_level = logging.ERROR
+_loggers: List[logging.Logger] = []
+
+
+def init_logger(name: str = None, level: int = None) -> logging.Logger:
+    logger = logging.getLogger(name) if name else logging.getLogger()
+    logger.setLevel(level=level if level is not None else _level)
+    if level is None:
+        _loggers.append(logger)
+    return logger
+
+
+def configure(level: int) -> None:
+    """
+    Configura o logging do processo (chamado apenas pelos pontos de entrada).
+    """
+    global _level
+    from monopoly import tracing
+
+    logging.basicConfig(format=FORMAT, datefmt=DATE_FORMAT)
+    _level = level
+    for logger in _loggers:
+        logger.setLevel(level)
+    tracing.enable(level <= logging.INFO)
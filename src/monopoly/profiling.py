@@ -0,0 +1,185 @@
+"""
+Instrumentação opcional do caminho crítico de Board.match.
+
+Quando ligada (PROFILE=1), as funções de cada fase da jogada são substituídas
+por versões que contam chamadas e nanossegundos. Desligada, nada é substituído
+e o custo é zero.
+"""
+
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter_ns
+from typing import Callable, Dict, List
+
+from monopoly.domain.board import Board
+from monopoly.domain.player import PlayerAbstract
+
+PHASES = {
+    "dice": (Board, "roll_dice"),
+    "movement": (PlayerAbstract, "move_spaces"),
+    "purchase": (Board, "purchase"),
+    "rent": (Board, "pay_rent"),
+    "bankruptcy": (Board, "take_estates"),
+    "removal": (Board, "remove_player"),
+    "round_check": (Board, "next_round"),
+}
+FINISHES = ("normal", "timeout")
+
+
+@dataclass
+class Profile:
+    """
+    Contadores de chamadas e tempo (ns) por fase, tempo por partida
+    separado por término normal ou por time out, e a relação rodadas x tempo
+    (regressão linear calculada de forma incremental).
+    """
+
+    phases: Dict[str, List[int]] = field(
+        default_factory=lambda: {phase: [0, 0] for phase in PHASES}
+    )
+    finishes: Dict[str, List[int]] = field(
+        default_factory=lambda: {finish: [0, 0, 0] for finish in FINISHES}
+    )
+    # sums of rounds (x) and match ns (y) for the least squares fit
+    sum_x: float = 0.0
+    sum_y: float = 0.0
+    sum_xx: float = 0.0
+    sum_xy: float = 0.0
+    game_ns: int = 0
+
+    def add_match(self, rounds: int, timeout: bool, ns: int) -> None:
+        finish = self.finishes["timeout" if timeout else "normal"]
+        finish[0] += 1
+        finish[1] += ns
+        finish[2] += rounds
+        self.sum_x += rounds
+        self.sum_y += ns
+        self.sum_xx += rounds * rounds
+        self.sum_xy += rounds * ns
+
+    def merge(self, other: "Profile") -> "Profile":
+        for phase, (calls, ns) in other.phases.items():
+            self.phases[phase][0] += calls
+            self.phases[phase][1] += ns
+        for finish, values in other.finishes.items():
+            for i, value in enumerate(values):
+                self.finishes[finish][i] += value
+        self.sum_x += other.sum_x
+        self.sum_y += other.sum_y
+        self.sum_xx += other.sum_xx
+        self.sum_xy += other.sum_xy
+        self.game_ns += other.game_ns
+        return self
+
+    @property
+    def matches(self) -> int:
+        return sum(matches for matches, _, _ in self.finishes.values())
+
+    @property
+    def match_ns(self) -> int:
+        return sum(ns for _, ns, _ in self.finishes.values())
+
+    @property
+    def ns_per_round(self) -> float:
+        """
+        Inclinação da reta tempo = a + b * rodadas.
+        """
+        n = self.matches
+        denominator = n * self.sum_xx - self.sum_x**2
+        if not denominator:
+            return 0.0
+        return (n * self.sum_xy - self.sum_x * self.sum_y) / denominator
+
+    @property
+    def ns_per_match_fixed(self) -> float:
+        """
+        Intercepto da reta tempo = a + b * rodadas (custo fixo de uma partida).
+        """
+        if not self.matches:
+            return 0.0
+        return (self.sum_y - self.ns_per_round * self.sum_x) / self.matches
+
+    def to_dict(self) -> dict:
+        return {
+            "phases": {
+                phase: {"calls": calls, "ns": ns}
+                for phase, (calls, ns) in self.phases.items()
+            },
+            "finishes": {
+                finish: {"matches": matches, "ns": ns, "rounds": rounds}
+                for finish, (matches, ns, rounds) in self.finishes.items()
+            },
+            "ns_per_round": self.ns_per_round,
+            "ns_per_match_fixed": self.ns_per_match_fixed,
+            "match_ns": self.match_ns,
+            "game_ns": self.game_ns,
+        }
+
+
+_current: Profile = None
+_originals: Dict[str, object] = {}
+
+
+def _timed(phase: str, function: Callable) -> Callable:
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            counter = _current.phases[phase]
+            counter[0] += 1
+            counter[1] += perf_counter_ns() - start
+
+    return wrapper
+
+
+def _timed_match(function: Callable) -> Callable:
+    @wraps(function)
+    def wrapper(board: Board):
+        start = perf_counter_ns()
+        result = function(board)
+        _current.add_match(
+            rounds=result["rounds"],
+            timeout=bool(result["timeout"]),
+            ns=perf_counter_ns() - start,
+        )
+        return result
+
+    return wrapper
+
+
+def start() -> Profile:
+    """
+    Liga a instrumentação neste processo e começa um novo Profile.
+    """
+    global _current
+    _current = Profile()
+    if _originals:
+        return _current
+
+    for phase, (cls, name) in PHASES.items():
+        original = cls.__dict__[name]
+        _originals[phase] = original
+        if isinstance(original, staticmethod):
+            setattr(cls, name, staticmethod(_timed(phase, original.__func__)))
+        else:
+            setattr(cls, name, _timed(phase, original))
+    _originals["match"] = Board.__dict__["match"]
+    Board.match = _timed_match(Board.match)
+    return _current
+
+
+def stop() -> Profile:
+    """
+    Restaura as funções originais e retorna o Profile coletado.
+    """
+    global _current
+    for phase, (cls, name) in PHASES.items():
+        if phase in _originals:
+            setattr(cls, name, _originals.pop(phase))
+    if "match" in _originals:
+        Board.match = _originals.pop("match")
+
+    profile, _current = _current, None
+    return profile
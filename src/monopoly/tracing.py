@@ -0,0 +1,14 @@
+"""
+Rastreamento dos eventos de cada jogada (dados, movimento, compra, aluguel...).
+
+Os trechos do caminho crítico ficam protegidos por `if tracing.ENABLED:`,
+então com o rastreamento desligado nenhuma mensagem é formatada
+e nenhum logger é consultado. É ligado por log.configure com LOG_LEVEL <= INFO.
+"""
+
+ENABLED = False
+
+
+def enable(enabled: bool = True) -> None:
+    global ENABLED
+    ENABLED = enabled
@@ -0,0 +1,194 @@
+import json
+import operator
+import os
+from logging import WARNING
+from pprint import pprint
+from typing import Union
+
+from monopoly import config
+from monopoly.domain.accumulator import Accumulator
+from monopoly.domain.precision import Precision
+from monopoly.domain.records import RecordFile
+from monopoly.utils import print_head, print_line
+
+
+def display_stdout(
+    statistic: Union[Accumulator, str, os.PathLike], precision: Precision = None
+) -> None:
+    """
+    statistic pode ser o caminho de um arquivo de registros (domain.records):
+    o relatório é calculado a partir do arquivo, sem simular de novo.
+    """
+    if isinstance(statistic, (str, os.PathLike)):
+        statistic = RecordFile(statistic).statistic()
+
+    if config.LOG_LEVEL <= WARNING:
+        print("***** Statistics *****")
+        pprint(statistic)
+
+    print_head("")
+    print_head(f"RESULTADO APÓS EXECUTAR {statistic.matches} SIMULAÇÕES")
+    print_head("\n")
+
+    print_head("Quantas partidas terminam por time out (1000 rodadas)?")
+    print_line("Total", statistic.timeouts, ln_break=True)
+
+    print_head("Quantos turnos em média demora uma partida?")
+    print_line("Média", f"{statistic.rounds_mean:.2f}", ln_break=True)
+
+    behaviors = statistic.win_percentages
+    print_head("Qual a porcentagem de vitórias por comportamento dos jogadores?")
+    for behavior, percent in behaviors.items():
+        print_line(behavior, f"{percent:.2f}%")
+    print()
+
+    print_head("Qual o comportamento que mais vence?")
+    print_line(
+        "Comportamento", sorted(behaviors.items(), key=operator.itemgetter(1)).pop()[0]
+    )
+
+    if precision is not None:
+        print()
+        display_precision(statistic, precision)
+
+    if statistic.pairs is not None or statistic.differences is not None:
+        print()
+        display_variance(statistic)
+
+    if statistic.profile is not None:
+        print()
+        display_profile(statistic.profile)
+
+
+def display_tournament(standings) -> None:
+    """
+    Relatório do torneio com rodízio de assentos (domain.tournament).
+    """
+    seats = range(1, standings.seats + 1)
+    print_head("")
+    print_head(f"TORNEIO: {standings.matches} PARTIDAS EM {standings.seats} ASSENTOS")
+    print_head("\n")
+
+    print_head("Quantas partidas terminam por time out (1000 rodadas)?")
+    print_line("Total", standings.statistic.timeouts, ln_break=True)
+
+    rates = standings.win_rates
+    print_head("Qual a porcentagem de vitórias por jogador de cada comportamento?")
+    for behavior, percent in sorted(rates.items(), key=operator.itemgetter(1)):
+        print_line(behavior, f"{percent:.2f}%")
+    print_line("Sem vantagem", f"{100 / standings.seats:.2f}%", ln_break=True)
+
+    print_head("Qual a porcentagem de vitórias de cada assento?")
+    for seat, percent in zip(seats, standings.seat_win_rates):
+        print_line(f"Assento {seat}", f"{percent:.2f}%")
+    print()
+
+    print_head("Qual a porcentagem de vitórias por comportamento e assento?")
+    print_line("", "  ".join(f"{seat:>7}" for seat in seats), sep="")
+    for behavior, row in standings.table.items():
+        print_line(behavior, "  ".join(f"{percent:6.2f}%" for percent in row))
+    print()
+
+    print_head("Qual o comportamento que mais vence?")
+    print_line("Comportamento", max(rates.items(), key=operator.itemgetter(1))[0])
+
+
+def display_variance(statistic: Accumulator) -> None:
+    """
+    Eficiência: quantas partidas independentes cada partida vale
+    (a mesma precisão com 1 / eficiência das partidas).
+    """
+    print_head("Qual a redução de variância alcançada?")
+    if statistic.pairs is not None:
+        print_line("Pares antitéticos", statistic.pairs.count)
+        print_line("Eficiência", _efficiency(statistic.antithetic_efficiency))
+    if statistic.differences is not None:
+        differences = statistic.differences
+        print_line(
+            "Diferença (baseline)",
+            f"{differences.mean:+.2f} ± {differences.interval():.2f} rodadas",
+        )
+        print_line("Eficiência (CRN)", _efficiency(statistic.crn_efficiency))
+
+
+def _efficiency(efficiency: float) -> str:
+    if efficiency is None:
+        return "-"
+    return f"{efficiency:.2f}x ({1 / efficiency:.0%} das partidas)"
+
+
+def display_precision(statistic: Accumulator, precision: Precision) -> None:
+    print_head(f"Qual a precisão alcançada (intervalo de {precision.confidence:.0%})?")
+    print_line("Partidas", statistic.matches)
+    print_line("Convergiu", "sim" if precision.converged else "não (limite)")
+    print_line("Média", f"± {precision.rounds_interval(statistic):.2f}")
+    for behavior, interval in precision.win_intervals(statistic).items():
+        print_line(behavior, f"± {interval:.2f}%")
+
+
+def display_profile(profile) -> None:
+    match_ns = profile.match_ns or 1
+
+    print_head("Onde o tempo das partidas é gasto (por fase)?")
+    for phase, (calls, ns) in profile.phases.items():
+        per_call = ns / calls if calls else 0
+        print_line(
+            phase,
+            f"{calls:>10} x {per_call:8.0f} ns = {ns / match_ns * 100:6.2f}%",
+        )
+    print()
+
+    print_head("Quanto tempo leva uma partida?")
+    for finish, (matches, ns, rounds) in profile.finishes.items():
+        per_match = ns / matches / 1e6 if matches else 0
+        per_round = ns / rounds if rounds else 0
+        print_line(
+            finish, f"{matches:>10} x {per_match:8.3f} ms ({per_round:.0f} ns/rodada)"
+        )
+    print_line("Custo fixo", f"{profile.ns_per_match_fixed / 1e6:.3f} ms")
+    print_line("Por rodada", f"{profile.ns_per_round:.0f} ns")
+    print_line("Game.play", f"{profile.game_ns / 1e9:.3f} s", ln_break=True)
+
+
+def dump_profile(profile, path: str) -> None:
+    with open(path, "w") as file:
+        json.dump(profile.to_dict(), file, indent=2)
+
+
+def display_replay(path: str, match: int = None, step: int = None) -> None:
+    """
+    Estado do tabuleiro de uma partida do rastro depois de `step` jogadas
+    (final da partida por padrão). Sem match, a primeira partida do arquivo;
+    sem a partida no arquivo, SystemExit.
+    """
+    from monopoly.domain.event_trace import TraceFile
+
+    traces = TraceFile(path)
+    if match is None:
+        trace = next(iter(traces), None)
+        if trace is None:
+            raise SystemExit(f"{path}: trace has no matches")
+    else:
+        try:
+            trace = traces.find(match)
+        except KeyError:
+            raise SystemExit(f"{path}: match {match} not in trace") from None
+    state = trace.state(step)
+
+    print_head(f"PARTIDA {trace.match}")
+    print_line(
+        "Fatia", f"semente {trace.shard_seed}, desde a partida {trace.shard_start}"
+    )
+    print_line("Jogada", f"{state.step}/{trace.steps}")
+    print_line("Rodada", state.rounds, ln_break=True)
+    for seat, behavior in enumerate(trace.behaviors):
+        owned = sum(1 for owner in state.owners if owner == seat)
+        print_line(
+            f"{seat + 1} {behavior.name}",
+            f"casa {state.positions[seat]:>3}  saldo {state.balances[seat]:+10.2f}  "
+            f"voltas {state.turns[seat]:>3}  propriedades {owned:>3}"
+            + ("" if state.alive[seat] else "  (falido)"),
+        )
+    if state.winner is not None:
+        print()
+        print_line("Vencedor", trace.behaviors[state.winner].name)
@@ -0,0 +1,79 @@
+import statistics
+import unittest
+
+from monopoly.domain.accumulator import Accumulator
+from monopoly.domain.player import STRATEGIES, PlayerFactory
+from monopoly.domain.player.strategy import IMPULSIVE, PICKY, RANDOM, WARY
+
+
+class AccumulatorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rounds = [12, 1000, 431, 87, 1000, 5, 640]
+        self.behaviors = [
+            IMPULSIVE,
+            WARY,
+            WARY,
+            PICKY,
+            RANDOM,
+            IMPULSIVE,
+            WARY,
+        ]
+        self.results = [
+            {
+                "timeout": int(rounds >= 1000),
+                "rounds": rounds,
+                "winner": PlayerFactory.create(behavior=behavior),
+                "behavior": {n: int(b is behavior) for n, b in STRATEGIES.items()},
+            }
+            for rounds, behavior in zip(self.rounds, self.behaviors)
+        ]
+
+    def accumulate(self, results) -> Accumulator:
+        statistic = Accumulator()
+        for result in results:
+            statistic.add(result)
+        return statistic
+
+    def test_add(self):
+        statistic = self.accumulate(self.results)
+
+        self.assertEqual(statistic.matches, 7)
+        self.assertEqual(statistic.timeouts, 2)
+        self.assertAlmostEqual(statistic.rounds_mean, statistics.mean(self.rounds))
+        self.assertAlmostEqual(
+            statistic.rounds_variance, statistics.variance(self.rounds)
+        )
+        self.assertEqual(
+            statistic.wins, {"Impulsive": 2, "Picky": 1, "Wary": 3, "Random": 1}
+        )
+
+    def test_win_percentages(self):
+        statistic = self.accumulate(self.results)
+
+        self.assertAlmostEqual(statistic.win_percentages["Wary"], 3 / 7 * 100)
+        self.assertAlmostEqual(sum(statistic.win_percentages.values()), 100.0)
+
+    def test_empty(self):
+        statistic = Accumulator()
+
+        self.assertEqual(statistic.rounds_variance, 0.0)
+        self.assertEqual(set(statistic.win_percentages.values()), {0.0})
+
+    def test_merge_is_the_same_as_adding_all_results(self):
+        everything = self.accumulate(self.results)
+
+        merged = self.accumulate(self.results[:3]).merge(
+            self.accumulate(self.results[3:])
+        )
+
+        self.assertEqual(merged.matches, everything.matches)
+        self.assertEqual(merged.timeouts, everything.timeouts)
+        self.assertEqual(merged.wins, everything.wins)
+        self.assertAlmostEqual(merged.rounds_mean, everything.rounds_mean)
+        self.assertAlmostEqual(merged.rounds_m2, everything.rounds_m2)
+
+    def test_merge_with_empty(self):
+        everything = self.accumulate(self.results)
+
+        self.assertEqual(Accumulator().merge(everything), everything)
+        self.assertEqual(self.accumulate(self.results).merge(Accumulator()), everything)
@@ -0,0 +1,101 @@
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from monopoly.domain.board import ROUND_LIMIT
+from monopoly.domain.game import Game
+from monopoly.domain.player import PlayerAbstract
+from monopoly.domain.player.strategy import IMPULSIVE
+from monopoly.domain.rules import Rules
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class BatchBoardTest(unittest.TestCase):
+    def setUp(self) -> None:
+        from monopoly.domain.batch import BatchBoard
+
+        self.board = BatchBoard(size=50, rng=np.random.default_rng(42))
+
+    def test_match_returns_one_result_per_board(self):
+        results = self.board.match()
+
+        self.assertEqual(len(results), 50)
+        for result in results:
+            self.assertEqual(
+                set(result.keys()),
+                {"timeout", "rounds", "winner", "behavior", "balances", "bankruptcies"},
+            )
+
+    def test_match_result_has_same_shape_of_board_match(self):
+        """
+        ...o jogo termina na milésima rodada com a vitória do jogador com mais saldo.
+        """
+        for result in self.board.match():
+            self.assertIsInstance(result["winner"], PlayerAbstract)
+            self.assertEqual(sum(result["behavior"].values()), 1)
+            self.assertEqual(result["behavior"][result["winner"].behavior.name], 1)
+            self.assertGreaterEqual(result["rounds"], 0)
+            self.assertLessEqual(result["rounds"], ROUND_LIMIT)
+            if result["timeout"]:
+                self.assertEqual(result["rounds"], ROUND_LIMIT)
+            else:
+                self.assertGreaterEqual(result["winner"].balance, 0)
+                self.assertEqual(len(result["bankruptcies"]), 3)
+            seat = result["winner"].id - 1
+            self.assertNotIn(seat, result["bankruptcies"])
+            self.assertEqual(result["balances"][seat], result["winner"].balance)
+            for loser in result["bankruptcies"]:
+                self.assertLess(result["balances"][loser], 0)
+
+    def test_match_is_reproducible_with_same_seed(self):
+        from monopoly.domain.batch import BatchBoard
+
+        first = BatchBoard(size=20, rng=np.random.default_rng(7)).match()
+        second = BatchBoard(size=20, rng=np.random.default_rng(7)).match()
+
+        self.assertEqual(
+            [(r["rounds"], r["winner"].id, r["winner"].balance) for r in first],
+            [(r["rounds"], r["winner"].id, r["winner"].balance) for r in second],
+        )
+
+    def test_impulsive_player_alone_always_wins(self):
+        from monopoly.domain.batch import BatchBoard
+
+        board = BatchBoard(size=5, behaviors=[IMPULSIVE], rng=np.random.default_rng(1))
+
+        for result in board.match():
+            self.assertEqual(result["rounds"], 0)
+            self.assertEqual(result["winner"].behavior, IMPULSIVE)
+
+    def test_match_with_rules(self):
+        from monopoly.domain.batch import BatchBoard
+
+        rules = Rules(balance=10_000.0, quantity_estates=40, round_limit=5)
+        board = BatchBoard(size=20, rules=rules, rng=np.random.default_rng(3))
+
+        for result in board.match():
+            # nobody goes bankrupt with this balance in 5 rounds
+            self.assertEqual(result["rounds"], 5)
+            self.assertEqual(result["timeout"], 1)
+            self.assertIs(result["winner"].rules, rules)
+
+    def test_match_with_more_players(self):
+        from monopoly.domain.batch import BatchBoard
+
+        rules = Rules(quantity_players=6)
+        board = BatchBoard(size=10, rules=rules, rng=np.random.default_rng(5))
+
+        self.assertEqual(len(board.behaviors), 6)
+        for result in board.match():
+            self.assertEqual(len(result["balances"]), 6)
+            self.assertLess(result["winner"].id, 7)
+
+    def test_game_play_with_batch_engine(self):
+        game = Game(engine="batch")
+
+        game.play(number_of_runs=30)
+
+        self.assertEqual(game.statistic.matches, 30)
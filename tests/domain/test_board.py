@@ -1,9 +1,12 @@
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
-from domain.board import Board
-from domain.estate import Estate
-from domain.player import BehaviorEnum, PlayerFactory
+from monopoly.domain.board import Board, standing
+from monopoly.domain.estate import Estate
+from monopoly.domain.player import PlayerFactory
+from monopoly.domain.player.strategy import IMPULSIVE, PICKY, RANDOM, WARY
+from monopoly.domain.random_source import RandomSource
+from monopoly.domain.rules import Rules
 
 
 class BoardTest(unittest.TestCase):
@@ -41,6 +44,17 @@ class BoardTest(unittest.TestCase):
         for p in self.board.players:
             self.assertEqual(p.balance, 300.0)
 
+    def test_create_with_rules(self):
+        rules = Rules(balance=500.0, quantity_estates=30, round_limit=10)
+
+        board = Board.create(rules=rules)
+
+        self.assertEqual(len(board.estates), 30)
+        for p in board.players:
+            self.assertEqual(p.balance, 500.0)
+            self.assertIs(p.rules, rules)
+        self.assertLessEqual(board.match()["rounds"], 10)
+
     def test_roll_dice(self):
         """
         No começo da sua vez, o jogador joga um dado equiprovável de 6 faces
@@ -61,7 +75,7 @@ class BoardTest(unittest.TestCase):
         buyer = PlayerFactory.create(
             _id=1,
             balance=balance_before_purchase,
-            behavior=BehaviorEnum.IMPULSIVE,
+            behavior=IMPULSIVE,
         )
         estate = Estate(
             sale_price=sale_price,
@@ -186,7 +200,7 @@ class BoardTest(unittest.TestCase):
         """
         O jogador impulsivo compra qualquer propriedade sobre a qual ele parar.
         """
-        behavior = BehaviorEnum.IMPULSIVE
+        behavior = IMPULSIVE
         sale_price = 49.99
         balance_before_purchase = 200.0
         balance_after_purchase = balance_before_purchase - sale_price
@@ -210,7 +224,7 @@ class BoardTest(unittest.TestCase):
         """
         O jogador exigente compra qualquer propriedade, desde que o valor do aluguel dela seja maior do que 50.
         """
-        behavior = BehaviorEnum.PICKY
+        behavior = PICKY
         rent_value = 50.01
         sale_price = 99.99
         balance_before_purchase = 300.0
@@ -235,7 +249,7 @@ class BoardTest(unittest.TestCase):
         """
         O jogador exigente compra qualquer propriedade, desde que o valor do aluguel dela seja maior do que 50.
         """
-        behavior = BehaviorEnum.PICKY
+        behavior = PICKY
         rent_value = 50.0
         sale_price = 99.99
         balance_before_purchase = 300.0
@@ -260,7 +274,7 @@ class BoardTest(unittest.TestCase):
         O jogador cauteloso compra qualquer propriedade desde que
         ele tenha uma reserva de 80 saldo sobrando depois de realizada a compra.
         """
-        behavior = BehaviorEnum.WARY
+        behavior = WARY
         sale_price = 100.0
         balance_before_purchase = 180.0
         balance_after_purchase = balance_before_purchase - sale_price
@@ -286,7 +300,7 @@ class BoardTest(unittest.TestCase):
         O jogador cauteloso compra qualquer propriedade desde que
         ele tenha uma reserva de 80 saldo sobrando depois de realizada a compra.
         """
-        behavior = BehaviorEnum.WARY
+        behavior = WARY
         sale_price = 100.0
         balance_before_purchase = 179.99
         buyer = PlayerFactory.create(
@@ -310,7 +324,7 @@ class BoardTest(unittest.TestCase):
         """
         O jogador aleatório compra a propriedade que ele parar em cima com probabilidade de 50%.
         """
-        behavior = BehaviorEnum.RANDOM
+        behavior = RANDOM
         sale_price = 100.0
         balance_before_purchase = 300.0
         balance_after_purchase = balance_before_purchase - sale_price
@@ -324,11 +338,9 @@ class BoardTest(unittest.TestCase):
             rent_value=49.98,
         )
 
-        with patch(
-            "domain.player.player_random.PlayerRandom.validate_purchase_behavioral_rules",
-            Mock(return_value=True),
-        ):
-            sold = self.board.purchase(player=buyer, estate=estate)
+        buyer.rng = Mock(chance=Mock(return_value=True))
+
+        sold = self.board.purchase(player=buyer, estate=estate)
 
         self.assertTrue(sold)
         self.assertEqual(estate.owner, buyer)
@@ -339,7 +351,7 @@ class BoardTest(unittest.TestCase):
         """
         O jogador aleatório compra a propriedade que ele parar em cima com probabilidade de 50%.
         """
-        behavior = BehaviorEnum.RANDOM
+        behavior = RANDOM
         sale_price = 100.0
         balance_before_purchase = 300.0
         balance_after_purchase = balance_before_purchase - sale_price
@@ -353,11 +365,9 @@ class BoardTest(unittest.TestCase):
             rent_value=49.98,
         )
 
-        with patch(
-            "domain.player.player_random.PlayerRandom.validate_purchase_behavioral_rules",
-            Mock(return_value=False),
-        ):
-            sold = self.board.purchase(player=buyer, estate=estate)
+        buyer.rng = Mock(chance=Mock(return_value=False))
+
+        sold = self.board.purchase(player=buyer, estate=estate)
 
         self.assertFalse(sold)
         self.assertIsNone(estate.owner)
@@ -384,6 +394,213 @@ class BoardTest(unittest.TestCase):
 
         self.assertIsNone(estate.owner)
 
+    def test_take_estates_keeps_estates_of_other_players(self):
+        """
+        Um jogador que... perde o jogo... Perde suas propriedades...
+        """
+        loser, other = self.board.players[0], self.board.players[2]
+        estate1, estate2 = self.board.estates[0], self.board.estates[1]
+        self.board.purchase(player=loser, estate=estate1)
+        self.board.purchase(player=other, estate=estate2)
+
+        self.board.take_estates(player=loser)
+
+        self.assertIsNone(estate1.owner)
+        self.assertIs(estate2.owner, other)
+        self.assertEqual(self.board.qtd_estates_owned(loser), 0)
+        self.assertEqual(self.board.qtd_estates_owned(other), 1)
+        self.assertEqual(self.board.qtd_owned, 1)
+
+    def test_qtd_estates_owned(self):
+        player = self.board.players[0]
+        self.board.purchase(player=player, estate=self.board.estates[0])
+        self.board.purchase(player=player, estate=self.board.estates[1])
+
+        self.assertEqual(self.board.qtd_estates_owned(player), 2)
+        self.assertEqual(self.board.qtd_estates_owned(self.board.players[1]), 0)
+        self.assertFalse(self.board.all_estates_owned)
+
+    def test_all_estates_owned(self):
+        player = PlayerFactory.create(_id=1, balance=10_000.0, behavior=IMPULSIVE)
+        board = Board(players=[player])
+        for estate in board.estates:
+            board.purchase(player=player, estate=estate)
+
+        self.assertTrue(board.all_estates_owned)
+
+    def test_remove_player(self):
+        """
+        Um jogador que fica com saldo negativo perde o jogo, e não joga mais.
+        """
+        player = self.board.players[1]
+
+        self.board.remove_player(player=player)
+
+        self.assertIs(self.board.losers[0], player)
+        self.assertEqual(self.board.pending, 1)
+        # the player leaves the list at the end of the round
+        self.board.drop_losers()
+        self.assertEqual([p.id for p in self.board.players], [1, 3, 4])
+        self.assertEqual(self.board.pending, 0)
+
+    def test_many_players_take_the_behaviors_in_turn(self):
+        rules = Rules(quantity_players=10, quantity_estates=500)
+        board = Board.create(rng=RandomSource(seed=2), rules=rules)
+
+        self.assertEqual([p.id for p in board.players], list(range(1, 11)))
+        self.assertEqual(
+            [p.behavior for p in board.players],
+            [IMPULSIVE, PICKY, WARY, RANDOM] * 2 + [IMPULSIVE, PICKY],
+        )
+        result = board.match()
+
+        self.assertEqual(len(result["balances"]), 10)
+        self.assertEqual(len(board.players) + len(board.losers), 10)
+        self.assertIs(result["winner"], max(board.players, key=standing))
+
+    def test_players_of_a_strategy_share_the_purchase_limits(self):
+        board = Board.create(rules=Rules(quantity_players=8))
+
+        limits = board.purchase_limits()
+
+        self.assertIs(limits[1], limits[5])
+        self.assertIsNot(limits[1], limits[2])
+        self.assertEqual(len({id(limit) for limit in limits.values()}), 4)
+
+    def test_bankruptcies_leave_the_players_at_the_end_of_the_round(self):
+        board = self.landlord_board(10.0, 1000.0, 10.0, 1000.0)
+        board.next_round()
+
+        board.play_round()
+
+        self.assertEqual([p.id for p in board.losers], [1, 3])
+        self.assertEqual([p.id for p in board.players], [2, 4, 5])
+        self.assertEqual(board.pending, 0)
+
+    def landlord_board(self, *balances: float) -> Board:
+        """
+        Tabuleiro em que o último jogador é dono de todas as propriedades
+        (aluguel de 100) e os outros começam com os saldos informados.
+        """
+        players = [
+            PlayerFactory.create(_id=i, balance=balance, behavior=WARY)
+            for i, balance in enumerate(balances, start=1)
+        ]
+        landlord = PlayerFactory.create(
+            _id=len(players) + 1, balance=10_000.0, behavior=IMPULSIVE
+        )
+        board = Board(players=[*players, landlord])
+        for estate in board.estates:
+            board.purchase(player=landlord, estate=estate)
+            estate.rent_value = 100.0
+        return board
+
+    def test_match_ends_as_soon_as_one_player_is_left(self):
+        """
+        Termina quando restar somente um jogador com saldo positivo, a qualquer momento da partida.
+        """
+        board = self.landlord_board(10.0, 10.0)
+        landlord = board.players[-1]
+
+        result = board.match()
+
+        self.assertIs(result["winner"], landlord)
+        self.assertEqual(result["rounds"], 1)
+        self.assertEqual(result["timeout"], 0)
+        self.assertEqual(result["bankruptcies"], [0, 1])
+        # the match ended before the landlord's turn
+        self.assertEqual(landlord.position, 0)
+
+    def test_round_after_bankruptcy_plays_every_other_player(self):
+        board = self.landlord_board(10.0, 1000.0, 1000.0)
+        board.next_round()
+
+        board.play_round()
+
+        self.assertEqual([p.id for p in board.losers], [1])
+        for player in board.players:
+            self.assertNotEqual(player.position, 0)
+
+    def test_next_round_counts_rounds(self):
+        board = Board.create(rules=Rules(round_limit=3))
+
+        self.assertEqual(board.rounds, 0)
+        self.assertTrue(board.next_round())
+        self.assertTrue(board.next_round())
+        self.assertTrue(board.next_round())
+        self.assertFalse(board.next_round())
+        self.assertEqual(board.rounds, 3)
+
+    def test_next_round_with_one_player(self):
+        board = Board(players=[PlayerFactory.create()])
+
+        self.assertFalse(board.next_round())
+        self.assertEqual(board.rounds, 0)
+
+    def test_match_timeout_plays_every_round(self):
+        """
+        ...o jogo termina na milésima rodada com a vitória do jogador com mais saldo.
+        """
+        rules = Rules(balance=10_000.0, round_limit=4)
+        board = Board.create(rules=rules)
+
+        result = board.match()
+
+        self.assertEqual(result["rounds"], 4)
+        self.assertEqual(result["timeout"], 1)
+        # four moves of at least one space each
+        for player in board.players:
+            self.assertGreaterEqual(player.position + player.turns * 20, 4)
+
+    def test_winner_has_the_highest_balance(self):
+        """
+        ...a vitória do jogador com mais saldo. O critério de desempate é a ordem de turno.
+        """
+        for seed in range(30):
+            board = Board.create(
+                rng=RandomSource(seed=seed), rules=Rules(round_limit=30)
+            )
+
+            result = board.match()
+
+            expected = sorted(board.players, key=lambda p: (p.balance, p.turns)).pop()
+            self.assertIs(result["winner"], expected)
+
+    def test_reset_plays_the_same_match_as_create(self):
+        created_rng, reused_rng = RandomSource(seed=6), RandomSource(seed=6)
+        board = Board.create(rng=reused_rng)
+        players, estates = list(board.players), list(board.estates)
+        board.match()
+        Board.create(rng=created_rng).match()
+
+        for _ in range(5):
+            created = Board.create(rng=created_rng).match()
+            reused = board.reset(rng=reused_rng).match()
+
+            self.assertEqual(reused["rounds"], created["rounds"])
+            self.assertEqual(reused["balances"], created["balances"])
+            self.assertEqual(reused["bankruptcies"], created["bankruptcies"])
+        self.assertEqual(
+            sorted(map(id, board.players + board.losers)), sorted(map(id, players))
+        )
+        self.assertTrue(all(e is o for e, o in zip(board.estates, estates)))
+
+    def test_reset_returns_to_the_start(self):
+        board = self.landlord_board(10.0, 10.0)
+        board.match()
+
+        board.reset(rng=RandomSource(seed=1))
+
+        self.assertEqual([p.id for p in board.players], [1, 2, 3])
+        self.assertEqual(board.losers, [])
+        self.assertEqual(board.rounds, 0)
+        self.assertEqual(board.qtd_owned, 0)
+        self.assertTrue(all(e.owner is None for e in board.estates))
+        for player in board.players:
+            self.assertEqual(
+                (player.balance, player.position, player.turns), (300, 0, 0)
+            )
+
     def test_take_various_estates_loser_player(self):
         """
         Um jogador que... perde o jogo... Perde suas propriedades...
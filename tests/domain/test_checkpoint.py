@@ -0,0 +1,134 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from monopoly.domain import game as game_module
+from monopoly.domain.checkpoint import Checkpoint
+from monopoly.domain.game import Game
+from monopoly.domain.precision import Precision
+from monopoly.domain.rules import Rules
+from monopoly.domain.variates import Variates
+
+
+class Interrupt(Exception):
+    pass
+
+
+def interrupted_after(shards: int):
+    """
+    play_shard que interrompe o processo depois de algumas fatias.
+    """
+    play_shard = game_module.play_shard
+    calls = []
+
+    def wrapper(*args):
+        if len(calls) == shards:
+            raise Interrupt()
+        calls.append(args)
+        return play_shard(*args)
+
+    return patch.object(game_module, "play_shard", side_effect=wrapper)
+
+
+class CheckpointTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "checkpoint.json")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_save_and_load(self):
+        game = Game(seed=3, shard_size=2, rules=Rules(balance=250.0))
+        game.play(number_of_runs=4)
+        checkpoint = Checkpoint(
+            seed=game.seed,
+            engine=game.engine,
+            shard_size=game.shard_size,
+            number_of_runs=4,
+            next_shard=2,
+            statistic=game.statistic,
+            rules=game.rules,
+            precision=Precision(win=5.0),
+        )
+
+        checkpoint.save(self.path)
+
+        self.assertEqual(Checkpoint.load(self.path), checkpoint)
+        self.assertEqual(os.listdir(self.directory.name), ["checkpoint.json"])
+
+    def test_failed_save_keeps_previous_checkpoint(self):
+        game = Game(seed=3, shard_size=2, checkpoint=self.path)
+        game.play(number_of_runs=4)
+
+        with patch("monopoly.atomic.os.fsync", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                Checkpoint.load(self.path).save(self.path)
+
+        self.assertEqual(Checkpoint.load(self.path).statistic, game.statistic)
+        self.assertEqual(os.listdir(self.directory.name), ["checkpoint.json"])
+
+    def test_resume_is_identical_to_uninterrupted_play(self):
+        uninterrupted = Game(seed=5, shard_size=3)
+        uninterrupted.play(number_of_runs=15)
+
+        game = Game(seed=5, shard_size=3, checkpoint=self.path, checkpoint_interval=0)
+        with interrupted_after(shards=2), self.assertRaises(Interrupt):
+            game.play(number_of_runs=15)
+        self.assertEqual(Checkpoint.load(self.path).next_shard, 2)
+
+        resumed = Game.resume(self.path)
+
+        self.assertEqual(resumed.statistic, uninterrupted.statistic)
+        self.assertEqual(Checkpoint.load(self.path).next_shard, 5)
+
+    def test_resume_adaptive_play(self):
+        precision = dict(rounds=80.0, min_runs=10, max_runs=60)
+        uninterrupted = Game(seed=8, shard_size=5)
+        uninterrupted.play_adaptive(Precision(**precision))
+
+        game = Game(seed=8, shard_size=5, checkpoint=self.path, checkpoint_interval=0)
+        with interrupted_after(shards=1), self.assertRaises(Interrupt):
+            game.play_adaptive(Precision(**precision))
+
+        resumed = Game.resume(self.path)
+
+        self.assertEqual(resumed.statistic, uninterrupted.statistic)
+        self.assertEqual(resumed.precision.converged, uninterrupted.precision.converged)
+
+    def test_resume_with_variance_reduction(self):
+        variates = Variates(antithetic=True, baseline=Rules(balance=200.0))
+        uninterrupted = Game(seed=6, shard_size=4, variates=variates)
+        uninterrupted.play(number_of_runs=16)
+
+        game = Game(
+            seed=6,
+            shard_size=4,
+            variates=variates,
+            checkpoint=self.path,
+            checkpoint_interval=0,
+        )
+        with interrupted_after(shards=2), self.assertRaises(Interrupt):
+            game.play(number_of_runs=16)
+
+        resumed = Game.resume(self.path)
+
+        self.assertEqual(resumed.variates, variates)
+        self.assertEqual(resumed.statistic, uninterrupted.statistic)
+
+    def test_resume_finished_game_plays_nothing(self):
+        Game(seed=1, shard_size=2, checkpoint=self.path).play(number_of_runs=4)
+
+        with interrupted_after(shards=0):
+            resumed = Game.resume(self.path)
+
+        self.assertEqual(resumed.statistic.matches, 4)
+
+    def test_unsupported_version(self):
+        with open(self.path, "w") as file:
+            json.dump({"version": 0}, file)
+
+        with self.assertRaises(ValueError):
+            Checkpoint.load(self.path)
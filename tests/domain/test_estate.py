@@ -1,8 +1,8 @@
 import unittest
 
-from config import QUANTITY_ESTATES
-from domain.estate import Estate
-from domain.player import PlayerFactory
+from monopoly.config import QUANTITY_ESTATES
+from monopoly.domain.estate import Estate
+from monopoly.domain.player import PlayerFactory
 
 
 class EstateTest(unittest.TestCase):
@@ -42,6 +42,12 @@ class EstateTest(unittest.TestCase):
 
         self.assertIsNone(estate.owner)
 
+    def test_estate_has_no_instance_dict(self):
+        estate = Estate(
+            sale_price=self.sale_price_valid, rent_value=self.rent_value_valid
+        )
+        self.assertFalse(hasattr(estate, "__dict__"))
+
     def test_factory_estates_with_quantity_20_default(self):
         estates = Estate.factory_estates()
         self.assertEqual(len(estates), QUANTITY_ESTATES)
@@ -0,0 +1,186 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from monopoly import config
+from monopoly.domain.board import Board
+from monopoly.domain.event_trace import (
+    EVENT,
+    MOVE,
+    NO_OWNER,
+    MatchTrace,
+    Sampling,
+    TracedBoard,
+    TraceFile,
+)
+from monopoly.domain.game import Game, Shard
+from monopoly.domain.player.strategy import CODES
+from monopoly.domain.random_source import RandomSource
+from monopoly.view import display_replay
+from tests.domain.test_checkpoint import Interrupt, interrupted_after
+
+
+class TracedBoardTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board = TracedBoard.create(rng=RandomSource(seed=12))
+        self.board.snapshot_every = 16
+        self.result = self.board.match()
+        self.trace = MatchTrace.parse(memoryview(self.board.trace()))
+
+    def test_tracing_does_not_change_the_match(self):
+        result = Board.create(rng=RandomSource(seed=12)).match()
+
+        self.assertEqual(self.result["rounds"], result["rounds"])
+        self.assertEqual(self.result["balances"], result["balances"])
+
+    def test_one_move_event_per_dice(self):
+        self.assertEqual(self.trace.steps, self.board.moves)
+        self.assertEqual(len(self.board.events) % EVENT.size, 0)
+
+    def test_replay_final_state(self):
+        state = self.trace.state()
+        seats = sorted(self.board.players + self.board.losers, key=lambda p: p.id)
+
+        self.assertEqual(state.step, self.board.moves)
+        self.assertEqual(state.rounds, self.board.rounds)
+        self.assertEqual(state.balances, [p.balance for p in seats])
+        self.assertEqual(state.positions, [p.position for p in seats])
+        self.assertEqual(state.turns, [p.turns for p in seats])
+        self.assertEqual(state.alive, [p not in self.board.losers for p in seats])
+        self.assertEqual(
+            state.owners,
+            [
+                NO_OWNER if e.owner is None else e.owner.id - 1
+                for e in self.board.estates
+            ],
+        )
+        self.assertEqual(state.winner, self.board.winner.id - 1)
+
+    def test_snapshots_give_the_same_state_as_replaying_from_the_start(self):
+        for step in (0, 1, 15, 16, 17, 40, self.trace.steps - 1, self.trace.steps):
+            self.assertEqual(
+                self.trace.state(step),
+                self.trace.state(step, use_snapshots=False),
+                f"step {step}",
+            )
+            self.assertEqual(self.trace.state(step).step, step)
+
+    def test_state_does_not_apply_the_following_move(self):
+        events = list(self.trace.iter_events())
+        state = self.trace.state(3)
+
+        self.assertEqual(events[state.event][0], MOVE)
+
+    def test_board_rebuilds_the_final_board(self):
+        board = self.trace.board()
+
+        self.assertEqual(board.winner.behavior, self.board.winner.behavior)
+        self.assertEqual(board.winner.balance, self.board.winner.balance)
+        self.assertEqual(board.qtd_owned, self.board.qtd_owned)
+        self.assertEqual(
+            [p.id for p in board.losers], sorted(p.id for p in self.board.losers)
+        )
+
+
+class GameTraceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "trace.bin")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_game_traces_sampled_matches(self):
+        game = Game(
+            seed=3, shard_size=4, trace=self.path, trace_sampling=Sampling(every=3)
+        )
+        game.play(number_of_runs=10)
+
+        traces = list(TraceFile(self.path))
+
+        self.assertEqual([trace.match for trace in traces], [0, 3, 6, 9])
+        self.assertEqual(TraceFile(self.path).find(6).match, 6)
+
+    def test_the_shard_replays_the_match(self):
+        Game(seed=3, shard_size=4, trace=self.path).play(number_of_runs=8)
+        trace = TraceFile(self.path).find(6)
+
+        self.assertEqual(trace.shard_start, 4)
+        self.assertEqual(trace.shard_seed, Shard.derive_seed(3, 1))
+        rng = RandomSource(seed=trace.shard_seed)
+        for _ in range(trace.shard_start, trace.match + 1):
+            board = Board.create(rng=rng)
+            result = board.match()
+        self.assertEqual(result["rounds"], trace.state().rounds)
+        self.assertEqual(result["balances"], trace.state().balances)
+
+    def test_behaviors_are_read_by_name(self):
+        Game(seed=3, shard_size=2, trace=self.path).play(number_of_runs=2)
+        expected = [trace.behaviors for trace in TraceFile(self.path)]
+
+        # another process may register the strategies in another order
+        CODES.reverse()
+        self.addCleanup(CODES.reverse)
+
+        self.assertEqual([trace.behaviors for trace in TraceFile(self.path)], expected)
+
+    def test_resume_truncates_the_trace_to_the_checkpoint(self):
+        checkpoint = os.path.join(self.directory.name, "checkpoint.json")
+        uninterrupted = os.path.join(self.directory.name, "uninterrupted.bin")
+        Game(seed=6, shard_size=2, trace=uninterrupted).play(number_of_runs=6)
+
+        game = Game(
+            seed=6,
+            shard_size=2,
+            trace=self.path,
+            checkpoint=checkpoint,
+            checkpoint_interval=0,
+        )
+        with interrupted_after(shards=2), self.assertRaises(Interrupt):
+            game.play(number_of_runs=6)
+        # matches traced after the last checkpoint (the last one incomplete)
+        with open(uninterrupted, "rb") as file:
+            after = file.read()[os.path.getsize(self.path) :]
+        with open(self.path, "ab") as file:
+            file.write(after[:-3])
+        with mock.patch.dict(os.environ, {"TRACE": self.path}):
+            config.reload()
+            try:
+                Game.resume(checkpoint)
+            finally:
+                config.reload()
+
+        with open(self.path, "rb") as resumed, open(uninterrupted, "rb") as expected:
+            self.assertEqual(resumed.read(), expected.read())
+
+    def test_only_timeouts(self):
+        game = Game(
+            seed=3,
+            shard_size=5,
+            trace=self.path,
+            trace_sampling=Sampling(only_timeouts=True),
+        )
+        game.play(number_of_runs=10)
+
+        traces = list(TraceFile(self.path))
+
+        self.assertEqual(len(traces), game.statistic.timeouts)
+        for trace in traces:
+            self.assertEqual(trace.state().rounds, trace.rules.round_limit)
+
+    def test_trace_requires_object_engine(self):
+        with self.assertRaises(ValueError):
+            Game(engine="batch", trace=self.path)
+
+    def test_display_replay(self):
+        Game(seed=3, shard_size=2, trace=self.path).play(number_of_runs=2)
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            display_replay(self.path, match=1, step=10)
+
+        self.assertIn("PARTIDA 1", output.getvalue())
+        self.assertIn("10/", output.getvalue())
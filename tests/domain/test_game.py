@@ -0,0 +1,95 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from monopoly.domain.game import IN_FLIGHT_PER_WORKER, Game, Shard
+
+
+class ShardTest(unittest.TestCase):
+    def test_split_covers_all_runs_in_order(self):
+        shards = Shard.split(number_of_runs=250, size=100, master_seed=1)
+
+        self.assertEqual([s.start for s in shards], [0, 100, 200])
+        self.assertEqual([s.size for s in shards], [100, 100, 50])
+        self.assertEqual([s.index for s in shards], [0, 1, 2])
+
+    def test_split_derives_independent_seeds_from_master_seed(self):
+        shards = Shard.split(number_of_runs=300, size=100, master_seed=1)
+        again = Shard.split(number_of_runs=300, size=100, master_seed=1)
+        other = Shard.split(number_of_runs=300, size=100, master_seed=2)
+
+        self.assertEqual(shards, again)
+        self.assertEqual(len({s.seed for s in shards}), 3)
+        self.assertNotEqual([s.seed for s in shards], [s.seed for s in other])
+
+    def test_split_does_not_depend_on_number_of_runs(self):
+        shards = Shard.split(number_of_runs=200, size=100, master_seed=1)
+        more = Shard.split(number_of_runs=400, size=100, master_seed=1)
+
+        self.assertEqual(shards, more[:2])
+
+    def test_stream_from_a_shard(self):
+        shards = Shard.split(number_of_runs=250, size=100, master_seed=1)
+
+        self.assertEqual(list(Shard.stream(250, 100, 1)), shards)
+        self.assertEqual(list(Shard.stream(250, 100, 1, first=1)), shards[1:])
+
+
+class GameTest(unittest.TestCase):
+    def test_play_number_of_runs(self):
+        game = Game(seed=1, shard_size=3)
+
+        game.play(number_of_runs=7)
+
+        self.assertEqual(game.statistic.matches, 7)
+        self.assertEqual(sum(game.statistic.wins.values()), 7)
+
+    def test_play_is_reproducible_with_same_seed(self):
+        first, second = Game(seed=10, shard_size=4), Game(seed=10, shard_size=4)
+
+        first.play(number_of_runs=8)
+        second.play(number_of_runs=8)
+
+        self.assertEqual(first.statistic, second.statistic)
+
+    def test_reused_boards_play_the_same_matches(self):
+        reused = Game(seed=10, shard_size=5, reuse_boards=True)
+        created = Game(seed=10, shard_size=5, reuse_boards=False)
+
+        reused.play(number_of_runs=15)
+        created.play(number_of_runs=15)
+
+        self.assertEqual(reused.statistic, created.statistic)
+
+    def test_play_with_workers_is_identical_to_one_worker(self):
+        single = Game(seed=10, workers=1, shard_size=4)
+        parallel = Game(seed=10, workers=2, shard_size=4)
+
+        single.play(number_of_runs=12)
+        parallel.play(number_of_runs=12)
+
+        self.assertEqual(single.statistic, parallel.statistic)
+
+    def test_workers_have_a_bounded_number_of_shards_in_flight(self):
+        """
+        Os resultados das fatias são combinados à medida que chegam: o pool
+        nunca tem mais do que IN_FLIGHT_PER_WORKER fatias por worker.
+        """
+        submitted = []
+
+        class Counting(ProcessPoolExecutor):
+            def submit(self, *args, **kwargs):
+                submitted.append(args[2])
+                return super().submit(*args, **kwargs)
+
+        game = Game(seed=10, workers=2, shard_size=1)
+        with mock.patch("monopoly.domain.game.ProcessPoolExecutor", Counting):
+            shards = game._play_shards(number_of_runs=30)
+            for merged, statistic in enumerate(shards, start=1):
+                game.statistic.merge(statistic)
+                self.assertLessEqual(len(submitted), merged + 2 * IN_FLIGHT_PER_WORKER)
+
+        expected = Game(seed=10, workers=1, shard_size=1)
+        expected.play(number_of_runs=30)
+        self.assertEqual([shard.index for shard in submitted], list(range(30)))
+        self.assertEqual(game.statistic, expected.statistic)
@@ -0,0 +1,94 @@
+import unittest
+
+from monopoly.config import QUANTITY_ESTATES
+from monopoly.domain import markov
+from monopoly.domain.player import PlayerFactory
+from monopoly.domain.random_source import RandomSource
+
+
+class MarkovTest(unittest.TestCase):
+    def test_transition_matrix_is_doubly_stochastic(self):
+        matrix = markov.transition_matrix(quantity_estates=20)
+
+        for row in matrix:
+            self.assertAlmostEqual(sum(row), 1.0)
+        for column in zip(*matrix):
+            self.assertAlmostEqual(sum(column), 1.0)
+
+    def test_transition_matrix_on_small_board(self):
+        """
+        Em um tabuleiro menor do que o dado, a mesma casa pode ser alcançada por duas faces.
+        """
+        matrix = markov.transition_matrix(quantity_estates=4)
+
+        self.assertAlmostEqual(matrix[0][1], 2 / 6)
+        self.assertAlmostEqual(matrix[0][0], 1 / 6)
+
+    def test_stationary_distribution_is_a_fixed_point(self):
+        for quantity in (3, 20, 101):
+            stationary = markov.stationary_distribution(quantity)
+
+            for p, q in zip(stationary, markov.step(stationary)):
+                self.assertAlmostEqual(p, q)
+
+    def test_landing_distribution_converges_to_stationary(self):
+        landing = markov.landing_distribution(moves=300, quantity_estates=20)
+
+        for p, q in zip(landing, markov.stationary_distribution(20)):
+            self.assertAlmostEqual(p, q, places=6)
+
+    def test_landing_distribution_after_one_move(self):
+        landing = markov.landing_distribution(moves=1, quantity_estates=20)
+
+        self.assertEqual(landing[0], 0.0)
+        for position in range(1, 7):
+            self.assertAlmostEqual(landing[position], 1 / 6)
+
+    def test_expected_landings_sum_to_moves(self):
+        landings = markov.expected_landings(moves=10, quantity_estates=20)
+
+        self.assertAlmostEqual(sum(landings), 10.0)
+
+    def test_expected_laps_per_round(self):
+        """
+        No longo prazo o jogador anda 3.5 casas por rodada.
+        """
+        self.assertAlmostEqual(markov.expected_laps_per_round(20), 3.5 / 20)
+
+    def test_expected_laps_counts_at_most_one_lap_per_move(self):
+        self.assertAlmostEqual(markov.expected_laps_per_round(1), 1.0)
+
+    def test_expected_rent_income(self):
+        income = markov.expected_rent_income(
+            rent_values=[10.0, 20.0, 30.0, 40.0],
+            owners=[None, 1, 2, 1],
+            players=[1, 2, 3],
+        )
+
+        self.assertEqual(income[0], 0.0)
+        self.assertAlmostEqual(income[1], 20.0 * 0.25 * 2)
+        self.assertAlmostEqual(income[2], 30.0 * 0.25 * 2)
+        self.assertAlmostEqual(income[3], 40.0 * 0.25 * 2)
+
+    def test_cross_check_with_simulated_player(self):
+        """
+        As frequências de parada e de voltas de PlayerAbstract.move_spaces
+        batem com o modelo analítico.
+        """
+        moves = 60_000
+        rng = RandomSource(seed=1)
+        player = PlayerFactory.create(rng=rng)
+        landings = [0] * QUANTITY_ESTATES
+
+        for _ in range(moves):
+            player.move_spaces(spaces=rng.dice())
+            landings[player.position] += 1
+
+        stationary = markov.stationary_distribution(QUANTITY_ESTATES)
+        for count, probability in zip(landings, stationary):
+            self.assertAlmostEqual(count / moves, probability, delta=0.005)
+        self.assertAlmostEqual(
+            player.turns / moves,
+            markov.expected_laps_per_round(QUANTITY_ESTATES),
+            delta=0.005,
+        )
@@ -1,9 +1,12 @@
 import unittest
 from dataclasses import is_dataclass
 from random import randint
+from unittest.mock import Mock
 
-from domain.player import BehaviorEnum, PlayerFactory
-from domain.player.__player_abstract import PlayerAbstract
+from monopoly.domain.player import STRATEGIES, PlayerFactory
+from monopoly.domain.player.__player_abstract import PlayerAbstract
+from monopoly.domain.player.strategy import PICKY, RANDOM, WARY
+from monopoly.domain.rules import Rules
 
 
 class PlayerTest(unittest.TestCase):
@@ -16,20 +19,18 @@ class PlayerTest(unittest.TestCase):
     def test_constructor_success(self):
         player = PlayerFactory.create()
         self.assertEqual(player.id, 1)
-        self.assertEqual(player.behavior, BehaviorEnum.RANDOM)
+        self.assertEqual(player.behavior, RANDOM)
         self.assertEqual(player.balance, 300.0)
         self.assertEqual(player.position, 0)
         self.assertEqual(player.turns, 0)
 
-        player = PlayerFactory.create(behavior=BehaviorEnum.WARY, _id=2)
+        player = PlayerFactory.create(behavior=WARY, _id=2)
         self.assertEqual(player.id, 2)
         self.assertEqual(player.balance, 300.0)
 
-        player = PlayerFactory.create(
-            behavior=BehaviorEnum.PICKY, balance=123.456, _id=3
-        )
+        player = PlayerFactory.create(behavior=PICKY, balance=123.456, _id=3)
         self.assertEqual(player.id, 3)
-        self.assertEqual(player.behavior, BehaviorEnum.PICKY)
+        self.assertEqual(player.behavior, PICKY)
         self.assertEqual(player.balance, 123.456)
 
     @unittest.skip
@@ -54,6 +55,11 @@ class PlayerTest(unittest.TestCase):
     def test_if_is_a_dataclass(self):
         self.assertTrue(is_dataclass(PlayerAbstract))
 
+    def test_players_have_no_instance_dict(self):
+        for behavior in STRATEGIES.values():
+            player = PlayerFactory.create(behavior=behavior)
+            self.assertFalse(hasattr(player, "__dict__"))
+
     def test_move_spaces(self):
         """
         ...que determina quantas espaços no tabuleiro o jogador vai andar.
@@ -92,6 +98,29 @@ class PlayerTest(unittest.TestCase):
         self.assertEqual(player.balance, 500)
         self.assertEqual(player.turns, 2)
 
+    def test_lap_bonus_and_board_size_come_from_rules(self):
+        player = PlayerFactory.create(
+            balance=300, rules=Rules(quantity_estates=40, lap_bonus=25.0)
+        )
+
+        player.move_spaces(spaces=30)
+        self.assertEqual(player.position, 30)
+        self.assertEqual(player.balance, 300)
+
+        player.move_spaces(spaces=15)
+        self.assertEqual(player.position, 5)
+        self.assertEqual(player.balance, 325)
+        self.assertEqual(player.turns, 1)
+
+    def test_behavior_thresholds_come_from_rules(self):
+        rules = Rules(picky_min_rent=20.0, wary_reserve=200.0)
+        picky = PlayerFactory.create(behavior=PICKY, rules=rules)
+        wary = PlayerFactory.create(behavior=WARY, rules=rules)
+        estate = Mock(sale_price=110.0, rent_value=30.0)
+
+        self.assertTrue(picky.validate_purchase_behavioral_rules(estate))
+        self.assertFalse(wary.validate_purchase_behavioral_rules(estate))
+
     @unittest.skip
     def test_if_player_loses_when_balance_is_negative(self):
         """
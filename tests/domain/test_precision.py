@@ -0,0 +1,81 @@
+import math
+import unittest
+
+from monopoly.domain.accumulator import Accumulator
+from monopoly.domain.game import Game
+from monopoly.domain.precision import Precision
+
+
+class PrecisionTest(unittest.TestCase):
+    @staticmethod
+    def statistic(matches: int) -> Accumulator:
+        statistic = Accumulator()
+        for i in range(matches):
+            statistic.add_match(
+                rounds=100 + i % 50,
+                timeout=False,
+                behavior=("Impulsive", "Wary")[i % 2],
+            )
+        return statistic
+
+    def test_intervals_shrink_with_more_matches(self):
+        precision = Precision()
+        few, many = self.statistic(100), self.statistic(10_000)
+
+        self.assertLess(precision.rounds_interval(many), precision.rounds_interval(few))
+        self.assertLess(
+            precision.win_intervals(many)["Wary"], precision.win_intervals(few)["Wary"]
+        )
+
+    def test_win_interval_is_never_zero(self):
+        """
+        Mesmo sem vitórias, o intervalo de Agresti-Coull não colapsa em zero.
+        """
+        self.assertGreater(self.statistic(100).win_interval("Picky"), 0.0)
+
+    def test_rounds_interval_is_infinite_without_matches(self):
+        self.assertEqual(Accumulator().rounds_interval(), math.inf)
+
+    def test_reached(self):
+        statistic = self.statistic(1000)
+
+        self.assertTrue(Precision(win=10.0, rounds=5.0, min_runs=10).reached(statistic))
+        self.assertFalse(Precision(win=0.1, min_runs=10).reached(statistic))
+        self.assertFalse(Precision(rounds=0.01, min_runs=10).reached(statistic))
+        self.assertFalse(Precision(win=10.0, min_runs=5000).reached(statistic))
+
+    def test_reached_marks_converged(self):
+        precision = Precision(win=10.0, min_runs=10)
+
+        precision.reached(self.statistic(1000))
+
+        self.assertTrue(precision.converged)
+
+
+class GamePlayAdaptiveTest(unittest.TestCase):
+    def test_stops_at_max_runs(self):
+        game = Game(seed=1, shard_size=5)
+        precision = Precision(win=0.01, max_runs=15, min_runs=1)
+
+        game.play_adaptive(precision)
+
+        self.assertEqual(game.statistic.matches, 15)
+        self.assertFalse(precision.converged)
+
+    def test_stops_when_converged(self):
+        game = Game(seed=1, shard_size=5)
+        precision = Precision(win=50.0, max_runs=1000, min_runs=10)
+
+        game.play_adaptive(precision)
+
+        self.assertEqual(game.statistic.matches, 10)
+        self.assertTrue(precision.converged)
+
+    def test_same_stopping_point_with_workers(self):
+        single = Game(seed=3, shard_size=4, workers=1)
+        parallel = Game(seed=3, shard_size=4, workers=2)
+
+        single.play_adaptive(Precision(win=25.0, max_runs=40, min_runs=8))
+        parallel.play_adaptive(Precision(win=25.0, max_runs=40, min_runs=8))
+
+        self.assertEqual(single.statistic, parallel.statistic)
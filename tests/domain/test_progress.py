@@ -0,0 +1,100 @@
+import io
+import math
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from monopoly.domain.accumulator import Accumulator
+from monopoly.domain.game import Game
+from monopoly.domain.progress import Progress, Snapshot, duration
+
+
+def metrics(path: str) -> dict:
+    with open(path) as file:
+        return dict(
+            line.rsplit(" ", 1) for line in file.read().splitlines() if line[0] != "#"
+        )
+
+
+class ProgressTest(unittest.TestCase):
+    def test_report_after_every_shard(self):
+        stream = io.StringIO()
+        progress = Progress(interval=0, stream=stream)
+
+        Game(seed=1, shard_size=10, progress=progress).play(number_of_runs=50)
+
+        lines = stream.getvalue().splitlines()
+        # one per shard: the final report is not repeated
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[0].startswith("10/50 partidas (20.0%)"))
+        self.assertTrue(lines[-1].startswith("50/50 partidas (100.0%)"))
+        self.assertIn("ETA 00:00", lines[-1])
+
+    def test_bounded_rate(self):
+        stream = io.StringIO()
+        progress = Progress(interval=3600, stream=stream)
+
+        Game(seed=1, shard_size=5, progress=progress).play(number_of_runs=50)
+
+        self.assertEqual(progress.reports, 1)
+        self.assertEqual(len(stream.getvalue().splitlines()), 1)
+
+    def test_workers_and_prometheus_textfile(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "monopoly.prom")
+            progress = Progress(interval=0, stream=None, textfile=path)
+            game = Game(seed=2, shard_size=10, workers=2, progress=progress)
+
+            game.play(number_of_runs=40)
+            values = metrics(path)
+
+        self.assertEqual(values["monopoly_matches_total"], "40")
+        self.assertEqual(values["monopoly_matches_planned"], "40")
+        self.assertEqual(values["monopoly_eta_seconds"], "0.0")
+        self.assertEqual(
+            values["monopoly_timeouts_total"], str(game.statistic.timeouts)
+        )
+        leader = max(game.statistic.wins, key=game.statistic.wins.get)
+        for name, wins in game.statistic.wins.items():
+            self.assertEqual(
+                values[f'monopoly_wins_total{{behavior="{name}"}}'], str(wins)
+            )
+            self.assertEqual(
+                values[f'monopoly_leader{{behavior="{name}"}}'],
+                str(int(name == leader)),
+            )
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_batch_engine(self):
+        stream = io.StringIO()
+        progress = Progress(interval=0, stream=stream)
+
+        Game(engine="batch", seed=3, shard_size=20, progress=progress).play(60)
+
+        self.assertTrue(stream.getvalue().splitlines()[-1].startswith("60/60"))
+
+    def test_snapshot(self):
+        statistic = Accumulator()
+        for behavior, timeout in (("Wary", True), ("Wary", False), ("Picky", False)):
+            statistic.add_match(rounds=10, timeout=timeout, behavior=behavior)
+
+        snapshot = Snapshot.of(statistic, total=12, elapsed=2.0, played=2)
+
+        self.assertEqual(snapshot.rate, 1.0)
+        # 9 matches left at the pace of the matches played since the start
+        self.assertEqual(snapshot.eta, 9.0)
+        self.assertAlmostEqual(snapshot.timeout_rate, 1 / 3)
+        self.assertEqual((snapshot.leader, snapshot.leader_rate), ("Wary", 2 / 3))
+
+    def test_snapshot_before_the_first_shard(self):
+        snapshot = Snapshot.of(Accumulator(), total=10, elapsed=0.0, played=0)
+
+        self.assertTrue(math.isinf(snapshot.eta))
+        self.assertIsNone(snapshot.leader)
+        self.assertEqual(duration(snapshot.eta), "--:--")
+        self.assertEqual(duration(3725), "1:02:05")
@@ -0,0 +1,77 @@
+import unittest
+from collections import Counter
+
+from monopoly.domain.board import Board
+from monopoly.domain.estate import Estate
+from monopoly.domain.random_source import RandomSource
+
+
+class RandomSourceTest(unittest.TestCase):
+    def test_dice_has_six_equiprobable_faces(self):
+        """
+        ...o jogador joga um dado equiprovável de 6 faces
+        """
+        rng = RandomSource(seed=1)
+
+        faces = Counter(rng.dice() for _ in range(60_000))
+
+        self.assertEqual(set(faces), {1, 2, 3, 4, 5, 6})
+        for count in faces.values():
+            self.assertAlmostEqual(count / 60_000, 1 / 6, delta=0.01)
+
+    def test_coin_has_probability_of_50_percent(self):
+        rng = RandomSource(seed=1)
+
+        heads = sum(rng.coin() for _ in range(20_000))
+
+        self.assertAlmostEqual(heads / 20_000, 0.5, delta=0.02)
+
+    def test_chance(self):
+        rng = RandomSource(seed=1)
+
+        hits = sum(rng.chance(0.25) for _ in range(20_000))
+
+        self.assertAlmostEqual(hits / 20_000, 0.25, delta=0.02)
+        self.assertFalse(any(rng.chance(0.0) for _ in range(1000)))
+        self.assertTrue(all(rng.chance(1.0) for _ in range(1000)))
+
+    def test_uniform_between_bounds(self):
+        rng = RandomSource(seed=1, buffer_size=16)
+
+        values = [rng.uniform(100, 150) for _ in range(100)]
+
+        self.assertTrue(all(100 <= v <= 150 for v in values))
+
+    def test_same_seed_same_sequence(self):
+        first, second = RandomSource(seed=7), RandomSource(seed=7)
+
+        self.assertEqual(
+            [first.dice() for _ in range(5000)], [second.dice() for _ in range(5000)]
+        )
+
+    def test_streams_are_independent(self):
+        """
+        Jogar a moeda não altera a sequência dos dados.
+        """
+        first, second = RandomSource(seed=7), RandomSource(seed=7)
+        [second.coin() for _ in range(100)]
+        [second.uniform(0, 1) for _ in range(100)]
+
+        self.assertEqual(
+            [first.dice() for _ in range(100)], [second.dice() for _ in range(100)]
+        )
+
+    def test_factory_estates_with_injected_source(self):
+        first = Estate.factory_estates(quantity=5, rng=RandomSource(seed=3))
+        second = Estate.factory_estates(quantity=5, rng=RandomSource(seed=3))
+
+        self.assertEqual(first, second)
+
+    def test_board_create_shares_source_with_players(self):
+        rng = RandomSource(seed=3)
+
+        board = Board.create(rng=rng)
+
+        self.assertIs(board.rng, rng)
+        for player in board.players:
+            self.assertIs(player.rng, rng)
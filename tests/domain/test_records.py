@@ -0,0 +1,212 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from monopoly.domain.board import Board
+from monopoly.domain.game import Game
+from monopoly.domain.player import STRATEGIES, Strategy, register
+from monopoly.domain.player.strategy import CODES
+from monopoly.domain.random_source import RandomSource
+from monopoly.domain.records import (
+    HEADER,
+    SMALL_SEATS,
+    RecordBuffer,
+    RecordFile,
+    RecordWriter,
+    record_struct,
+)
+from monopoly.domain.rules import Rules
+from monopoly.view import display_stdout
+from tests.domain.test_checkpoint import Interrupt, interrupted_after
+
+
+class RecordsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "records.bin")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_write_and_read_board_results(self):
+        rng = RandomSource(seed=2)
+        results = [Board.create(rng=rng).match() for _ in range(5)]
+        records = RecordBuffer(seats=4)
+        for result in results:
+            records.add(result)
+
+        with RecordWriter(self.path, seats=4) as writer:
+            writer.write(records.data)
+        file = RecordFile(self.path)
+
+        self.assertEqual(len(file), 5)
+        self.assertEqual(os.path.getsize(self.path), file.offset + 5 * file.record_size)
+        for record, result in zip(file, results):
+            self.assertEqual(record.rounds, result["rounds"])
+            self.assertEqual(record.timeout, result["timeout"])
+            self.assertEqual(record.winner, result["winner"].behavior)
+            self.assertEqual(record.winner_seat, result["winner"].id - 1)
+            self.assertEqual(record.winner_balance, result["winner"].balance)
+            self.assertEqual(list(record.balances), result["balances"])
+            self.assertEqual(record.bankruptcies, result["bankruptcies"])
+
+    def test_game_with_hundreds_of_players(self):
+        """
+        Com mais de SMALL_SEATS jogadores, os assentos ocupam dois bytes.
+        """
+        rules = Rules(quantity_players=300, quantity_estates=600, round_limit=30)
+        game = Game(seed=1, shard_size=2, rules=rules, records=self.path)
+        game.play(number_of_runs=3)
+        file = RecordFile(self.path)
+
+        self.assertGreater(file.seats, SMALL_SEATS)
+        self.assertEqual(file.record_size, record_struct(300).size)
+        self.assertEqual(file.statistic().wins, game.statistic.wins)
+        for record in file:
+            self.assertEqual(len(record.balances), 300)
+            self.assertLess(record.winner_seat, 300)
+            self.assertTrue(all(0 <= seat < 300 for seat in record.bankruptcies))
+
+    def test_seats_beyond_an_int16(self):
+        seats = 40_000
+        board = Board.create(rng=RandomSource(seed=1), rules=Rules(quantity_players=3))
+        result = board.match()
+        result["balances"] = [0.0] * seats
+        result["bankruptcies"] = [seats - 1, 32_768]
+        records = RecordBuffer(seats=seats)
+        records.add(result)
+
+        with RecordWriter(self.path, seats=seats) as writer:
+            writer.write(records.data)
+        (record,) = RecordFile(self.path)
+
+        self.assertEqual(record.bankruptcies, [seats - 1, 32_768])
+        if np is not None:
+            array = RecordFile(self.path).array()
+            self.assertEqual(
+                list(array["bankruptcies"][0][:3]), [seats - 1, 32_768, -1]
+            )
+
+    def test_iteration_stopped_early_releases_the_file(self):
+        Game(seed=4, shard_size=5, records=self.path).play(number_of_runs=10)
+        file = RecordFile(self.path)
+
+        records = iter(file)
+        first = next(records)
+        records.close()
+
+        self.assertEqual(first, next(iter(file)))
+        self.assertEqual(len(list(file)), 10)
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as file:
+            file.write(b"\0" * HEADER.size)
+
+        with self.assertRaises(ValueError):
+            RecordFile(self.path)
+
+    def test_many_strategies_with_long_names(self):
+        """
+        Os nomes das estratégias não têm mais um tamanho fixo no cabeçalho.
+        """
+        long = [
+            register(Strategy(f"Very Long Strategy Name {i}", reserve=i * 10.0))
+            for i in range(10)
+        ]
+        for strategy in long:
+            self.addCleanup(CODES.remove, strategy)
+            self.addCleanup(STRATEGIES.pop, strategy.name)
+        rng = RandomSource(seed=2)
+        results = [Board.create(rng=rng, behaviors=long[-4:]).match() for _ in range(5)]
+        records = RecordBuffer(seats=4)
+        for result in results:
+            records.add(result)
+
+        with RecordWriter(self.path, seats=4) as writer:
+            writer.write(records.data)
+        file = RecordFile(self.path)
+
+        self.assertEqual(file.behaviors, CODES)
+        self.assertEqual(
+            [record.winner for record in file],
+            [result["winner"].behavior for result in results],
+        )
+
+    def test_game_play_records_every_match_in_order(self):
+        game = Game(seed=4, shard_size=3, workers=2, records=self.path)
+        game.play(number_of_runs=10)
+        file = RecordFile(self.path)
+
+        self.assertEqual(len(file), 10)
+        statistic = file.statistic()
+        self.assertEqual(statistic.matches, game.statistic.matches)
+        self.assertEqual(statistic.timeouts, game.statistic.timeouts)
+        self.assertEqual(statistic.wins, game.statistic.wins)
+        self.assertAlmostEqual(statistic.rounds_mean, game.statistic.rounds_mean)
+        self.assertAlmostEqual(statistic.rounds_m2, game.statistic.rounds_m2)
+
+    def test_resume_truncates_records_to_the_checkpoint(self):
+        checkpoint = os.path.join(self.directory.name, "checkpoint.json")
+        uninterrupted = os.path.join(self.directory.name, "uninterrupted.bin")
+        Game(seed=6, shard_size=2, records=uninterrupted).play(number_of_runs=6)
+
+        game = Game(
+            seed=6,
+            shard_size=2,
+            records=self.path,
+            checkpoint=checkpoint,
+            checkpoint_interval=0,
+        )
+        with interrupted_after(shards=2), self.assertRaises(Interrupt):
+            game.play(number_of_runs=6)
+        # a match written after the last checkpoint is discarded on resume
+        with open(self.path, "ab") as file:
+            file.write(b"\1" * RecordFile(self.path).record_size)
+        Game.resume(checkpoint)
+
+        with open(self.path, "rb") as resumed, open(uninterrupted, "rb") as expected:
+            self.assertEqual(resumed.read(), expected.read())
+
+    def test_display_stdout_from_records_file(self):
+        game = Game(seed=4, shard_size=5, records=self.path)
+        game.play(number_of_runs=10)
+
+        output, expected = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(output):
+            display_stdout(self.path)
+        with contextlib.redirect_stdout(expected):
+            display_stdout(game.statistic)
+
+        self.assertEqual(output.getvalue(), expected.getvalue())
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_array_is_memory_mapped(self):
+        Game(seed=4, shard_size=5, records=self.path).play(number_of_runs=10)
+        file = RecordFile(self.path)
+
+        records = file.array()
+
+        self.assertIsInstance(records, np.memmap)
+        self.assertEqual(records.shape, (10,))
+        self.assertEqual(records["balances"].shape, (10, 4))
+        self.assertEqual(
+            [file.behaviors[code] for code in records["winner"]],
+            [record.winner for record in file],
+        )
+        self.assertTrue(set(records["winner"]) <= set(range(len(STRATEGIES))))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_batch_engine_records(self):
+        game = Game(engine="batch", seed=4, shard_size=20, records=self.path)
+        game.play(number_of_runs=40)
+        file = RecordFile(self.path)
+
+        self.assertEqual(len(file), 40)
+        self.assertEqual(file.statistic().wins, game.statistic.wins)
@@ -0,0 +1,27 @@
+import os
+import unittest
+from unittest import mock
+
+from monopoly import config
+from monopoly.domain.rules import MAX_PLAYERS, Rules
+
+
+class RulesTest(unittest.TestCase):
+    def test_invalid_rules(self):
+        for fields in (
+            {"quantity_players": 0},
+            {"quantity_estates": 0},
+            {"round_limit": 0},
+            {"quantity_players": MAX_PLAYERS + 1},
+        ):
+            with self.subTest(**fields), self.assertRaises(ValueError):
+                Rules(**fields)
+
+    def test_from_config_without_players(self):
+        with mock.patch.dict(os.environ, {"QUANTITY_PLAYERS": "0"}):
+            config.reload()
+            try:
+                with self.assertRaisesRegex(ValueError, "quantity_players"):
+                    Rules.from_config()
+            finally:
+                config.reload()
@@ -0,0 +1,135 @@
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from monopoly.domain.accumulator import Accumulator
+from monopoly.domain.board import Board
+from monopoly.domain.estate import Estate
+from monopoly.domain.player import STRATEGIES, PlayerFactory, Strategy, register
+from monopoly.domain.player.strategy import CODES, IMPULSIVE, NEVER, PICKY, RANDOM, WARY
+from monopoly.domain.random_source import RandomSource
+from monopoly.domain.rules import Rules
+
+
+class StrategyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.estates = [
+            Estate(sale_price=120.0, rent_value=50.0),
+            Estate(sale_price=100.0, rent_value=50.01),
+        ]
+
+    def register(self, strategy: Strategy) -> Strategy:
+        register(strategy)
+        self.addCleanup(CODES.remove, strategy)
+        self.addCleanup(STRATEGIES.pop, strategy.name)
+        return strategy
+
+    def test_limits(self):
+        rules = Rules()
+
+        self.assertEqual(IMPULSIVE.limits(self.estates, rules), [120.0, 100.0])
+        self.assertEqual(PICKY.limits(self.estates, rules), [NEVER, 100.0])
+        self.assertEqual(WARY.limits(self.estates, rules), [200.0, 180.0])
+        self.assertEqual(RANDOM.limits(self.estates, rules), [120.0, 100.0])
+        self.assertEqual(
+            WARY.limits(self.estates, Rules(wary_reserve=10.0)), [130.0, 110.0]
+        )
+
+    def test_limits_are_the_same_decision_of_the_rules(self):
+        board = Board.create(rng=RandomSource(seed=2))
+
+        for player in board.players:
+            if not player.behavior.deterministic:
+                continue
+            for balance in (50.0, 110.0, 190.0, 230.0, 300.0):
+                player.balance = balance
+                for estate, limit in zip(board.estates, board.limits[player.id]):
+                    self.assertEqual(
+                        balance >= limit,
+                        board._is_valid_purchase(player=player, estate=estate),
+                    )
+
+    def test_duplicated_name(self):
+        with self.assertRaises(ValueError):
+            register(Strategy("Wary"))
+
+    def test_new_strategy_by_name(self):
+        """
+        Um comportamento registrado joga e aparece nos resultados sem outras alterações.
+        """
+        thrifty = self.register(
+            Strategy("Thrifty", decide=lambda balance, price, rent: rent * 3 > price)
+        )
+        board = Board.create(
+            rng=RandomSource(seed=3), behaviors=(thrifty, "Impulsive", "Wary")
+        )
+
+        result = board.match()
+        statistic = Accumulator()
+        statistic.add(result)
+
+        self.assertIs(board.players[0].behavior, thrifty)
+        self.assertEqual(sum(result["behavior"].values()), 1)
+        self.assertIn("Thrifty", statistic.wins)
+        self.assertEqual(sum(statistic.wins.values()), 1)
+
+    def test_decide(self):
+        never = self.register(
+            Strategy("Never", decide=lambda balance, price, rent: balance < 0)
+        )
+        player = PlayerFactory.create(behavior="Never", balance=1000.0)
+        board = Board(players=[player, PlayerFactory.create(_id=2, behavior=never)])
+
+        self.assertFalse(board.purchase(player=player, estate=self.estates[0]))
+
+        board.match()
+
+        self.assertEqual(board.qtd_owned, 0)
+        self.assertTrue(board.having_more_than_one_player())
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_batch_uses_the_same_declarations(self):
+        from monopoly.domain.batch import BatchBoard
+
+        never = self.register(
+            Strategy("Never", decide=lambda balance, price, rent: balance < 0)
+        )
+        rules = Rules(round_limit=50)
+        board = BatchBoard(
+            size=10, behaviors=[never, never], rules=rules, rng=np.random.default_rng(1)
+        )
+
+        for result in board.match():
+            self.assertEqual(result["timeout"], 1)
+            self.assertEqual(result["winner"].behavior, never)
+            self.assertTrue(all(b >= rules.balance for b in result["balances"]))
+
+    def test_engines_accept_names(self):
+        cautious = self.register(Strategy("Cautious", min_rent=30.0, reserve=150.0))
+        names = ["Cautious", "Wary"]
+
+        board = Board.create(rng=RandomSource(seed=3), behaviors=names)
+
+        self.assertEqual([p.behavior for p in board.players], [cautious, WARY])
+        if np is not None:
+            from monopoly.domain.batch import BatchBoard
+
+            batch = BatchBoard(size=5, behaviors=names, rng=np.random.default_rng(1))
+            self.assertEqual(batch.behaviors, (cautious, WARY))
+            self.assertEqual(len(batch.match()), 5)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_batch_limits(self):
+        from monopoly.domain.batch import purchase_limits
+
+        sale_price = np.array([[120.0, 100.0]])
+        rent_value = np.array([[50.0, 50.01]])
+
+        for strategy in (IMPULSIVE, PICKY, WARY):
+            self.assertEqual(
+                purchase_limits(strategy, sale_price, rent_value, Rules()).tolist(),
+                [strategy.limits(self.estates, Rules())],
+            )
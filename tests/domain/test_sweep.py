@@ -0,0 +1,107 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from monopoly import config
+from monopoly.domain.game import Game
+from monopoly.domain.rules import Rules
+from monopoly.domain.sweep import Sweep, grid
+
+
+class GridTest(unittest.TestCase):
+    def test_grid_is_the_product_of_the_values(self):
+        points = grid(Rules(), balance=[200.0, 300.0], wary_reserve=[60.0, 80.0, 100.0])
+
+        self.assertEqual(len(points), 6)
+        self.assertEqual(points[0], Rules(balance=200.0, wary_reserve=60.0))
+        self.assertEqual(points[-1], Rules(balance=300.0, wary_reserve=100.0))
+
+    def test_grid_keeps_the_other_parameters_of_base(self):
+        points = grid(Rules(lap_bonus=50.0), quantity_estates=[10, 40])
+
+        self.assertEqual({p.lap_bonus for p in points}, {50.0})
+        self.assertEqual([p.quantity_estates for p in points], [10, 40])
+
+    def test_grid_rejects_unknown_parameters(self):
+        with self.assertRaises(ValueError):
+            grid(Rules(), players=[4, 8])
+
+
+class SweepTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rules = grid(Rules(), balance=[100.0, 500.0], quantity_estates=[10, 30])
+
+    def test_run_one_row_per_point(self):
+        rows = Sweep(rules=self.rules, seed=1).run(number_of_runs=5)
+
+        self.assertEqual([row["point"] for row in rows], [0, 1, 2, 3])
+        self.assertEqual([row["balance"] for row in rows], [100.0] * 2 + [500.0] * 2)
+        self.assertEqual([row["quantity_estates"] for row in rows], [10, 30] * 2)
+        for row in rows:
+            self.assertEqual(row["matches"], 5)
+            self.assertAlmostEqual(
+                sum(value for name, value in row.items() if name.startswith("win_")),
+                100.0,
+            )
+
+    def test_point_is_a_game_with_its_rules_and_seed(self):
+        sweep = Sweep(rules=self.rules, seed=1)
+        rows = sweep.run(number_of_runs=5)
+        point = sweep.points[3]
+
+        game = Game(seed=point.seed, workers=1, rules=point.rules)
+        game.play(number_of_runs=5)
+
+        self.assertEqual(rows[3]["rounds_mean"], game.statistic.rounds_mean)
+        self.assertEqual(rows[3]["win_wary"], game.statistic.win_percentages["Wary"])
+
+    def test_run_with_workers_is_identical_to_one_worker(self):
+        single = Sweep(rules=self.rules, seed=7, workers=1).run(number_of_runs=4)
+        parallel = Sweep(rules=self.rules, seed=7, workers=2).run(number_of_runs=4)
+
+        ignore = {"seconds"}
+        self.assertEqual(
+            [{k: v for k, v in row.items() if k not in ignore} for row in single],
+            [{k: v for k, v in row.items() if k not in ignore} for row in parallel],
+        )
+
+    def test_write_columns(self):
+        sweep = Sweep(rules=self.rules, seed=1)
+        sweep.run(number_of_runs=3)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sweep.json")
+            sweep.write(path)
+            with open(path) as file:
+                columns = json.load(file)
+
+        self.assertEqual(columns["point"], [0, 1, 2, 3])
+        self.assertEqual(columns["balance"], [100.0, 100.0, 500.0, 500.0])
+        self.assertEqual(columns["matches"], [3] * 4)
+
+    def test_points_ignore_the_files_of_the_environment(self):
+        """
+        CHECKPOINT, RECORDS, TRACE e PROGRESS_TEXTFILE são de um Game só: cada
+        ponto gravaria (e retomaria) o estado dos outros pontos no mesmo arquivo.
+        """
+        expected = Sweep(rules=self.rules, seed=3).run(number_of_runs=4)
+        with tempfile.TemporaryDirectory() as directory:
+            files = {
+                name: os.path.join(directory, name.lower())
+                for name in ("CHECKPOINT", "RECORDS", "TRACE", "PROGRESS_TEXTFILE")
+            }
+            with mock.patch.dict(os.environ, files):
+                config.reload()
+                try:
+                    rows = Sweep(rules=self.rules, seed=3).run(number_of_runs=4)
+                finally:
+                    config.reload()
+
+            self.assertEqual(os.listdir(directory), [])
+        ignore = {"seconds"}
+        self.assertEqual(
+            [{k: v for k, v in row.items() if k not in ignore} for row in rows],
+            [{k: v for k, v in row.items() if k not in ignore} for row in expected],
+        )
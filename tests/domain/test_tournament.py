@@ -0,0 +1,85 @@
+import unittest
+
+from monopoly.domain.board import Board
+from monopoly.domain.game import Shard
+from monopoly.domain.player.strategy import get
+from monopoly.domain.tournament import Standings, Tournament, lineups_of, play_lineup
+from monopoly.domain.variates import Variates
+
+
+class LineupsTest(unittest.TestCase):
+    def test_every_seat_permutation(self):
+        lineups = lineups_of()
+
+        self.assertEqual(len(lineups), 24)
+        self.assertEqual(len(set(lineups)), 24)
+        self.assertIn(("Impulsive", "Picky", "Wary", "Random"), lineups)
+
+    def test_repeated_behaviors(self):
+        self.assertEqual(
+            sorted(lineups_of(["Wary", "Wary", "Picky"])),
+            [
+                ("Picky", "Wary", "Wary"),
+                ("Wary", "Picky", "Wary"),
+                ("Wary", "Wary", "Picky"),
+            ],
+        )
+        self.assertEqual(
+            lineups_of(["Wary", "Wary", "Picky"], permute=False),
+            [("Wary", "Wary", "Picky")],
+        )
+
+    def test_unknown_behavior(self):
+        with self.assertRaises(ValueError):
+            lineups_of(["Wary", "Greedy"])
+
+
+class TournamentTest(unittest.TestCase):
+    def test_same_draws_in_every_lineup(self):
+        """
+        A partida i usa a mesma fonte em qualquer formação e fatia.
+        """
+        lineup = ("Random", "Wary", "Impulsive", "Picky")
+        shard = Shard.split(6, 6, 11)[0]
+
+        standings = play_lineup(lineup, shard)
+
+        expected = Standings(seats=4)
+        for i in range(6):
+            board = Board.create(
+                rng=Variates().source(11, i), behaviors=[get(n) for n in lineup]
+            )
+            expected.add(lineup, board.match())
+        self.assertEqual(standings, expected)
+
+    def test_wins_per_behavior_and_seat(self):
+        standings = Tournament(seed=3, shard_size=4).play(number_of_runs=5)
+
+        self.assertEqual(standings.matches, 24 * 5)
+        for row in standings.appearances.values():
+            self.assertEqual(row, [30, 30, 30, 30])
+        self.assertAlmostEqual(sum(standings.seat_win_rates), 100.0)
+        self.assertAlmostEqual(sum(standings.win_rates.values()), 100.0)
+        for behavior, row in standings.table.items():
+            self.assertAlmostEqual(sum(row) / 4, standings.win_rates[behavior])
+
+    def test_repeated_behavior_appears_once_per_seat(self):
+        lineups = lineups_of(["Wary", "Wary", "Impulsive", "Random"])
+
+        standings = Tournament(lineups=lineups, seed=1).play(number_of_runs=2)
+
+        self.assertEqual(standings.matches, 12 * 2)
+        self.assertEqual(sum(standings.appearances["Wary"]), 2 * 24)
+        self.assertEqual(standings.appearances["Impulsive"], [6, 6, 6, 6])
+        self.assertNotIn("Picky", standings.appearances)
+
+    def test_workers_have_the_same_standings(self):
+        lineups = lineups_of(["Picky", "Random", "Wary"])
+        single = Tournament(lineups=lineups, seed=5, shard_size=3)
+        parallel = Tournament(lineups=lineups, seed=5, shard_size=3, workers=2)
+
+        self.assertEqual(single.play(7), parallel.play(7))
+
+    def test_lineups_must_have_the_same_seats(self):
+        with self.assertRaises(ValueError):
+            Tournament(lineups=[("Wary", "Picky"), ("Wary", "Picky", "Random")])
@@ -0,0 +1,180 @@
+import os
+import unittest
+from unittest import mock
+
+from monopoly import config
+from monopoly.domain.accumulator import Accumulator, Moments
+from monopoly.domain.board import Board
+from monopoly.domain.game import Game
+from monopoly.domain.random_source import RandomSource
+from monopoly.domain.rules import Rules
+from monopoly.domain.sweep import Sweep
+from monopoly.domain.variates import Variates
+
+
+class RandomSourceTest(unittest.TestCase):
+    def test_antithetic_dice(self):
+        source = RandomSource(seed=4)
+        antithetic = RandomSource(seed=4, antithetic=True)
+
+        for _ in range(1000):
+            self.assertEqual(source.dice() + antithetic.dice(), 7)
+        self.assertEqual(source.uniform(0, 1), antithetic.uniform(0, 1))
+
+
+class VariatesTest(unittest.TestCase):
+    def test_same_match_has_same_estates_with_other_rules(self):
+        variates = Variates()
+        first = Board.create(rng=variates.source(9, 3))
+        second = Board.create(rng=variates.source(9, 3), rules=Rules(balance=500.0))
+        other = Board.create(rng=variates.source(9, 4))
+
+        self.assertEqual(first.estates, second.estates)
+        self.assertNotEqual(first.estates, other.estates)
+
+    def test_result_does_not_depend_on_shard_size(self):
+        games = [
+            Game(seed=2, shard_size=size, variates=Variates()) for size in (3, 5, 12)
+        ]
+        for game in games:
+            game.play(number_of_runs=12)
+
+        self.assertEqual(games[0].statistic, games[1].statistic)
+        self.assertEqual(games[0].statistic, games[2].statistic)
+
+    def test_antithetic_pairs(self):
+        game = Game(seed=3, shard_size=5, variates=Variates(antithetic=True))
+
+        game.play(number_of_runs=20)
+
+        statistic = game.statistic
+        self.assertEqual(game.shard_size, 6)
+        self.assertEqual(statistic.pairs.count, 10)
+        self.assertAlmostEqual(statistic.pairs.mean, statistic.rounds_mean)
+        self.assertEqual(statistic.rounds_interval(), statistic.pairs.interval())
+        self.assertEqual(
+            statistic.antithetic_efficiency,
+            statistic.rounds_variance / (2 * statistic.pairs.variance),
+        )
+
+    def test_baseline_with_same_rules_has_no_difference(self):
+        """
+        Com os mesmos números aleatórios, as mesmas regras jogam as mesmas partidas.
+        """
+        game = Game(seed=5, rules=Rules(), variates=Variates(baseline=Rules()))
+
+        game.play(number_of_runs=10)
+
+        statistic = game.statistic
+        self.assertEqual(statistic.differences.count, 10)
+        self.assertEqual(statistic.differences.mean, 0.0)
+        self.assertEqual(statistic.differences.m2, 0.0)
+        self.assertEqual(statistic.baseline.mean, statistic.rounds_mean)
+        self.assertIsNone(statistic.crn_efficiency)
+
+    def test_baseline_differences(self):
+        rules = Rules(balance=600.0)
+        game = Game(seed=5, rules=rules, variates=Variates(baseline=Rules()))
+        baseline = Game(seed=5, rules=Rules(), variates=Variates())
+
+        game.play(number_of_runs=30)
+        baseline.play(number_of_runs=30)
+
+        statistic = game.statistic
+        self.assertAlmostEqual(statistic.baseline.mean, baseline.statistic.rounds_mean)
+        self.assertAlmostEqual(
+            statistic.differences.mean,
+            statistic.rounds_mean - baseline.statistic.rounds_mean,
+        )
+        self.assertIsNotNone(statistic.crn_efficiency)
+
+    def test_variance_reduction_requires_object_engine(self):
+        with self.assertRaises(ValueError):
+            Game(engine="batch", variates=Variates())
+
+    def test_sweep_compares_points_with_the_first(self):
+        sweep = Sweep(
+            rules=[Rules(), Rules(balance=400.0)], seed=1, variates=Variates()
+        )
+
+        first, second = sweep.run(number_of_runs=10)
+
+        self.assertEqual(first["rounds_diff_mean"], 0.0)
+        self.assertIsNone(first["crn_efficiency"])
+        self.assertAlmostEqual(
+            second["rounds_diff_mean"], second["rounds_mean"] - first["rounds_mean"]
+        )
+
+    def test_sweep_plays_the_baseline_once(self):
+        rules = [Rules(), Rules(balance=400.0), Rules(round_limit=50)]
+        sweep = Sweep(rules=rules, seed=1, variates=Variates(), shard_size=4)
+
+        with mock.patch.object(
+            Board, "match", autospec=True, side_effect=Board.match
+        ) as match:
+            rows = sweep.run(number_of_runs=10)
+
+        self.assertEqual(match.call_count, 30)
+        for point, row in zip(sweep.points, rows):
+            game = Game(seed=1, rules=point.rules, variates=point.variates)
+            game.play(number_of_runs=10)
+            self.assertAlmostEqual(row["rounds_mean"], game.statistic.rounds_mean)
+            self.assertEqual(row["timeouts"], game.statistic.timeouts)
+            if point.index:
+                self.assertAlmostEqual(
+                    row["rounds_diff_mean"], game.statistic.differences.mean
+                )
+
+    def test_antithetic_sweep_with_workers(self):
+        rules = [Rules(), Rules(balance=400.0)]
+        variates = Variates(antithetic=True)
+        single = Sweep(rules=rules, seed=2, variates=variates, shard_size=3)
+        parallel = Sweep(
+            rules=rules, seed=2, variates=variates, shard_size=3, workers=2
+        )
+
+        ignore = {"seconds"}
+        self.assertEqual(single.shard_size, 4)
+        self.assertEqual(
+            [
+                {k: v for k, v in row.items() if k not in ignore}
+                for row in single.run(8)
+            ],
+            [
+                {k: v for k, v in row.items() if k not in ignore}
+                for row in parallel.run(8)
+            ],
+        )
+
+    def test_crn_from_the_environment_needs_a_baseline(self):
+        with mock.patch.dict(os.environ, {"VARIANCE_REDUCTION": "crn"}):
+            config.reload()
+            try:
+                with self.assertRaises(ValueError):
+                    Variates.from_config()
+            finally:
+                config.reload()
+
+
+class MomentsTest(unittest.TestCase):
+    def test_merge_is_the_same_as_adding(self):
+        values = [3.0, 8.0, 1.0, 9.5, 4.0, 7.0]
+        whole, first, second = Moments(), Moments(), Moments()
+        for value in values:
+            whole.add(value)
+        for value in values[:2]:
+            first.add(value)
+        for value in values[2:]:
+            second.add(value)
+
+        first.merge(second)
+
+        self.assertEqual(first.count, whole.count)
+        self.assertAlmostEqual(first.mean, whole.mean)
+        self.assertAlmostEqual(first.variance, whole.variance)
+
+    def test_accumulator_dict_keeps_moments(self):
+        statistic = Accumulator(pairs=Moments(count=2, mean=10.0, m2=8.0))
+
+        self.assertEqual(Accumulator.from_dict(statistic.to_dict()), statistic)
+        self.assertNotIn("pairs", Accumulator().to_dict())
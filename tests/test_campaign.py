@@ -0,0 +1,114 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from monopoly.campaign import CLAIMED, PENDING, Campaign
+from monopoly.domain.game import Game
+from monopoly.domain.records import RecordFile
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def monopoly(*args: str) -> subprocess.Popen:
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    return subprocess.Popen(
+        [sys.executable, "-m", "monopoly.cli", *args],
+        cwd=SRC,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+
+
+class CampaignTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temporary = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.temporary.name, "campaign")
+
+    def tearDown(self) -> None:
+        self.temporary.cleanup()
+
+    def test_workers_processes_and_coordinator(self):
+        """
+        Com a mesma semente e fatias, o resultado é o mesmo de Game.play.
+        """
+        records = os.path.join(self.temporary.name, "matches.bin")
+        workers = [
+            monopoly("worker", self.directory, "--poll", "0.05") for _ in range(3)
+        ]
+        coordinator = monopoly(
+            "coordinator",
+            self.directory,
+            "--runs",
+            "60",
+            "--seed",
+            "7",
+            "--shard-size",
+            "5",
+            "--records",
+            records,
+            "--poll",
+            "0.05",
+        )
+
+        stdout, _ = coordinator.communicate(timeout=120)
+        for worker in workers:
+            self.assertEqual(worker.wait(timeout=60), 0)
+
+        game = Game(seed=7, shard_size=5)
+        game.play(number_of_runs=60)
+        self.assertEqual(coordinator.returncode, 0)
+        self.assertIn("RESULTADO APÓS EXECUTAR 60 SIMULAÇÕES", stdout)
+        self.assertEqual(Campaign.load(self.directory).merge(), game.statistic)
+        self.assertEqual(len(RecordFile(records)), 60)
+
+    def test_claim_is_exclusive(self):
+        Campaign.create(self.directory, number_of_runs=10, seed=1, shard_size=3)
+        first, second = Campaign.load(self.directory), Campaign.load(self.directory)
+
+        claimed = [first.claim(), second.claim(), first.claim(), second.claim()]
+
+        self.assertEqual([shard.index for shard in claimed], [0, 1, 2, 3])
+        self.assertIsNone(first.claim())
+        self.assertEqual(len(os.listdir(os.path.join(self.directory, CLAIMED))), 4)
+
+    def test_stale_claims_are_reclaimed(self):
+        campaign = Campaign.create(
+            self.directory, number_of_runs=10, seed=1, shard_size=5
+        )
+        stale, alive = campaign.claim(), campaign.claim()
+        path = os.path.join(self.directory, CLAIMED, f"{stale.index:06d}.json")
+        long_ago = time.time() - 1000
+        os.utime(path, (long_ago, long_ago))
+
+        self.assertEqual(campaign.reclaim(lease=60), 1)
+
+        self.assertEqual(
+            os.listdir(os.path.join(self.directory, PENDING)), [os.path.basename(path)]
+        )
+        self.assertEqual(campaign.claim(), stale)
+        self.assertNotEqual(alive, stale)
+
+    def test_shard_played_twice_has_the_same_partial(self):
+        """
+        Um worker lento que termina depois de a fatia ter sido devolvida.
+        """
+        campaign = Campaign.create(
+            self.directory, number_of_runs=10, seed=3, shard_size=5
+        )
+        slow = campaign.claim()
+        os.utime(campaign._path(CLAIMED, slow.index), (0, 0))
+        campaign.reclaim(lease=60)
+
+        self.assertEqual(campaign.work(lease=60, poll=0.01), 2)
+        campaign.complete(slow, campaign.play(slow))
+
+        game = Game(seed=3, shard_size=5)
+        game.play(number_of_runs=10)
+        self.assertTrue(campaign.finished)
+        self.assertEqual(campaign.merge(), game.statistic)
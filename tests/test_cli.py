@@ -0,0 +1,106 @@
+import contextlib
+import io
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from monopoly import cli
+from monopoly.__main__ import arguments
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+IMPORT_BUDGET_US = 150_000
+
+
+def python(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    return subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=True
+    )
+
+
+class ImportTest(unittest.TestCase):
+    def test_import_time_budget(self):
+        """
+        Tempo acumulado do import de cli (python -X importtime), sem os comandos.
+        """
+        stderr = python("-X", "importtime", "-c", "import monopoly.cli").stderr
+        times = {
+            match[2].strip(): int(match[1])
+            for match in re.finditer(r"import time:\s+\d+ \|\s+(\d+) \|( *\S+)", stderr)
+        }
+
+        self.assertLess(times["monopoly.cli"], IMPORT_BUDGET_US)
+        for heavy in ("monopoly.domain.game", "concurrent.futures", "numpy", "asyncio"):
+            self.assertNotIn(heavy, times)
+
+    def test_no_side_effects_on_import(self):
+        stdout = python(
+            "-c",
+            "import logging, sys\n"
+            "import monopoly.domain.game\n"
+            "from monopoly import cli, config, daemon\n"
+            "print(len(logging.getLogger().handlers))\n"
+            "print(sorted(set(config.SETTINGS) & set(vars(config))))\n"
+            "print('numpy' in sys.modules)",
+        ).stdout
+
+        self.assertEqual(stdout.split("\n")[:3], ["0", "[]", "False"])
+
+
+class CommandTest(unittest.TestCase):
+    def test_run_and_report(self):
+        with tempfile.TemporaryDirectory() as directory:
+            records = os.path.join(directory, "matches.bin")
+            env = dict(os.environ, PYTHONPATH=str(SRC), RECORDS=records, SEED="1")
+            subprocess.run(
+                [sys.executable, "-m", "monopoly.cli", "run", "--runs", "20"],
+                cwd=SRC,
+                env=env,
+                capture_output=True,
+                check=True,
+            )
+
+            with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                self.assertEqual(cli.main(["report", records]), 0)
+
+        self.assertIn("RESULTADO APÓS EXECUTAR 20 SIMULAÇÕES", stdout.getvalue())
+
+    def test_python_m_monopoly(self):
+        self.assertEqual(arguments(["--runs", "10"]), ["run", "--runs", "10"])
+        self.assertEqual(arguments([]), ["run"])
+        self.assertEqual(arguments(["--help"]), ["--help"])
+        for command in cli.commands():
+            self.assertEqual(arguments([command, "x"]), [command, "x"])
+        self.assertIn("sweep", cli.commands())
+
+        output = python("-m", "monopoly", "run", "--help").stdout
+        self.assertIn("--resume", output)
+
+    def test_replay_without_the_match(self):
+        from monopoly.domain.event_trace import TraceWriter
+        from monopoly.domain.game import Game
+
+        with tempfile.TemporaryDirectory() as directory:
+            empty = os.path.join(directory, "empty.bin")
+            TraceWriter(empty).close()
+            trace = os.path.join(directory, "trace.bin")
+            Game(seed=1, shard_size=2, trace=trace).play(number_of_runs=2)
+
+            with self.assertRaises(SystemExit) as raised:
+                cli.main(["replay", empty])
+            self.assertEqual(raised.exception.code, f"{empty}: trace has no matches")
+            with self.assertRaises(SystemExit) as raised:
+                cli.main(["replay", trace, "--match", "7"])
+            self.assertEqual(raised.exception.code, f"{trace}: match 7 not in trace")
+
+    def test_run_has_no_crn_without_a_baseline(self):
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            cli.main(["run", "--variance-reduction", "crn"])
+
+    def test_unknown_command(self):
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            cli.main(["play"])
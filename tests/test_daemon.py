@@ -0,0 +1,133 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from monopoly.daemon import Daemon
+from monopoly.domain.game import Game
+from monopoly.domain.rules import Rules
+
+
+class DaemonTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.socket = os.path.join(self.directory.name, "daemon.sock")
+        self.daemon = Daemon(workers=2, shard_size=5, engine="object")
+        self.server = await self.daemon.serve(socket=self.socket)
+        self.reader, self.writer = await asyncio.open_unix_connection(self.socket)
+
+    async def asyncTearDown(self) -> None:
+        self.writer.close()
+        self.server.close()
+        await self.server.wait_closed()
+        self.daemon.close()
+        self.directory.cleanup()
+
+    async def send(self, message: dict) -> None:
+        self.writer.write(json.dumps(message).encode() + b"\n")
+        await self.writer.drain()
+
+    async def receive(self) -> dict:
+        line = await asyncio.wait_for(self.reader.readline(), timeout=30)
+        return json.loads(line)
+
+    async def test_ping(self):
+        await self.send({"type": "ping"})
+
+        self.assertEqual(await self.receive(), {"type": "pong"})
+
+    async def test_run_streams_progress_and_result(self):
+        await self.send(
+            {"type": "run", "id": "a", "runs": 12, "seed": 7, "balance": 250.0}
+        )
+
+        progress = [await self.receive() for _ in range(3)]
+        result = await self.receive()
+
+        self.assertEqual([p["type"] for p in progress], ["progress"] * 3)
+        self.assertEqual([p["matches"] for p in progress], [5, 10, 12])
+        self.assertEqual(result["type"], "result")
+        game = Game(seed=7, shard_size=5, workers=1, rules=Rules(balance=250.0))
+        game.play(number_of_runs=12)
+        self.assertEqual(result["statistic"]["wins"], game.statistic.wins)
+        self.assertEqual(result["statistic"]["rounds_mean"], game.statistic.rounds_mean)
+        self.assertNotIn("a", self.daemon.jobs)
+
+    async def test_cancel(self):
+        await self.send({"type": "run", "id": "long", "runs": 100_000, "seed": 1})
+        await self.receive()
+        await self.send({"type": "cancel", "id": "long"})
+
+        message = await self.receive()
+        while message["type"] == "progress":
+            message = await self.receive()
+
+        self.assertEqual(message, {"type": "cancelled", "id": "long"})
+        self.assertEqual(self.daemon.jobs, {})
+
+    async def test_huge_job_starts_right_away(self):
+        """
+        As fatias são criadas sob demanda: nenhum pedido cria todas de uma vez.
+        """
+        await self.send({"type": "run", "id": "huge", "runs": 10**12, "seed": 1})
+
+        message = await self.receive()
+        await self.send({"type": "cancel", "id": "huge"})
+        while message["type"] == "progress":
+            message = await self.receive()
+
+        self.assertEqual(message, {"type": "cancelled", "id": "huge"})
+
+    async def test_invalid_requests(self):
+        await self.send({"type": "run", "seed": 1})
+        self.assertEqual((await self.receive())["type"], "error")
+
+        await self.send({"type": "cancel", "id": "nothing"})
+        self.assertEqual((await self.receive())["type"], "error")
+
+        self.writer.write(b"not json\n")
+        self.assertEqual((await self.receive())["type"], "error")
+
+    async def test_invalid_rules(self):
+        requests = [
+            {"quantity_estates": 0},
+            {"balance": "abc"},
+            {"round_limit": 2.5},
+            {"lap_bonus": True},
+            {"runs": -1},
+            {"seed": "7"},
+        ]
+        for fields in requests:
+            with self.subTest(**fields):
+                await self.send({"type": "run", "id": "x", "runs": 5, **fields})
+
+                message = await self.receive()
+
+                self.assertEqual(message["type"], "error")
+                self.assertEqual(message["id"], "x")
+        self.assertEqual(self.daemon.jobs, {})
+
+    async def test_job_that_fails_in_the_worker_gets_an_error(self):
+        messages = []
+
+        async def send(message: dict) -> None:
+            messages.append(message)
+
+        # no rules at all bypasses the validation of the request: the worker raises
+        await self.daemon.run("broken", 10, 1, None, send)
+
+        self.assertEqual(messages[-1]["type"], "error")
+        self.assertEqual(messages[-1]["id"], "broken")
+
+    async def test_closing_the_connection_cancels_its_jobs(self):
+        await self.send({"type": "run", "id": "orphan", "runs": 100_000, "seed": 1})
+        await self.receive()
+
+        self.writer.close()
+        for _ in range(100):
+            if not self.daemon.jobs:
+                break
+            await asyncio.sleep(0.05)
+
+        self.assertEqual(self.daemon.jobs, {})
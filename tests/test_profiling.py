@@ -0,0 +1,67 @@
+import unittest
+
+from monopoly import profiling
+from monopoly.domain.board import Board
+from monopoly.domain.game import Game
+from monopoly.domain.player import PlayerAbstract
+from monopoly.domain.random_source import RandomSource
+
+
+class ProfilingTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        profiling.stop()
+
+    def test_start_and_stop_restore_original_functions(self):
+        originals = (
+            Board.__dict__["roll_dice"],
+            Board.match,
+            PlayerAbstract.move_spaces,
+        )
+
+        profiling.start()
+        self.assertIsNot(Board.match, originals[1])
+        profiling.stop()
+
+        self.assertIs(Board.__dict__["roll_dice"], originals[0])
+        self.assertIs(Board.match, originals[1])
+        self.assertIs(PlayerAbstract.move_spaces, originals[2])
+
+    def test_profile_counts_phases_and_matches(self):
+        profiling.start()
+        board = Board.create(rng=RandomSource(seed=1))
+        result = board.match()
+        profile = profiling.stop()
+
+        self.assertEqual(profile.matches, 1)
+        self.assertEqual(profile.phases["dice"][0], profile.phases["movement"][0])
+        self.assertEqual(
+            profile.phases["dice"][0],
+            profile.phases["purchase"][0] + profile.phases["rent"][0],
+        )
+        finish = "timeout" if result["timeout"] else "normal"
+        self.assertEqual(profile.finishes[finish][2], result["rounds"])
+
+    def test_rounds_time_relationship(self):
+        profile = profiling.Profile()
+        for rounds in (10, 20, 30):
+            profile.add_match(rounds=rounds, timeout=False, ns=1000 + 50 * rounds)
+
+        self.assertAlmostEqual(profile.ns_per_round, 50.0)
+        self.assertAlmostEqual(profile.ns_per_match_fixed, 1000.0)
+
+    def test_game_play_with_profile(self):
+        match = Board.match
+        game = Game(seed=1, shard_size=3, profile=True)
+
+        game.play(number_of_runs=7)
+
+        self.assertEqual(game.statistic.profile.matches, 7)
+        self.assertGreater(game.statistic.profile.game_ns, 0)
+        self.assertIs(Board.match, match)
+
+    def test_game_play_without_profile(self):
+        game = Game(seed=1, shard_size=3, profile=False)
+
+        game.play(number_of_runs=3)
+
+        self.assertIsNone(game.statistic.profile)
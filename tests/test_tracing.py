@@ -0,0 +1,50 @@
+import unittest
+
+from monopoly import tracing
+from monopoly.domain.board import Board
+from monopoly.domain.estate import Estate
+from monopoly.domain.player import PlayerFactory
+from monopoly.domain.player.strategy import IMPULSIVE
+
+
+class TracingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.enabled = tracing.ENABLED
+        self.player = PlayerFactory.create(_id=1, behavior=IMPULSIVE)
+
+    def tearDown(self) -> None:
+        tracing.enable(self.enabled)
+
+    def test_move_spaces_is_traced_when_enabled(self):
+        tracing.enable()
+
+        with self.assertLogs("monopoly.domain.player", level="INFO") as logs:
+            self.player.move_spaces(spaces=3)
+
+        self.assertEqual(
+            logs.records[0].getMessage(),
+            "\tPlayer(id=1) moved (3) spaces and new position is [3]",
+        )
+
+    def test_purchase_is_traced_when_enabled(self):
+        tracing.enable()
+        board = Board(players=[self.player])
+        estate = Estate(sale_price=100.0, rent_value=20.0)
+
+        with self.assertLogs("monopoly.domain.board", level="INFO") as logs:
+            board.purchase(player=self.player, estate=estate)
+
+        self.assertEqual(
+            logs.records[0].getMessage(),
+            "\tPlayer(id=1) purchase Estate(100.00, 20.00). New Balance = +200.00",
+        )
+
+    def test_nothing_is_logged_when_disabled(self):
+        tracing.enable(False)
+        board = Board(players=[self.player])
+        estate = Estate(sale_price=100.0, rent_value=20.0)
+
+        with self.assertNoLogs("monopoly.domain", level="DEBUG"):
+            self.player.move_spaces(spaces=25)
+            board.purchase(player=self.player, estate=estate)
+            board.roll_dice()